@@ -15,7 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.core.auth import get_current_user
 from app.models.user import User
-from app.services.email_service import EmailService
+from app.services.email_service import email_service
 from app.services.pdf_service import PDFService
 from app.services.supabase_service import SupabaseService
 
@@ -66,8 +66,6 @@ async def send_email(
     Send a general email with optional PDF attachment.
     """
     try:
-        email_service = EmailService()
-        
         # Prepare email data
         email_data = {
             "to_email": email_request.recipient_email,
@@ -128,7 +126,6 @@ async def send_raise_letter_email(
     Send a raise letter via email with PDF attachment.
     """
     try:
-        email_service = EmailService()
         supabase_service = SupabaseService()
         
         # Get the raise letter
@@ -221,8 +218,6 @@ async def get_email_status(
     Get the status of a sent email.
     """
     try:
-        email_service = EmailService()
-        
         # Get email status
         status_data = await email_service.get_email_status(email_id)
         
@@ -291,8 +286,6 @@ async def send_test_email(
     Send a test email to verify email service functionality.
     """
     try:
-        email_service = EmailService()
-        
         # Prepare test email
         email_data = {
             "to_email": recipient_email,
@@ -4,6 +4,7 @@ Auth0 JWT validation with Redis caching and performance monitoring for FastAPI
 import json
 import httpx
 import redis
+import redis.asyncio
 import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
@@ -59,6 +60,18 @@ def get_redis_client() -> redis.Redis:
         socket_connect_timeout=5
     )
 
+@lru_cache()
+def get_async_redis_client() -> redis.asyncio.Redis:
+    """Get shared asyncio Redis client for use from async code paths"""
+    return redis.asyncio.Redis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        password=getattr(settings, 'REDIS_PASSWORD', None),
+        db=0,
+        decode_responses=True,
+        socket_connect_timeout=5
+    )
+
 async def verify_token(token: str) -> Auth0User:
     """Verify JWT token with Auth0 JWKS validation and performance monitoring"""
     start_time = time.time()
@@ -101,6 +101,7 @@ class Settings(BaseSettings):
     # External APIs
     BLS_API_KEY: Optional[str] = None
     BLS_BASE_URL: str = "https://api.bls.gov/publicAPI/v2"
+    CPI_MIN_JOB_INTERVAL_SECONDS: int = 60  # Shortest allowed interval for custom CPI fetch jobs
     
     CAREERONESTOP_USER_ID: Optional[str] = None
     CAREERONESTOP_AUTHORIZATION_TOKEN: Optional[str] = None
@@ -136,6 +137,8 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: Optional[str] = None
     EMAILS_FROM_EMAIL: Optional[EmailStr] = None
     EMAILS_FROM_NAME: Optional[str] = None
+    SMTP_CONCURRENCY: int = 5
+    PDF_WORKERS: int = 2  # PDF render processes per API worker process
     
     # File Upload Configuration
     MAX_FILE_SIZE: int = 5 * 1024 * 1024  # 5MB
@@ -32,16 +32,28 @@ class Base(DeclarativeBase):
     pass
 
 
+database_url = str(settings.SQLALCHEMY_DATABASE_URI)
+
+# Pool sizing applies to server databases; SQLite keeps SQLAlchemy's default pool
+if database_url.startswith("sqlite"):
+    pool_options = {}
+else:
+    pool_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
 # Create synchronous engine (for compatibility with existing code)
 engine = create_engine(
-    str(settings.SQLALCHEMY_DATABASE_URI),
+    database_url,
     echo=settings.DEBUG,
     pool_pre_ping=True,
+    **pool_options,
 )
 
 # Create asynchronous engine (for new async operations)
 # Use aiosqlite for SQLite async support
-database_url = str(settings.SQLALCHEMY_DATABASE_URI)
 if database_url.startswith("sqlite"):
     async_database_url = database_url.replace("sqlite:///", "sqlite+aiosqlite:///")
 else:
@@ -51,6 +63,7 @@ async_engine = create_async_engine(
     async_database_url,
     echo=settings.DEBUG,
     pool_pre_ping=True,
+    **pool_options,
 )
 
 # Create session factories
@@ -6,7 +6,12 @@ Provides comprehensive logging with correlation IDs, user context, and metrics i
 import sys
 import uuid
 import time
+import atexit
+import json
+import queue
 import logging
+import logging.handlers
+import orjson
 import structlog
 from typing import Dict, Any, Optional
 from contextvars import ContextVar
@@ -61,6 +66,48 @@ class PerformanceProcessor:
         
         return event_dict
 
+# Background listener that writes queued log lines to stderr
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+def _create_queue_logger() -> logging.Logger:
+    """
+    Create the stdlib logger that structlog writes rendered lines to
+    
+    The logger only enqueues records; a QueueListener thread writes them
+    to stderr so callers never block on the stream.
+    """
+    global _log_listener
+    
+    if _log_listener is not None:
+        atexit.unregister(_log_listener.stop)
+        _log_listener.stop()
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    
+    queue_logger = logging.getLogger("wagelift.structlog")
+    queue_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    queue_logger.setLevel(logging.DEBUG)  # Level filtering happens in structlog
+    queue_logger.propagate = False
+    return queue_logger
+
+def _orjson_dumps(event_dict: Dict[str, Any], **kwargs) -> str:
+    """
+    Serialize a log event with orjson for structlog's JSONRenderer
+    
+    Non-str dict keys are stringified like the stdlib encoder does; anything
+    else orjson rejects (e.g. ints wider than 64 bits) falls back to json.dumps
+    so a log call never raises.
+    """
+    try:
+        return orjson.dumps(event_dict, option=orjson.OPT_NON_STR_KEYS, **kwargs).decode()
+    except TypeError:
+        return json.dumps(event_dict, **kwargs)
+
 def setup_structured_logging(log_level: str = "INFO") -> None:
     """
     Configure structured logging with enhanced processors
@@ -84,18 +131,19 @@ def setup_structured_logging(log_level: str = "INFO") -> None:
         structlog.dev.set_exc_info,
         structlog.processors.TimeStamper(fmt="iso"),
         
-        # Final JSON rendering
-        structlog.processors.JSONRenderer()
+        # Final JSON rendering, encoded by orjson
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps)
     ]
     
     # Configure structlog
+    queue_logger = _create_queue_logger()
     structlog.configure(
         processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(
             getattr(logging, log_level.upper())
         ),
         context_class=dict,
-        logger_factory=structlog.WriteLoggerFactory(file=sys.stderr),
+        logger_factory=lambda *args: queue_logger,
         cache_logger_on_first_use=True,
     )
 
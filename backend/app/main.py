@@ -5,7 +5,10 @@ This module sets up the FastAPI application with all middleware,
 security configurations, and API routes.
 """
 
+import asyncio
+import multiprocessing
 import time
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -26,6 +29,8 @@ from app.core.config import settings
 from app.core.database import engine, async_engine
 from app.core.logging import setup_structured_logging, get_logger, RequestContext
 from app.core.metrics import metrics_collector
+from app.services.cpi_calculator import cpi_calculator
+from app.services.email_service import email_service
 
 # Metrics
 REQUEST_COUNT = Counter(
@@ -55,6 +60,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     logger.info("Starting WageLift API", version=settings.PROJECT_VERSION)
     
+    # SMTP, BLS and database I/O all run on this loop; production expects uvloop
+    loop_module = type(asyncio.get_running_loop()).__module__
+    if settings.ENVIRONMENT == "production" and not loop_module.startswith("uvloop"):
+        logger.warning("Not running on uvloop", event_loop=loop_module)
+    
     # Initialize database
     try:
         # Test database connection
@@ -68,10 +78,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize external services
     # TODO: Add health checks for external APIs (Auth0, BLS, etc.)
     
+    # Render letter PDFs in worker processes so they don't block the event loop
+    # Each API worker gets its own pool, so keep it small rather than per-CPU
+    pdf_executor = ProcessPoolExecutor(
+        max_workers=settings.PDF_WORKERS,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+    email_service.pdf_executor = pdf_executor
+    
     yield
     
     # Shutdown
     logger.info("Shutting down WageLift API")
+    cpi_calculator.flush_metrics()
+    await email_service.aclose()
+    email_service.pdf_executor = None
+    pdf_executor.shutdown(wait=False, cancel_futures=True)
     await async_engine.dispose()
 
 
@@ -255,6 +277,7 @@ if __name__ == "__main__":
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.DEBUG,
+        loop="uvloop",
         log_level=settings.LOG_LEVEL.lower(),
         access_log=settings.DEBUG,
     ) 
\ No newline at end of file
@@ -9,13 +9,16 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import CheckConstraint, Date, DateTime, Numeric, String, Text
+from sqlalchemy import CheckConstraint, Date, DateTime, Numeric, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from app.core.database import Base
 
+# Columns identifying one benchmark snapshot; used for ON CONFLICT upserts
+BENCHMARK_UNIQUE_KEY = ("job_title", "location", "source", "effective_date")
+
 
 class Benchmark(Base):
     """
@@ -233,6 +236,10 @@ class Benchmark(Base):
 
     # Table constraints
     __table_args__ = (
+        UniqueConstraint(
+            *BENCHMARK_UNIQUE_KEY,
+            name="uq_benchmark_title_location_source_date"
+        ),
         CheckConstraint(
             "base_salary_min > 0",
             name="check_positive_base_salary_min"
@@ -9,13 +9,16 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import CheckConstraint, Date, DateTime, Integer, Numeric, String, UniqueConstraint
+from sqlalchemy import CheckConstraint, Date, DateTime, Index, Integer, Numeric, String, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from app.core.database import Base
 
+# Natural key for a CPI observation; used as the upsert conflict target
+CPI_DATA_UNIQUE_KEY = ("year", "month", "region", "series_id")
+
 
 class CPIData(Base):
     """
@@ -163,7 +166,7 @@ class CPIData(Base):
     # Table constraints
     __table_args__ = (
         UniqueConstraint(
-            "year", "month", "region", "series_id",
+            *CPI_DATA_UNIQUE_KEY,
             name="unique_cpi_period_region_series"
         ),
         CheckConstraint(
@@ -198,6 +201,16 @@ class CPIData(Base):
             "annual_inflation_rate IS NULL OR annual_inflation_rate >= -1.0",
             name="check_reasonable_annual_inflation"
         ),
+        Index(
+            "idx_cpi_series_refdate_value",
+            "series_id", "reference_date",
+            postgresql_include=["cpi_value"]
+        ),
+        Index(
+            "idx_cpi_series_ym",
+            "series_id", text("year DESC"), text("month DESC"),
+            postgresql_include=["cpi_value", "annual_inflation_rate"]
+        ),
     )
 
     def __repr__(self) -> str:
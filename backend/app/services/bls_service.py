@@ -5,11 +5,13 @@ This service handles fetching Consumer Price Index data from the BLS Public Data
 specifically the CUSR0000SA0 series (All Urban Consumers - All Items).
 """
 
+import asyncio
 import requests
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any
 from dataclasses import dataclass, field
 import logging
+import threading
 import time
 from functools import wraps
 
@@ -71,6 +73,8 @@ class BLSService:
     BASE_URL = "https://api.bls.gov/publicAPI/v2/timeseries/data"
     CPI_SERIES_ID = "CUSR0000SA0"  # All Urban Consumers - All Items
     RATE_LIMIT_DELAY = 2.5  # Seconds between requests (25 requests per 10 seconds)
+    MAX_YEARS_PER_REQUEST = 10  # BLS limit for unregistered requests (20 with a key)
+    MAX_CONCURRENT_REQUESTS = 4
     
     def __init__(self, registration_key: Optional[str] = None):
         """
@@ -87,18 +91,28 @@ class BLSService:
             'Content-Type': 'application/json'
         })
         self.last_request_time = 0
+        self._rate_limit_lock = threading.Lock()
+    
+    def close(self):
+        """
+        Release the pooled keep-alive connections of the shared HTTP session.
+        
+        The session stays usable; later requests open new connections.
+        """
+        self.session.close()
     
     def _respect_rate_limit(self):
         """Ensure we don't exceed rate limits."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.RATE_LIMIT_DELAY:
-            sleep_time = self.RATE_LIMIT_DELAY - time_since_last
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        with self._rate_limit_lock:
+            current_time = time.time()
+            time_since_last = current_time - self.last_request_time
+            
+            if time_since_last < self.RATE_LIMIT_DELAY:
+                sleep_time = self.RATE_LIMIT_DELAY - time_since_last
+                logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
+                time.sleep(sleep_time)
+            
+            self.last_request_time = time.time()
     
     @rate_limit_retry(max_retries=3, base_delay=2)
     def fetch_cpi_data(
@@ -266,6 +280,42 @@ class BLSService:
         raw_data = self.fetch_cpi_data(start_year=start_year, end_year=end_year)
         return self.process_cpi_data(raw_data)
     
+    async def get_cpi_range_async(self, start_year: int, end_year: int) -> List[CPIDataPoint]:
+        """
+        Get CPI data for a year range, fetching per-request year spans concurrently.
+        
+        Ranges longer than MAX_YEARS_PER_REQUEST are split into spans that are
+        fetched in worker threads, at most MAX_CONCURRENT_REQUESTS at a time.
+        Request starts are still spaced by the shared rate limiter.
+        
+        Args:
+            start_year: Starting year
+            end_year: Ending year
+            
+        Returns:
+            List of CPIDataPoint objects in date order
+        """
+        spans = [
+            (span_start, min(span_start + self.registration_year_limit - 1, end_year))
+            for span_start in range(start_year, end_year + 1, self.registration_year_limit)
+        ]
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        
+        async def fetch_span(span_start: int, span_end: int) -> List[CPIDataPoint]:
+            async with semaphore:
+                return await asyncio.to_thread(self.get_cpi_range, span_start, span_end)
+        
+        results = await asyncio.gather(*(fetch_span(*span) for span in spans))
+        
+        data_points = [data_point for span_points in results for data_point in span_points]
+        data_points.sort(key=lambda x: x.date)
+        return data_points
+    
+    @property
+    def registration_year_limit(self) -> int:
+        """Years the BLS API returns per request for this registration."""
+        return self.MAX_YEARS_PER_REQUEST * 2 if self.registration_key else self.MAX_YEARS_PER_REQUEST
+    
     def calculate_inflation_rate(
         self, 
         start_date: datetime, 
@@ -9,28 +9,181 @@ Bureau of Labor Statistics (BLS) and other authoritative sources.
 """
 
 import asyncio
+import bisect
+import hashlib
 import logging
+import statistics
+import time
+from contextlib import asynccontextmanager
 from datetime import date, datetime, timedelta
-from decimal import Decimal
-from typing import Dict, List, Optional, Any
+from decimal import Decimal, InvalidOperation
+from typing import AsyncIterator, Dict, List, Optional, Any, Set, Tuple
 import aiohttp
-import backoff
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
+from sqlalchemy import ColumnElement, select, update, and_, func, true
+from sqlalchemy.dialects.postgresql import array, insert as pg_insert
 from sqlalchemy.orm import selectinload
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_random_exponential,
+)
 
+from app.core.auth import get_async_redis_client
 from app.core.config import settings
-from app.models.benchmark import Benchmark
+from app.models.benchmark import BENCHMARK_UNIQUE_KEY, Benchmark
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Salary percentiles reported by benchmark comparisons
+PERCENTILE_POINTS = (10, 25, 50, 75, 90)
+
+# Redis cache for aggregated percentiles; benchmark data changes at most daily.
+# Keys embed a generation counter so invalidation is a single INCR; entries
+# from older generations are never read again and expire with their TTL.
+PERCENTILE_CACHE_PREFIX = "benchmark:percentiles:"
+PERCENTILE_CACHE_VERSION_KEY = f"{PERCENTILE_CACHE_PREFIX}version"
+PERCENTILE_CACHE_TTL_SECONDS = 3600
+
+# Market position labels; a rank at or above each threshold moves up one label
+_MARKET_POSITION_THRESHOLDS = (25, 50, 75, 90)
+_MARKET_POSITIONS = (
+    'Bottom 25% - Significant Gap',
+    'Below Median - Consider Raise',
+    'Above Median - Good',
+    'Top 25% - Above Market',
+    'Top 10% - Excellent',
+)
+
 
 class CareerOneStopAPIError(Exception):
     """Custom exception for CareerOneStop API errors."""
     pass
 
 
+class CareerOneStopNetworkError(CareerOneStopAPIError):
+    """Transient network failure talking to the CareerOneStop API; retried."""
+    pass
+
+
+class AdaptiveRateLimiter:
+    """
+    AIMD concurrency limiter for outbound API requests.
+    
+    The number of concurrent requests grows additively after successful
+    responses and is halved on 429/5xx responses. Retry-After and
+    X-RateLimit-* response headers pause new requests before the quota
+    is exhausted instead of waiting for the API to reject them.
+    """
+    
+    def __init__(
+        self,
+        min_concurrency: int = 1,
+        max_concurrency: int = 10,
+        initial_concurrency: int = 4,
+        remaining_threshold: float = 0.1,
+        max_pause_seconds: float = 60.0
+    ):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            min_concurrency: Lower bound on concurrent requests
+            max_concurrency: Upper bound on concurrent requests
+            initial_concurrency: Starting number of concurrent requests
+            remaining_threshold: Pause when the remaining quota falls below this fraction
+            max_pause_seconds: Upper bound on any single pause
+        """
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.concurrency = float(initial_concurrency)
+        self.remaining_threshold = remaining_threshold
+        self.max_pause_seconds = max_pause_seconds
+        
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+    
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one request slot for the duration of the block."""
+        condition = self._get_condition()
+        
+        async with condition:
+            while self._in_flight >= int(self.concurrency):
+                await condition.wait()
+            self._in_flight += 1
+        
+        try:
+            delay = self._paused_until - time.monotonic()
+            if delay > 0:
+                logger.info(f"Rate limit pause: waiting {delay:.1f}s before next request")
+                await asyncio.sleep(delay)
+            yield
+        finally:
+            async with condition:
+                self._in_flight -= 1
+                condition.notify_all()
+    
+    def record_response(self, status: int, headers: Any) -> None:
+        """
+        Update concurrency and pause state from an API response.
+        
+        Args:
+            status: HTTP status code
+            headers: Response headers mapping
+        """
+        if status == 429 or status >= 500:
+            self.record_failure()
+        elif status < 400:
+            self.concurrency = min(float(self.max_concurrency), self.concurrency + 0.5)
+        
+        retry_after = self._parse_seconds(headers.get('Retry-After'))
+        if retry_after is not None:
+            self._pause(retry_after)
+            return
+        
+        remaining = self._parse_seconds(headers.get('X-RateLimit-Remaining'))
+        limit = self._parse_seconds(headers.get('X-RateLimit-Limit'))
+        if remaining is not None and limit and remaining < limit * self.remaining_threshold:
+            reset = self._parse_seconds(headers.get('X-RateLimit-Reset'))
+            if reset is not None:
+                # Some APIs send an epoch timestamp rather than a delay
+                if reset > 1_000_000_000:
+                    reset -= time.time()
+                self._pause(reset)
+    
+    def record_failure(self) -> None:
+        """Halve concurrency after a throttled or failed request."""
+        self.concurrency = max(float(self.min_concurrency), self.concurrency * 0.5)
+        logger.warning(f"Rate limiter backing off: concurrency={self.concurrency:.1f}")
+    
+    def _pause(self, seconds: float) -> None:
+        """Hold new requests for up to max_pause_seconds."""
+        seconds = min(max(seconds, 0.0), self.max_pause_seconds)
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+    
+    def _get_condition(self) -> asyncio.Condition:
+        """Create the condition lazily so it binds to the running event loop."""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+    
+    @staticmethod
+    def _parse_seconds(value: Optional[str]) -> Optional[float]:
+        """Parse a numeric header value, ignoring malformed input."""
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+
 class CareerOneStopService:
     """
     Service for interacting with CareerOneStop API.
@@ -41,6 +194,24 @@ class CareerOneStopService:
     
     BASE_URL = "https://api.careeronestop.org/v1"
     
+    # BLS wage data is published annually, so responses can be reused across
+    # service instances for a day.
+    CACHE_TTL = timedelta(hours=24)
+    _response_cache: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Tuple[datetime, Dict[str, Any]]] = {}
+    
+    # ETag/Last-Modified validators are kept in Redis so responses can be
+    # revalidated with a 304 after the in-process cache expires
+    VALIDATOR_TTL = timedelta(days=30)
+    
+    # Bytes of an error response body included in exception messages
+    ERROR_BODY_LIMIT = 512
+    
+    # Rows fetched per server-side cursor round trip when refreshing
+    REFRESH_BATCH_SIZE = 100
+    
+    # Shared so every service instance draws from the same API quota
+    rate_limiter = AdaptiveRateLimiter()
+    
     def __init__(self, api_key: Optional[str] = None, user_id: Optional[str] = None):
         """
         Initialize CareerOneStop service.
@@ -61,6 +232,7 @@ class CareerOneStopService:
         """Async context manager entry."""
         self.session = aiohttp.ClientSession(
             timeout=aiohttp.ClientTimeout(total=30),
+            json_serialize=lambda obj: orjson.dumps(obj).decode(),
             headers={
                 'Authorization': f'Bearer {self.api_key}',
                 'User-Agent': 'WageLift/1.0',
@@ -74,11 +246,15 @@ class CareerOneStopService:
         if self.session:
             await self.session.close()
     
-    @backoff.on_exception(
-        backoff.expo,
-        (aiohttp.ClientError, asyncio.TimeoutError),
-        max_tries=3,
-        max_time=60
+    # Retries cover transient network failures only; throttling is handled
+    # by the shared AIMD rate limiter. Full jitter keeps workers that fail
+    # together from retrying in lockstep.
+    @retry(
+        wait=wait_random_exponential(multiplier=0.5, max=30),
+        stop=stop_after_attempt(3) | stop_after_delay(60),
+        retry=retry_if_exception_type((CareerOneStopNetworkError, asyncio.TimeoutError)),
+        before_sleep=lambda retry_state: retry_state.args[0].rate_limiter.record_failure(),
+        reraise=True
     )
     async def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -97,26 +273,124 @@ class CareerOneStopService:
         if not self.session:
             raise CareerOneStopAPIError("Service not initialized. Use async context manager.")
         
+        cache_key = (endpoint, tuple(sorted(params.items())))
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            logger.debug(f"CareerOneStop cache hit: {endpoint}")
+            return cached
+        
         url = f"{self.BASE_URL}/{endpoint}"
         
+        # Revalidate a previously seen response instead of re-downloading it
+        validators_key = self._validators_key(cache_key)
+        validators = await self._get_http_validators(validators_key)
+        headers = {}
+        if validators:
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+        
         try:
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
+            async with self.rate_limiter.slot(), self.session.get(url, params=params, headers=headers) as response:
+                self.rate_limiter.record_response(response.status, response.headers)
+                
+                if response.status == 304 and validators:
+                    data = orjson.loads(validators['body'])
+                    logger.info(f"CareerOneStop API response not modified: {endpoint}")
+                    self._cache_response(cache_key, data)
+                    return data
+                elif response.status == 200:
+                    raw = await response.read()
+                    data = orjson.loads(raw)
                     logger.info(f"CareerOneStop API request successful: {endpoint}")
+                    self._cache_response(cache_key, data)
+                    await self._store_http_validators(validators_key, response.headers, raw)
                     return data
                 elif response.status == 401:
                     raise CareerOneStopAPIError("Invalid API credentials")
                 elif response.status == 429:
                     raise CareerOneStopAPIError("Rate limit exceeded")
                 else:
-                    error_text = await response.text()
+                    # Only the start of an error body is useful in the message
+                    error_body = await response.content.read(self.ERROR_BODY_LIMIT)
+                    error_text = error_body.decode(errors='replace')
                     raise CareerOneStopAPIError(
                         f"API request failed with status {response.status}: {error_text}"
                     )
         except aiohttp.ClientError as e:
             logger.error(f"CareerOneStop API request failed: {e}")
-            raise CareerOneStopAPIError(f"Network error: {e}")
+            raise CareerOneStopNetworkError(f"Network error: {e}") from e
+    
+    def _get_cached_response(
+        self,
+        cache_key: Tuple[str, Tuple[Tuple[str, Any], ...]]
+    ) -> Optional[Dict[str, Any]]:
+        """Return a cached response if it is still within the TTL."""
+        entry = self._response_cache.get(cache_key)
+        if entry is None:
+            return None
+        
+        cached_at, data = entry
+        if datetime.now() - cached_at >= self.CACHE_TTL:
+            del self._response_cache[cache_key]
+            return None
+        
+        return data
+    
+    def _cache_response(
+        self,
+        cache_key: Tuple[str, Tuple[Tuple[str, Any], ...]],
+        data: Dict[str, Any]
+    ) -> None:
+        """Store a response, evicting the oldest entry when the cache is full."""
+        if cache_key not in self._response_cache and len(self._response_cache) >= settings.CACHE_MAX_SIZE:
+            oldest_key = next(iter(self._response_cache))
+            del self._response_cache[oldest_key]
+        
+        self._response_cache[cache_key] = (datetime.now(), data)
+    
+    @staticmethod
+    def _validators_key(cache_key: Tuple[str, Tuple[Tuple[str, Any], ...]]) -> str:
+        """Build the Redis key holding HTTP validators for a request."""
+        digest = hashlib.sha1(repr(cache_key).encode()).hexdigest()
+        return f"careeronestop:http:{digest}"
+    
+    async def _get_http_validators(self, validators_key: str) -> Optional[Dict[str, Any]]:
+        """Get stored ETag/Last-Modified validators and body from Redis."""
+        try:
+            cached_data = await get_async_redis_client().get(validators_key)
+            if cached_data:
+                return orjson.loads(cached_data)
+        except Exception as e:
+            logger.warning(f"CareerOneStop validator cache read failed: {e}")
+        
+        return None
+    
+    async def _store_http_validators(self, validators_key: str, headers: Any, body: bytes) -> None:
+        """Store response validators and body in Redis for conditional requests."""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        
+        try:
+            await get_async_redis_client().setex(
+                validators_key,
+                int(self.VALIDATOR_TTL.total_seconds()),
+                orjson.dumps({
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'body': body.decode()
+                })
+            )
+        except Exception as e:
+            logger.warning(f"CareerOneStop validator cache write failed: {e}")
+    
+    @classmethod
+    def clear_cache(cls):
+        """Clear the shared API response cache."""
+        cls._response_cache.clear()
     
     async def search_occupations(self, keyword: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -142,6 +416,42 @@ class CareerOneStopService:
             logger.error(f"Failed to search occupations for '{keyword}': {e}")
             return []
     
+    async def search_occupations_with_wages(
+        self,
+        keyword: str,
+        location: str,
+        radius: int = 25,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for occupations with wage data included for a location.
+        
+        Uses the combined occupation/wages endpoint so matching occupations
+        and their wages arrive in a single request.
+        
+        Args:
+            keyword: Job title or occupation keyword
+            location: Location (ZIP code, city/state, or state)
+            radius: Search radius in miles
+            limit: Maximum number of results
+            
+        Returns:
+            List of occupation data, each with a 'Wages' entry when available
+        """
+        endpoint = f"occupation/{self.user_id}/{keyword}/wages"
+        params = {'location': location, 'radius': radius, 'limit': limit}
+        
+        try:
+            data = await self._make_request(endpoint, params)
+            occupations = data.get('OccupationList', [])
+            
+            logger.info(f"Found {len(occupations)} occupations with wages for keyword: {keyword}")
+            return occupations
+            
+        except CareerOneStopAPIError as e:
+            logger.error(f"Failed to search occupations with wages for '{keyword}': {e}")
+            return []
+    
     async def get_occupation_wages(
         self, 
         onet_code: str, 
@@ -226,8 +536,12 @@ class CareerOneStopService:
             
             if pct and wage:
                 try:
-                    percentiles[f"p{pct}"] = Decimal(str(wage))
-                except (ValueError, TypeError):
+                    # JSON ints and numeric strings convert exactly; only
+                    # floats need a text round-trip to avoid binary noise
+                    percentiles[f"p{pct}"] = (
+                        Decimal(wage) if isinstance(wage, (int, str)) else Decimal(repr(wage))
+                    )
+                except (InvalidOperation, ValueError, TypeError):
                     logger.warning(f"Invalid wage value: {wage} for percentile {pct}")
         
         # Extract location information
@@ -251,16 +565,22 @@ class CareerOneStopService:
         job_title: str,
         location: str,
         db_session: AsyncSession,
-        radius: int = 25
+        radius: int = 25,
+        commit: bool = True
     ) -> List[Benchmark]:
         """
         Fetch salary benchmarks for a job title and location.
         
+        New benchmarks are inserted in one batch and committed once at the
+        end, rather than once per benchmark.
+        
         Args:
             job_title: Job title to search for
             location: Location (ZIP, city/state, or state)
             db_session: Database session
             radius: Search radius in miles
+            commit: Commit the batch; pass False to let the caller commit
+                and invalidate the percentile cache afterwards
             
         Returns:
             List of created benchmark records
@@ -268,56 +588,283 @@ class CareerOneStopService:
         benchmarks = []
         
         try:
-            # Search for matching occupations
-            occupations = await self.search_occupations(job_title, limit=5)
+            parsed_records = await self._fetch_wage_records(job_title, location, radius)
+            benchmarks = await self._store_benchmarks(parsed_records, job_title, db_session)
             
-            if not occupations:
-                logger.warning(f"No occupations found for job title: {job_title}")
-                return benchmarks
+            if benchmarks and commit:
+                await db_session.commit()
+                await invalidate_percentile_cache()
             
-            # Fetch wage data for each occupation
-            for occupation in occupations:
-                onet_code = occupation.get('OnetCode')
-                if not onet_code:
-                    continue
-                
-                # Get wage data
-                wage_data = await self.get_occupation_wages(onet_code, location, radius)
-                if not wage_data:
+            logger.info(f"Created {len(benchmarks)} benchmarks for '{job_title}' in {location}")
+            
+        except Exception as e:
+            logger.error(f"Error fetching salary benchmarks: {e}")
+            if not commit:
+                # Caller owns the transaction
+                raise
+            await db_session.rollback()
+            benchmarks = []
+        
+        return benchmarks
+    
+    async def fetch_salary_benchmarks_many(
+        self,
+        items: List[Tuple[str, str]],
+        db_session: AsyncSession,
+        radius: int = 25,
+        max_workers: int = 10,
+        commit: bool = True
+    ) -> List[List[Benchmark]]:
+        """
+        Fetch salary benchmarks for many job title and location pairs.
+        
+        API calls for all pairs run concurrently, bounded by max_workers and
+        the shared rate limiter. Database work then runs sequentially on the
+        given session, which cannot be shared by concurrent tasks, and is
+        committed once. Each pair is stored under its own savepoint so a
+        pair that fails to store is skipped without losing the others.
+        
+        Args:
+            items: (job_title, location) pairs to fetch
+            db_session: Database session
+            radius: Search radius in miles
+            max_workers: Maximum number of pairs fetched concurrently
+            commit: Commit the batch; pass False to let the caller commit
+                and invalidate the percentile cache afterwards
+            
+        Returns:
+            Created benchmark records for each pair, in input order
+        """
+        semaphore = asyncio.Semaphore(max_workers)
+        
+        async def fetch_records(job_title: str, location: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._fetch_wage_records(job_title, location, radius)
+        
+        results = await asyncio.gather(
+            *(fetch_records(job_title, location) for job_title, location in items),
+            return_exceptions=True
+        )
+        
+        all_benchmarks = []
+        
+        try:
+            for (job_title, location), parsed_records in zip(items, results):
+                if isinstance(parsed_records, Exception):
+                    logger.error(
+                        f"Error fetching salary benchmarks for '{job_title}' in {location}: {parsed_records}"
+                    )
+                    all_benchmarks.append([])
                     continue
                 
-                # Parse and create benchmark
-                parsed_data = self._parse_wage_data(wage_data, onet_code)
-                if parsed_data and parsed_data.get('percentiles'):
-                    benchmark = await self._create_benchmark_from_data(
-                        parsed_data, job_title, db_session
-                    )
-                    if benchmark:
-                        benchmarks.append(benchmark)
+                try:
+                    async with db_session.begin_nested():
+                        benchmarks = await self._store_benchmarks(parsed_records, job_title, db_session)
+                except Exception as e:
+                    logger.error(f"Error storing salary benchmarks for '{job_title}' in {location}: {e}")
+                    benchmarks = []
+                all_benchmarks.append(benchmarks)
             
-            logger.info(f"Created {len(benchmarks)} benchmarks for '{job_title}' in {location}")
+            if commit:
+                await db_session.commit()
+                if any(all_benchmarks):
+                    await invalidate_percentile_cache()
+            
+            logger.info(
+                f"Created {sum(len(b) for b in all_benchmarks)} benchmarks for {len(items)} job/location pairs"
+            )
             
         except Exception as e:
-            logger.error(f"Error fetching salary benchmarks: {e}")
+            logger.error(f"Error storing salary benchmarks: {e}")
+            if not commit:
+                # Caller owns the transaction
+                raise
+            await db_session.rollback()
+            all_benchmarks = [[] for _ in items]
+        
+        return all_benchmarks
+    
+    async def _fetch_wage_records(
+        self,
+        job_title: str,
+        location: str,
+        radius: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch and parse wage data for occupations matching a job title.
+        
+        Occupations and their wages are requested together in one call.
+        Wage requests for any occupations returned without inline wages are
+        issued concurrently.
+        
+        Args:
+            job_title: Job title to search for
+            location: Location (ZIP, city/state, or state)
+            radius: Search radius in miles
+            
+        Returns:
+            Parsed wage data records that include percentiles
+        """
+        # Search for matching occupations with inline wage data
+        occupations = await self.search_occupations_with_wages(job_title, location, radius, limit=5)
+        if not occupations:
+            occupations = await self.search_occupations(job_title, limit=5)
+        
+        if not occupations:
+            logger.warning(f"No occupations found for job title: {job_title}")
+            return []
+        
+        wages_by_code: Dict[str, Dict[str, Any]] = {}
+        missing_codes = []
+        for occupation in occupations:
+            onet_code = occupation.get('OnetCode')
+            if not onet_code:
+                continue
+            if occupation.get('Wages'):
+                wages_by_code[onet_code] = occupation['Wages']
+            else:
+                missing_codes.append(onet_code)
         
+        # Get wage data for occupations without inline wages
+        if missing_codes:
+            wage_results = await asyncio.gather(
+                *(self.get_occupation_wages(onet_code, location, radius) for onet_code in missing_codes)
+            )
+            wages_by_code.update(zip(missing_codes, wage_results))
+        
+        parsed_records = []
+        for onet_code, wage_data in wages_by_code.items():
+            if not wage_data:
+                continue
+            
+            parsed_data = self._parse_wage_data(wage_data, onet_code)
+            if parsed_data and parsed_data.get('percentiles'):
+                parsed_records.append(parsed_data)
+        
+        return parsed_records
+    
+    async def _store_benchmarks(
+        self,
+        parsed_records: List[Dict[str, Any]],
+        job_title: str,
+        db_session: AsyncSession
+    ) -> List[Benchmark]:
+        """
+        Insert benchmarks for parsed wage records that are not already stored.
+        
+        Args:
+            parsed_records: Parsed wage data records
+            job_title: Original job title searched
+            db_session: Database session
+            
+        Returns:
+            Benchmark records that were inserted
+        """
+        if not parsed_records:
+            return []
+        
+        # Look up recent benchmarks for all candidates in one query
+        existing_keys = await self._get_existing_benchmark_keys(
+            parsed_records, db_session
+        )
+        
+        benchmark_rows = []
+        for parsed_data in parsed_records:
+            benchmark_values = self._create_benchmark_from_data(
+                parsed_data, job_title, existing_keys
+            )
+            if benchmark_values:
+                benchmark_rows.append(benchmark_values)
+        
+        if not benchmark_rows:
+            return []
+        
+        return await self._insert_benchmarks(benchmark_rows, db_session)
+    
+    async def _get_existing_benchmark_keys(
+        self,
+        parsed_records: List[Dict[str, Any]],
+        db_session: AsyncSession
+    ) -> Set[Tuple[str, str]]:
+        """
+        Find which parsed records already have a recent benchmark.
+        
+        Args:
+            parsed_records: Parsed wage data records
+            db_session: Database session
+            
+        Returns:
+            Set of (job_title, location) keys with a benchmark from the last 90 days
+        """
+        titles = {record['occupation_title'] for record in parsed_records}
+        locations = {record['location'] for record in parsed_records}
+        
+        result = await db_session.execute(
+            select(Benchmark.job_title, Benchmark.location).where(
+                and_(
+                    Benchmark.job_title.in_(titles),
+                    Benchmark.location.in_(locations),
+                    Benchmark.source == 'careeronestop',
+                    Benchmark.effective_date >= date.today() - timedelta(days=90)
+                )
+            )
+        )
+        
+        return {(row.job_title, row.location) for row in result.all()}
+    
+    async def _insert_benchmarks(
+        self,
+        benchmark_rows: List[Dict[str, Any]],
+        db_session: AsyncSession
+    ) -> List[Benchmark]:
+        """
+        Insert benchmark rows in a single statement.
+        
+        On PostgreSQL this is one INSERT ... ON CONFLICT DO NOTHING RETURNING,
+        so rows inserted concurrently by another worker are skipped rather
+        than raising. Other databases fall back to a batched ORM flush.
+        
+        Args:
+            benchmark_rows: Column values for each new benchmark
+            db_session: Database session
+            
+        Returns:
+            Benchmark records that were actually inserted
+        """
+        if db_session.get_bind().dialect.name == 'postgresql':
+            stmt = (
+                pg_insert(Benchmark)
+                .values(benchmark_rows)
+                .on_conflict_do_nothing(index_elements=BENCHMARK_UNIQUE_KEY)
+                .returning(Benchmark)
+            )
+            result = await db_session.scalars(stmt)
+            return list(result.all())
+        
+        benchmarks = [Benchmark(**row) for row in benchmark_rows]
+        db_session.add_all(benchmarks)
+        await db_session.flush()
         return benchmarks
     
-    async def _create_benchmark_from_data(
+    def _create_benchmark_from_data(
         self,
         parsed_data: Dict[str, Any],
         original_job_title: str,
-        db_session: AsyncSession
-    ) -> Optional[Benchmark]:
+        existing_keys: Set[Tuple[str, str]]
+    ) -> Optional[Dict[str, Any]]:
         """
-        Create a benchmark record from parsed wage data.
+        Build benchmark column values from parsed wage data.
+        
+        The caller is responsible for inserting the row and committing it.
         
         Args:
             parsed_data: Parsed wage data
             original_job_title: Original job title searched
-            db_session: Database session
+            existing_keys: (job_title, location) keys that already have a
+                recent benchmark; updated with the key of the new record
             
         Returns:
-            Created benchmark record or None
+            Column values for a new benchmark or None
         """
         try:
             percentiles = parsed_data.get('percentiles', {})
@@ -334,48 +881,36 @@ class CareerOneStopService:
             median_wage = percentiles.get('p50') or percentiles.get('p10')  # Fallback to available data
             
             # Check if benchmark already exists
-            existing = await db_session.execute(
-                select(Benchmark).where(
-                    and_(
-                        Benchmark.job_title == parsed_data['occupation_title'],
-                        Benchmark.location == parsed_data['location'],
-                        Benchmark.source == 'careeronestop',
-                        Benchmark.effective_date >= date.today() - timedelta(days=90)
-                    )
-                )
-            )
-            
-            if existing.scalar_one_or_none():
+            key = (parsed_data['occupation_title'], parsed_data['location'])
+            if key in existing_keys:
                 logger.info("Benchmark already exists, skipping creation")
                 return None
             
-            # Create new benchmark
-            benchmark = Benchmark(
-                job_title=parsed_data['occupation_title'],
-                location=parsed_data['location'],
-                location_type=parsed_data['location_type'],
-                base_salary_min=min_wage,
-                base_salary_max=max_wage,
-                base_salary_median=median_wage,
-                source='careeronestop',
-                source_url=f"https://www.careeronestop.org/Toolkit/Wages/find-wages.aspx",
-                data_collection_method='api',
-                effective_date=date.today(),
-                sample_size=parsed_data.get('employment_count'),
-                confidence_score=Decimal('0.9'),  # High confidence for government data
-                is_verified=True,
-                is_active=True
-            )
+            # Build new benchmark values
+            benchmark_values = {
+                'job_title': parsed_data['occupation_title'],
+                'location': parsed_data['location'],
+                'location_type': parsed_data['location_type'],
+                'base_salary_min': min_wage,
+                'base_salary_max': max_wage,
+                'base_salary_median': median_wage,
+                'source': 'careeronestop',
+                'source_url': "https://www.careeronestop.org/Toolkit/Wages/find-wages.aspx",
+                'data_collection_method': 'api',
+                'effective_date': date.today(),
+                'sample_size': parsed_data.get('employment_count'),
+                'confidence_score': Decimal('0.9'),  # High confidence for government data
+                'is_verified': True,
+                'is_active': True
+            }
             
-            db_session.add(benchmark)
-            await db_session.commit()
+            existing_keys.add(key)
             
-            logger.info(f"Created benchmark for {parsed_data['occupation_title']} in {parsed_data['location']}")
-            return benchmark
+            logger.info(f"Built benchmark for {parsed_data['occupation_title']} in {parsed_data['location']}")
+            return benchmark_values
             
         except Exception as e:
             logger.error(f"Error creating benchmark: {e}")
-            await db_session.rollback()
             return None
     
     async def refresh_benchmark_data(
@@ -395,39 +930,54 @@ class CareerOneStopService:
         """
         cutoff_date = date.today() - timedelta(days=days_old)
         
-        # Find old benchmarks from CareerOneStop
-        old_benchmarks = await db_session.execute(
-            select(Benchmark).where(
+        # Stream old benchmarks from CareerOneStop in server-side chunks,
+        # grouping their ids by (job_title, location) so each pair is only
+        # fetched from the API once
+        old_benchmarks = await db_session.stream(
+            select(Benchmark.id, Benchmark.job_title, Benchmark.location).where(
                 and_(
                     Benchmark.source == 'careeronestop',
                     Benchmark.effective_date < cutoff_date,
                     Benchmark.is_active == True
                 )
-            )
+            ).execution_options(yield_per=self.REFRESH_BATCH_SIZE)
         )
         
-        refreshed_count = 0
+        refresh_groups: Dict[Tuple[str, str], List[Any]] = {}
+        async for benchmark_id, job_title, location in old_benchmarks:
+            refresh_groups.setdefault((job_title, location), []).append(benchmark_id)
         
-        for benchmark in old_benchmarks.scalars():
-            try:
-                # Mark old benchmark as inactive
-                benchmark.is_active = False
-                
-                # Fetch new data
-                new_benchmarks = await self.fetch_salary_benchmarks(
-                    benchmark.job_title,
-                    benchmark.location,
-                    db_session
+        refreshed_count = 0
+        try:
+            # Mark old benchmarks as inactive
+            for benchmark_ids in refresh_groups.values():
+                await db_session.execute(
+                    update(Benchmark)
+                    .where(Benchmark.id.in_(benchmark_ids))
+                    .values(is_active=False)
                 )
-                
-                if new_benchmarks:
-                    refreshed_count += len(new_benchmarks)
-                    logger.info(f"Refreshed benchmark for {benchmark.job_title}")
-                
-            except Exception as e:
-                logger.error(f"Error refreshing benchmark {benchmark.id}: {e}")
+            
+            # Fetch new data for every pair concurrently
+            new_benchmarks = await self.fetch_salary_benchmarks_many(
+                list(refresh_groups),
+                db_session,
+                commit=False
+            )
+            
+            for (job_title, _), benchmarks in zip(refresh_groups, new_benchmarks):
+                if benchmarks:
+                    refreshed_count += len(benchmarks)
+                    logger.info(f"Refreshed benchmark for {job_title}")
+            
+            await db_session.commit()
+        except Exception as e:
+            logger.error(f"Error refreshing benchmarks: {e}")
+            await db_session.rollback()
+            raise
+        
+        if refresh_groups:
+            await invalidate_percentile_cache()
         
-        await db_session.commit()
         logger.info(f"Refreshed {refreshed_count} benchmarks")
         
         return refreshed_count
@@ -442,6 +992,11 @@ async def get_salary_percentiles(
     """
     Get salary percentiles for a job title and location.
     
+    Results are cached in Redis for an hour and invalidated whenever
+    benchmarks are inserted or deactivated. On PostgreSQL the percentiles
+    are computed server-side with percentile_cont; other databases fall
+    back to aggregating in Python.
+    
     Args:
         job_title: Job title to search for
         location: Location to search in
@@ -450,54 +1005,178 @@ async def get_salary_percentiles(
     Returns:
         Dictionary with percentile data
     """
-    # Query recent benchmarks
-    benchmarks = await db_session.execute(
-        select(Benchmark).where(
-            and_(
-                or_(
-                    Benchmark.job_title.ilike(f"%{job_title}%"),
-                    Benchmark.job_title.contains(job_title)
-                ),
-                or_(
-                    Benchmark.location.ilike(f"%{location}%"),
-                    Benchmark.location.contains(location)
-                ),
-                Benchmark.is_active == True,
-                Benchmark.effective_date >= date.today() - timedelta(days=90)
-            )
-        ).order_by(Benchmark.confidence_score.desc())
-    )
+    cache_key = await _percentile_cache_key(job_title, location)
+    if cache_key is not None:
+        cached_percentiles = await _get_cached_percentiles(cache_key)
+        if cached_percentiles is not None:
+            return cached_percentiles
     
-    benchmark_list = benchmarks.scalars().all()
+    filters = _benchmark_search_filters(job_title, location)
     
-    if not benchmark_list:
-        return {}
+    if db_session.get_bind().dialect.name == 'postgresql':
+        percentiles = await _get_salary_percentiles_sql(filters, db_session)
+    else:
+        percentiles = await _get_salary_percentiles_python(filters, db_session)
+    
+    if percentiles and cache_key is not None:
+        await _cache_percentiles(cache_key, percentiles)
+    
+    return percentiles
+
+
+async def _get_salary_percentiles_python(
+    filters: ColumnElement[bool],
+    db_session: AsyncSession
+) -> Dict[str, Decimal]:
+    """Compute salary percentiles by aggregating benchmark rows in Python."""
+    # Query recent benchmark salary ranges
+    benchmarks = await db_session.execute(
+        select(
+            Benchmark.base_salary_min,
+            Benchmark.base_salary_median,
+            Benchmark.base_salary_max
+        ).where(filters)
+    )
     
     # Calculate aggregate percentiles
     all_salaries = []
-    for benchmark in benchmark_list:
-        if benchmark.base_salary_min and benchmark.base_salary_max:
+    for salary_min, salary_median, salary_max in benchmarks.all():
+        if salary_min and salary_max:
             # Add min, median, max to salary list
-            all_salaries.append(float(benchmark.base_salary_min))
-            if benchmark.base_salary_median:
-                all_salaries.append(float(benchmark.base_salary_median))
-            all_salaries.append(float(benchmark.base_salary_max))
+            all_salaries.append(float(salary_min))
+            if salary_median:
+                all_salaries.append(float(salary_median))
+            all_salaries.append(float(salary_max))
     
     if not all_salaries:
         return {}
     
-    all_salaries.sort()
-    n = len(all_salaries)
+    return _compute_percentiles(all_salaries)
+
+
+async def _percentile_cache_key(job_title: str, location: str) -> Optional[str]:
+    """Build the percentile cache key for the current cache generation."""
+    try:
+        version = await get_async_redis_client().get(PERCENTILE_CACHE_VERSION_KEY) or 0
+    except Exception as e:
+        logger.warning(f"Percentile cache version read failed: {e}")
+        return None
+    
+    return f"{PERCENTILE_CACHE_PREFIX}v{version}:{job_title.strip().lower()}:{location.strip().lower()}"
+
+
+async def _get_cached_percentiles(cache_key: str) -> Optional[Dict[str, Decimal]]:
+    """Get salary percentiles from Redis cache."""
+    try:
+        cached_data = await get_async_redis_client().get(cache_key)
+        if cached_data:
+            return {pct: Decimal(value) for pct, value in orjson.loads(cached_data).items()}
+    except Exception as e:
+        logger.warning(f"Percentile cache read failed: {e}")
     
-    percentiles = {
-        'p10': Decimal(str(all_salaries[int(0.1 * n)])),
-        'p25': Decimal(str(all_salaries[int(0.25 * n)])),
-        'p50': Decimal(str(all_salaries[int(0.5 * n)])),
-        'p75': Decimal(str(all_salaries[int(0.75 * n)])),
-        'p90': Decimal(str(all_salaries[int(0.9 * n)])),
+    return None
+
+
+async def _cache_percentiles(cache_key: str, percentiles: Dict[str, Decimal]) -> None:
+    """Cache salary percentiles in Redis with TTL."""
+    try:
+        await get_async_redis_client().setex(
+            cache_key,
+            PERCENTILE_CACHE_TTL_SECONDS,
+            orjson.dumps({pct: str(value) for pct, value in percentiles.items()})
+        )
+    except Exception as e:
+        logger.warning(f"Percentile cache write failed: {e}")
+
+
+async def invalidate_percentile_cache() -> None:
+    """Drop all cached salary percentiles after benchmark data changes."""
+    try:
+        await get_async_redis_client().incr(PERCENTILE_CACHE_VERSION_KEY)
+    except Exception as e:
+        logger.warning(f"Percentile cache invalidation failed: {e}")
+
+
+async def _get_salary_percentiles_sql(
+    filters: ColumnElement[bool],
+    db_session: AsyncSession
+) -> Dict[str, Decimal]:
+    """
+    Compute salary percentiles in PostgreSQL in a single round trip.
+    
+    Each benchmark contributes its min, median and max salary via a lateral
+    unnest, matching the Python aggregation in get_salary_percentiles.
+    """
+    salaries = (
+        func.unnest(array([
+            Benchmark.base_salary_min,
+            Benchmark.base_salary_median,
+            Benchmark.base_salary_max
+        ]))
+        .table_valued("salary")
+        .render_derived(name="salaries")
+        .lateral()
+    )
+    fractions = array([point / 100 for point in PERCENTILE_POINTS])
+    
+    values = await db_session.scalar(
+        select(func.percentile_cont(fractions).within_group(salaries.c.salary))
+        .select_from(Benchmark)
+        .join(salaries, true())
+        .where(filters, salaries.c.salary.isnot(None))
+    )
+    
+    if not values:
+        return {}
+    
+    return {
+        f"p{point}": _to_currency(value)
+        for point, value in zip(PERCENTILE_POINTS, values)
     }
+
+
+def _benchmark_search_filters(job_title: str, location: str) -> ColumnElement[bool]:
+    """
+    Build the filter for recent active benchmarks matching a title and location.
     
-    return percentiles
+    Substring matches use a single ILIKE per column so PostgreSQL can serve
+    them from the pg_trgm GIN indexes (migration 004).
+    """
+    return and_(
+        Benchmark.job_title.ilike(f"%{job_title}%"),
+        Benchmark.location.ilike(f"%{location}%"),
+        Benchmark.is_active == True,
+        Benchmark.effective_date >= date.today() - timedelta(days=90)
+    )
+
+
+def _compute_percentiles(salaries: List[float]) -> Dict[str, Decimal]:
+    """
+    Compute linearly interpolated salary percentiles.
+    
+    Uses the same interpolation as NumPy's default percentile method, so
+    small samples no longer snap to the nearest rank.
+    
+    Args:
+        salaries: Salary values in any order
+        
+    Returns:
+        Dictionary mapping 'p10'..'p90' to salary values
+    """
+    if len(salaries) == 1:
+        cut_points = salaries * 99
+    else:
+        cut_points = statistics.quantiles(salaries, n=100, method='inclusive')
+    
+    return {
+        f"p{point}": _to_currency(cut_points[point - 1])
+        for point in PERCENTILE_POINTS
+    }
+
+
+def _to_currency(value: float) -> Decimal:
+    """Convert a float salary to a cent-precision Decimal without formatting it as text."""
+    return Decimal(round(value * 100)).scaleb(-2)
 
 
 async def compare_salary_to_market(
@@ -527,20 +1206,17 @@ async def compare_salary_to_market(
             'comparison': {}
         }
     
-    # Determine where current salary falls
-    comparison = {}
-    for pct, value in percentiles.items():
-        if current_salary >= value:
-            comparison[pct] = 'above'
-        else:
-            comparison[pct] = 'below'
-    
-    # Calculate percentile rank
+    # Percentile values increase from p10 to p90, so bisecting the ordered
+    # values gives both the comparison and the rank without re-sorting
     salary_values = list(percentiles.values())
-    salary_values.append(current_salary)
-    salary_values.sort()
+    at_or_below = bisect.bisect_right(salary_values, current_salary)
+    comparison = {
+        pct: 'above' if index < at_or_below else 'below'
+        for index, pct in enumerate(percentiles)
+    }
     
-    rank = salary_values.index(current_salary) / len(salary_values)
+    # Calculate percentile rank
+    rank = bisect.bisect_left(salary_values, current_salary) / (len(salary_values) + 1)
     percentile_rank = round(rank * 100, 1)
     
     return {
@@ -553,13 +1229,4 @@ async def compare_salary_to_market(
 
 def _get_market_position(percentile_rank: float) -> str:
     """Get market position description."""
-    if percentile_rank >= 90:
-        return 'Top 10% - Excellent'
-    elif percentile_rank >= 75:
-        return 'Top 25% - Above Market'
-    elif percentile_rank >= 50:
-        return 'Above Median - Good'
-    elif percentile_rank >= 25:
-        return 'Below Median - Consider Raise'
-    else:
-        return 'Bottom 25% - Significant Gap' 
\ No newline at end of file
+    return _MARKET_POSITIONS[bisect.bisect_right(_MARKET_POSITION_THRESHOLDS, percentile_rank)] 
\ No newline at end of file
@@ -4,14 +4,17 @@ Implements inflation adjustment logic and salary gap calculations.
 """
 
 import logging
+import time
+import weakref
+from bisect import bisect_right
+from collections import OrderedDict
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
-from decimal import Decimal, ROUND_HALF_UP
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Any, Union
+from dataclasses import asdict, dataclass
 from enum import Enum
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, desc
+from sqlalchemy import Float, select, and_, func
 from pydantic import BaseModel, Field, validator
 
 # Internal imports
@@ -24,6 +27,58 @@ from ..core.metrics import (
 )
 from ..core.logging import log_business_event, log_api_event
 from ..models.cpi_data import CPIData  # Assuming this exists from Task 4
+from .bls_service import BLSService
+
+
+# BLS series the calculator reads; cpi_data may hold other series too
+CPI_SERIES_ID = BLSService.CPI_SERIES_ID
+
+# Raw queries for the asyncpg fast path
+# cpi_value is cast to float8 so asyncpg decodes it to float rather than Decimal
+EXACT_CPI_SQL = (
+    "SELECT cpi_value::float8 FROM cpi_data "
+    "WHERE reference_date = $1 AND series_id = $2"
+)
+BATCH_CPI_SQL = (
+    "SELECT reference_date, cpi_value::float8 FROM cpi_data "
+    "WHERE reference_date = ANY($1::date[]) AND series_id = $2"
+)
+
+
+def _round_cents(value: float) -> float:
+    """Round half away from zero to 2 decimal places."""
+    return int(value * 100.0 + (0.5 if value >= 0 else -0.5)) / 100.0
+
+
+def _round_tenths(value: float) -> float:
+    """Round half away from zero to 1 decimal place."""
+    return int(value * 10.0 + (0.5 if value >= 0 else -0.5)) / 10.0
+
+
+def _adjust_salary(
+    original_salary: float,
+    current_salary: float,
+    historical_cpi: float,
+    current_cpi: float
+) -> Tuple[float, float, float, float]:
+    """
+    Inflation adjustment kernel shared by single and bulk calculations.
+
+    Returns:
+        (adjusted_salary, dollar_gap, percentage_gap, inflation_rate), rounded
+    """
+    # Formula: Adjusted = Original × (Current CPI / Historical CPI)
+    adjusted = original_salary * (current_cpi / historical_cpi)
+    dollar_gap = adjusted - current_salary
+    percentage_gap = dollar_gap / current_salary * 100.0
+    inflation_rate = (current_cpi - historical_cpi) / historical_cpi * 100.0
+
+    return (
+        _round_cents(adjusted),
+        _round_cents(dollar_gap),
+        _round_tenths(percentage_gap),
+        _round_tenths(inflation_rate)
+    )
 
 
 # Calculation result models
@@ -79,6 +134,38 @@ class CPICalculationRequest(BaseModel):
             raise ValueError("Current date must be after historical date")
         return v
 
+    def to_params(self) -> "CPICalculationParams":
+        """Convert to lightweight parameters for internal bulk paths."""
+        return CPICalculationParams(
+            original_salary=self.original_salary,
+            current_salary=self.current_salary,
+            historical_date=self.historical_date,
+            current_date=self.current_date,
+            calculation_method=self.calculation_method,
+            user_id=self.user_id
+        )
+
+
+@dataclass
+class CPICalculationParams:
+    """
+    Unvalidated calculation parameters for trusted internal callers.
+    Mirrors CPICalculationRequest without running pydantic validation.
+    """
+    original_salary: float
+    current_salary: float
+    historical_date: date
+    current_date: date
+    calculation_method: CalculationMethod = CalculationMethod.NEAREST_DATE
+    user_id: Optional[str] = None
+
+    def dict(self) -> Dict[str, Any]:
+        """Match the CPICalculationRequest.dict() interface."""
+        return asdict(self)
+
+
+CPICalculationInput = Union[CPICalculationRequest, CPICalculationParams]
+
 
 class CPICalculationError(Exception):
     """Custom exception for CPI calculation errors."""
@@ -96,16 +183,37 @@ class CPICalculatorService:
     Provides enterprise-grade calculation capabilities with comprehensive error handling.
     """
 
+    CPI_CACHE_MAX_SIZE = 4096
+    SUMMARY_CACHE_MAX_SIZE = 256
+    METRICS_FLUSH_INTERVAL = 100  # Calculations between metric flushes
+    METRICS_FLUSH_SECONDS = 60.0  # Longest time buffered metrics wait at low traffic
+    _EXACT_ROW_METHODS = (
+        CalculationMethod.EXACT_DATE,
+        CalculationMethod.NEAREST_DATE,
+        CalculationMethod.INTERPOLATED,
+    )
+    SERIES_TTL_SECONDS = timedelta(days=1).total_seconds()
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self._cpi_cache: Dict[date, float] = {}
-        self._cache_ttl = timedelta(hours=1)  # Cache CPI data for 1 hour
-        self._last_cache_update = datetime.min
+        # LRU of (date, method) -> (cpi_value, monotonic timestamp)
+        self._cpi_cache: "OrderedDict[Tuple[date, CalculationMethod], Tuple[float, float]]" = OrderedDict()
+        self._cache_ttl_seconds = timedelta(hours=1).total_seconds()  # Cache CPI data for 1 hour
+        self._monthly_avg_cache: Dict[Tuple[int, int], float] = {}
+        # Full CPI series sorted by date, for nearest and interpolated lookups
+        self._series_dates: List[date] = []
+        self._series_values: List[float] = []
+        self._series_loaded_at: Optional[float] = None
+        self._summary_cache: "OrderedDict[Tuple[date, date], Dict[str, Any]]" = OrderedDict()
+        self._metrics_buffer = self._empty_metrics_buffer()
+        self._metrics_flushed_at = time.monotonic()
+        # Prepared batch statement per pooled asyncpg connection
+        self._batch_statements: "weakref.WeakKeyDictionary[Any, Any]" = weakref.WeakKeyDictionary()
 
     @track_supabase_operation("calculate_salary_gap", "cpi_calculations")
     async def calculate_salary_gap(
         self, 
-        request: CPICalculationRequest,
+        request: CPICalculationInput,
         db_session: Optional[AsyncSession] = None
     ) -> InflationAdjustmentResult:
         """
@@ -122,19 +230,15 @@ class CPICalculatorService:
             CPICalculationError: If calculation fails
             CPIDataNotFoundError: If required CPI data is unavailable
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
+        method_tag = request.calculation_method.value
         
         try:
-            # Log calculation start
-            log_business_event(
-                "cpi_calculation_started",
-                user_id=request.user_id,
-                details={
-                    "original_salary": request.original_salary,
-                    "historical_date": request.historical_date.isoformat(),
-                    "calculation_method": request.calculation_method
-                }
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"CPI calculation started: salary={request.original_salary}, "
+                    f"historical_date={request.historical_date}, method={method_tag}"
+                )
 
             # Get database session if not provided
             if db_session is None:
@@ -144,49 +248,51 @@ class CPICalculatorService:
                 return await self._perform_calculation(request, db_session)
 
         except Exception as e:
+            error_type = type(e).__name__
+
             # Log calculation error
             log_business_event(
                 "cpi_calculation_failed",
                 user_id=request.user_id,
                 details={
                     "error": str(e),
-                    "error_type": type(e).__name__,
-                    "request_data": request.dict()
+                    "error_type": error_type,
+                    "original_salary": request.original_salary,
+                    "historical_date": request.historical_date.isoformat(),
+                    "calculation_method": method_tag
                 }
             )
             
             # Record error metric
             record_business_metric("cpi_calculation_errors", 1, {
-                "error_type": type(e).__name__,
-                "calculation_method": request.calculation_method
+                "error_type": error_type,
+                "calculation_method": method_tag
             })
             
             raise
 
         finally:
-            # Record calculation duration
-            duration = (datetime.now() - start_time).total_seconds()
-            record_business_metric("cpi_calculation_duration", duration, {
-                "calculation_method": request.calculation_method
-            })
+            # Buffer call count and duration; emitted by flush_metrics()
+            self._metrics_buffer["calls"] += 1
+            self._metrics_buffer["duration_sum"] += time.perf_counter() - start_time
+            if (
+                self._metrics_buffer["calls"] >= self.METRICS_FLUSH_INTERVAL
+                or time.monotonic() - self._metrics_flushed_at >= self.METRICS_FLUSH_SECONDS
+            ):
+                self.flush_metrics()
 
     async def _perform_calculation(
         self, 
-        request: CPICalculationRequest, 
+        request: CPICalculationInput, 
         db_session: AsyncSession
     ) -> InflationAdjustmentResult:
         """Perform the actual CPI calculation."""
         
         # Get CPI values for both dates
-        historical_cpi = await self._get_cpi_for_date(
-            request.historical_date, 
-            request.calculation_method, 
-            db_session
-        )
-        
-        current_cpi = await self._get_cpi_for_date(
-            request.current_date, 
-            request.calculation_method, 
+        historical_cpi, current_cpi = await self._get_cpis_for_dates(
+            request.historical_date,
+            request.current_date,
+            request.calculation_method,
             db_session
         )
 
@@ -211,22 +317,14 @@ class CPICalculatorService:
             current_date=request.current_date
         )
 
-        # Log successful calculation
-        log_business_event(
-            "cpi_calculation_completed",
-            user_id=request.user_id,
-            details={
-                "adjusted_salary": result.adjusted_salary,
-                "percentage_gap": result.percentage_gap,
-                "dollar_gap": result.dollar_gap,
-                "inflation_rate": result.inflation_rate
-            }
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"CPI calculation completed: adjusted_salary={result.adjusted_salary}, "
+                f"dollar_gap={result.dollar_gap}, percentage_gap={result.percentage_gap}, "
+                f"inflation_rate={result.inflation_rate}"
+            )
 
-        # Record success metric
-        record_business_metric("cpi_calculations_successful", 1, {
-            "calculation_method": request.calculation_method
-        })
+        self._metrics_buffer["successes"] += 1
 
         return result
 
@@ -241,32 +339,11 @@ class CPICalculatorService:
     ) -> InflationAdjustmentResult:
         """
         Perform the core inflation adjustment calculation.
-        Uses Decimal for precise financial calculations.
+        Uses plain float math; results are rounded to display precision.
         """
-        
-        # Convert to Decimal for precise financial calculations
-        original_decimal = Decimal(str(original_salary))
-        current_decimal = Decimal(str(current_salary))
-        historical_cpi_decimal = Decimal(str(historical_cpi))
-        current_cpi_decimal = Decimal(str(current_cpi))
-
-        # Calculate inflation-adjusted salary
-        # Formula: Adjusted = Original × (Current CPI / Historical CPI)
-        cpi_ratio = current_cpi_decimal / historical_cpi_decimal
-        adjusted_salary_decimal = original_decimal * cpi_ratio
-
-        # Calculate gaps
-        dollar_gap_decimal = adjusted_salary_decimal - current_decimal
-        percentage_gap_decimal = (dollar_gap_decimal / current_decimal) * Decimal('100')
-
-        # Calculate inflation rate
-        inflation_rate_decimal = ((current_cpi_decimal - historical_cpi_decimal) / historical_cpi_decimal) * Decimal('100')
-
-        # Round to appropriate precision (2 decimal places for currency)
-        adjusted_salary = float(adjusted_salary_decimal.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP))
-        dollar_gap = float(dollar_gap_decimal.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP))
-        percentage_gap = float(percentage_gap_decimal.quantize(Decimal('0.1'), rounding=ROUND_HALF_UP))
-        inflation_rate = float(inflation_rate_decimal.quantize(Decimal('0.1'), rounding=ROUND_HALF_UP))
+        adjusted_salary, dollar_gap, percentage_gap, inflation_rate = _adjust_salary(
+            original_salary, current_salary, historical_cpi, current_cpi
+        )
 
         return InflationAdjustmentResult(
             adjusted_salary=adjusted_salary,
@@ -292,11 +369,12 @@ class CPICalculatorService:
         """
         
         # Check cache first
-        if target_date in self._cpi_cache and self._is_cache_valid():
-            record_business_metric("cpi_cache_hits", 1)
-            return self._cpi_cache[target_date]
+        cached_value = self._get_cached_cpi(target_date, method)
+        if cached_value is not None:
+            self._metrics_buffer["cache_hits"] += 1
+            return cached_value
 
-        record_business_metric("cpi_cache_misses", 1)
+        self._metrics_buffer["cache_misses"] += 1
 
         try:
             if method == CalculationMethod.EXACT_DATE:
@@ -312,8 +390,7 @@ class CPICalculatorService:
 
             # Cache the result
             if cpi_value is not None:
-                self._cpi_cache[target_date] = cpi_value
-                self._last_cache_update = datetime.now()
+                self._cache_cpi(target_date, method, cpi_value)
 
             return cpi_value
 
@@ -321,88 +398,147 @@ class CPICalculatorService:
             self.logger.error(f"Error retrieving CPI for date {target_date}: {str(e)}")
             raise CPICalculationError(f"Failed to retrieve CPI data: {str(e)}")
 
+    async def _get_cpis_for_dates(
+        self,
+        historical_date: date,
+        current_date: date,
+        method: CalculationMethod,
+        db_session: AsyncSession
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Retrieve CPI values for the historical and current dates.
+        Exact-date lookups that miss the cache share one query; the other
+        methods read the in-memory series or aggregate per date.
+        """
+        if (
+            method != CalculationMethod.EXACT_DATE
+            or self._get_cached_cpi(historical_date, method) is not None
+            or self._get_cached_cpi(current_date, method) is not None
+        ):
+            historical_cpi = await self._get_cpi_for_date(historical_date, method, db_session)
+            current_cpi = await self._get_cpi_for_date(current_date, method, db_session)
+            return historical_cpi, current_cpi
+
+        self._metrics_buffer["cache_misses"] += 2
+
+        try:
+            query = (
+                select(CPIData.reference_date, CPIData.cpi_value)
+                .where(
+                    CPIData.series_id == CPI_SERIES_ID,
+                    CPIData.reference_date.in_([historical_date, current_date])
+                )
+            )
+            result = await db_session.execute(query)
+            values = {date_val: float(cpi_val) for date_val, cpi_val in result.all()}
+            historical_cpi = values.get(historical_date)
+            current_cpi = values.get(current_date)
+
+        except Exception as e:
+            self.logger.error(
+                f"Error retrieving CPI for dates {historical_date}, {current_date}: {str(e)}"
+            )
+            raise CPICalculationError(f"Failed to retrieve CPI data: {str(e)}")
+
+        if historical_cpi is not None:
+            self._cache_cpi(historical_date, method, historical_cpi)
+        if current_cpi is not None:
+            self._cache_cpi(current_date, method, current_cpi)
+
+        return historical_cpi, current_cpi
+
+    async def _get_asyncpg_connection(self, db_session: AsyncSession) -> Optional[Any]:
+        """Return the asyncpg connection behind the session, or None for other drivers."""
+        if db_session.get_bind().dialect.driver != "asyncpg":
+            return None
+        connection = await db_session.connection()
+        raw_connection = await connection.get_raw_connection()
+        return raw_connection.driver_connection
+
     async def _get_exact_date_cpi(self, target_date: date, db_session: AsyncSession) -> Optional[float]:
         """Get CPI for exact date match."""
-        query = select(CPIData.value).where(CPIData.date == target_date)
+        raw_connection = await self._get_asyncpg_connection(db_session)
+        if raw_connection is not None:
+            return await raw_connection.fetchval(EXACT_CPI_SQL, target_date, CPI_SERIES_ID)
+
+        query = select(CPIData.cpi_value).where(
+            CPIData.series_id == CPI_SERIES_ID,
+            CPIData.reference_date == target_date
+        )
         result = await db_session.execute(query)
         cpi_record = result.scalar_one_or_none()
         return float(cpi_record) if cpi_record is not None else None
 
     async def _get_nearest_date_cpi(self, target_date: date, db_session: AsyncSession) -> Optional[float]:
         """Get CPI for nearest available date (preferring earlier dates)."""
-        # Try to get CPI for date on or before target date
-        query = (
-            select(CPIData.value)
-            .where(CPIData.date <= target_date)
-            .order_by(desc(CPIData.date))
-            .limit(1)
-        )
-        result = await db_session.execute(query)
-        cpi_record = result.scalar_one_or_none()
-        
-        if cpi_record is not None:
-            return float(cpi_record)
+        await self._load_cpi_series(db_session)
+        if not self._series_dates:
+            return None
 
-        # If no earlier date, try to get the nearest later date
-        query = (
-            select(CPIData.value)
-            .where(CPIData.date > target_date)
-            .order_by(CPIData.date)
-            .limit(1)
-        )
-        result = await db_session.execute(query)
-        cpi_record = result.scalar_one_or_none()
-        return float(cpi_record) if cpi_record is not None else None
+        # Latest date on or before the target; if none, the earliest later date
+        index = bisect_right(self._series_dates, target_date) - 1
+        return self._series_values[max(index, 0)]
 
     async def _get_interpolated_cpi(self, target_date: date, db_session: AsyncSession) -> Optional[float]:
         """Get interpolated CPI value between two known dates."""
-        # Get the nearest dates before and after target date
-        before_query = (
-            select(CPIData.date, CPIData.value)
-            .where(CPIData.date <= target_date)
-            .order_by(desc(CPIData.date))
-            .limit(1)
-        )
-        
-        after_query = (
-            select(CPIData.date, CPIData.value)
-            .where(CPIData.date > target_date)
-            .order_by(CPIData.date)
-            .limit(1)
-        )
+        await self._load_cpi_series(db_session)
+        dates = self._series_dates
+        values = self._series_values
+        if not dates:
+            return None
 
-        before_result = await db_session.execute(before_query)
-        after_result = await db_session.execute(after_query)
+        # Nearest dates on or before and after the target date
+        index = bisect_right(dates, target_date)
+        if index == 0:
+            return values[0]
+        if index == len(dates):
+            return values[-1]
+
+        # Perform linear interpolation
+        before_date, before_value = dates[index - 1], values[index - 1]
+        after_date, after_value = dates[index], values[index]
+
+        days_total = (after_date - before_date).days
+        days_from_before = (target_date - before_date).days
         
-        before_record = before_result.first()
-        after_record = after_result.first()
+        interpolation_factor = days_from_before / days_total
+        return before_value + (after_value - before_value) * interpolation_factor
 
-        if before_record is None and after_record is None:
-            return None
-        elif before_record is None:
-            return float(after_record.value)
-        elif after_record is None:
-            return float(before_record.value)
-        else:
-            # Perform linear interpolation
-            before_date, before_value = before_record
-            after_date, after_value = after_record
-            
-            if before_date == after_date:
-                return float(before_value)
-            
-            # Calculate interpolated value
-            days_total = (after_date - before_date).days
-            days_from_before = (target_date - before_date).days
-            
-            interpolation_factor = days_from_before / days_total
-            interpolated_value = before_value + (after_value - before_value) * interpolation_factor
-            
-            return float(interpolated_value)
+    async def _load_cpi_series(self, db_session: AsyncSession):
+        """Load the full CPI series into sorted in-memory arrays, refreshing daily."""
+        if self._series_is_fresh():
+            return
+
+        query = (
+            select(CPIData.reference_date, CPIData.cpi_value)
+            .where(CPIData.series_id == CPI_SERIES_ID)
+            .order_by(CPIData.reference_date)
+        )
+        result = await db_session.execute(query)
+        rows = result.all()
+        if not rows:
+            return
+
+        self._series_dates = [date_val for date_val, _ in rows]
+        self._series_values = [float(cpi_val) for _, cpi_val in rows]
+        self._series_loaded_at = time.monotonic()
+        # Summaries were computed from the previous series
+        self._summary_cache.clear()
+
+    def _series_is_fresh(self) -> bool:
+        """Check if the in-memory CPI series is loaded and within its TTL."""
+        return (
+            self._series_loaded_at is not None
+            and time.monotonic() - self._series_loaded_at < self.SERIES_TTL_SECONDS
+        )
 
     async def _get_monthly_average_cpi(self, target_date: date, db_session: AsyncSession) -> Optional[float]:
         """Get monthly average CPI for the target month."""
-        # Get all CPI values for the target month
+        month_key = (target_date.year, target_date.month)
+        if month_key in self._monthly_avg_cache:
+            return self._monthly_avg_cache[month_key]
+
+        # Average the CPI values for the target month in the database
         month_start = target_date.replace(day=1)
         if target_date.month == 12:
             month_end = date(target_date.year + 1, 1, 1) - timedelta(days=1)
@@ -410,37 +546,90 @@ class CPICalculatorService:
             month_end = date(target_date.year, target_date.month + 1, 1) - timedelta(days=1)
 
         query = (
-            select(CPIData.value)
-            .where(and_(CPIData.date >= month_start, CPIData.date <= month_end))
+            select(func.avg(CPIData.cpi_value))
+            .where(and_(
+                CPIData.series_id == CPI_SERIES_ID,
+                CPIData.reference_date >= month_start,
+                CPIData.reference_date <= month_end
+            ))
         )
         
         result = await db_session.execute(query)
-        values = [float(row[0]) for row in result.fetchall()]
+        average = result.scalar_one_or_none()
         
-        if not values:
+        if average is None:
             return None
         
-        return sum(values) / len(values)
+        average = float(average)
+        # Published months don't change; the current month may still gain rows
+        today = date.today()
+        if month_key < (today.year, today.month):
+            self._monthly_avg_cache[month_key] = average
+        return average
+
+    def _get_cached_cpi(self, target_date: date, method: CalculationMethod) -> Optional[float]:
+        """Return a cached CPI value if present and not expired."""
+        key = (target_date, method)
+        entry = self._cpi_cache.get(key)
+        if entry is None:
+            return None
 
-    def _is_cache_valid(self) -> bool:
-        """Check if the CPI cache is still valid."""
-        return datetime.now() - self._last_cache_update < self._cache_ttl
+        cpi_value, cached_at = entry
+        if time.monotonic() - cached_at >= self._cache_ttl_seconds:
+            del self._cpi_cache[key]
+            return None
+
+        self._cpi_cache.move_to_end(key)
+        return cpi_value
+
+    def _cache_cpi(self, target_date: date, method: CalculationMethod, cpi_value: float):
+        """Cache a CPI value, evicting the least recently used entries."""
+        key = (target_date, method)
+        self._cpi_cache[key] = (cpi_value, time.monotonic())
+        self._cpi_cache.move_to_end(key)
+        while len(self._cpi_cache) > self.CPI_CACHE_MAX_SIZE:
+            self._cpi_cache.popitem(last=False)
+
+    @staticmethod
+    def _empty_metrics_buffer() -> Dict[str, float]:
+        """Create zeroed counters for buffered calculation metrics."""
+        return {
+            "calls": 0,
+            "successes": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "duration_sum": 0.0,
+        }
+
+    def flush_metrics(self):
+        """Emit buffered calculation metrics and reset the counters."""
+        buffer = self._metrics_buffer
+        self._metrics_buffer = self._empty_metrics_buffer()
+        self._metrics_flushed_at = time.monotonic()
+
+        record_business_metric("cpi_calculations", buffer["calls"])
+        record_business_metric("cpi_calculations_successful", buffer["successes"])
+        record_business_metric("cpi_cache_hits", buffer["cache_hits"])
+        record_business_metric("cpi_cache_misses", buffer["cache_misses"])
+        record_business_metric("cpi_calculation_duration", buffer["duration_sum"])
 
     def clear_cache(self):
         """Clear the CPI cache."""
         self._cpi_cache.clear()
-        self._last_cache_update = datetime.min
+        self._monthly_avg_cache.clear()
+        self._series_loaded_at = None
+        self._summary_cache.clear()
 
     async def bulk_calculate_gaps(
         self, 
-        requests: List[CPICalculationRequest],
+        requests: List[CPICalculationInput],
         db_session: Optional[AsyncSession] = None
     ) -> List[InflationAdjustmentResult]:
         """
         Perform bulk salary gap calculations for multiple requests.
         Optimized for performance with batch CPI data retrieval.
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             if db_session is None:
@@ -450,14 +639,14 @@ class CPICalculatorService:
                 return await self._perform_bulk_calculation(requests, db_session)
         
         finally:
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             record_business_metric("bulk_cpi_calculation_duration", duration, {
                 "request_count": len(requests)
             })
 
     async def _perform_bulk_calculation(
         self, 
-        requests: List[CPICalculationRequest], 
+        requests: List[CPICalculationInput], 
         db_session: AsyncSession
     ) -> List[InflationAdjustmentResult]:
         """Perform bulk calculations with optimized database queries."""
@@ -471,29 +660,89 @@ class CPICalculatorService:
         # Batch fetch all required CPI data
         await self._batch_load_cpi_data(list(all_dates), db_session)
 
-        # Perform individual calculations using cached data
+        # Calculate straight from the cache; only requests whose dates have
+        # no exact CPI row go through the per-request lookup path
         results = []
+        calculation_date = datetime.now()
         for request in requests:
             try:
-                result = await self.calculate_salary_gap(request, db_session)
+                result = self._calculate_from_cache(request, calculation_date)
+                if result is None:
+                    result = await self._perform_calculation(request, db_session)
                 results.append(result)
             except Exception as e:
-                self.logger.error(f"Bulk calculation failed for request: {request.dict()}, error: {str(e)}")
+                self.logger.error(
+                    f"Bulk calculation failed for user {request.user_id} "
+                    f"({request.historical_date} -> {request.current_date}): {str(e)}"
+                )
                 # Continue with other calculations
                 continue
 
         record_business_metric("bulk_cpi_calculations_completed", len(results))
+        self.flush_metrics()
         return results
 
+    def _calculate_from_cache(
+        self,
+        request: CPICalculationInput,
+        calculation_date: datetime
+    ) -> Optional[InflationAdjustmentResult]:
+        """
+        Calculate a gap using only cached CPI values.
+        
+        Returns:
+            InflationAdjustmentResult, or None if either CPI value is not cached
+        """
+        method = request.calculation_method
+        historical_cpi = self._get_cached_cpi(request.historical_date, method)
+        current_cpi = self._get_cached_cpi(request.current_date, method)
+        if historical_cpi is None or current_cpi is None:
+            return None
+
+        adjusted_salary, dollar_gap, percentage_gap, inflation_rate = _adjust_salary(
+            request.original_salary, request.current_salary, historical_cpi, current_cpi
+        )
+        return InflationAdjustmentResult(
+            adjusted_salary=adjusted_salary,
+            percentage_gap=percentage_gap,
+            dollar_gap=dollar_gap,
+            original_salary=request.original_salary,
+            current_salary=request.current_salary,
+            historical_cpi=historical_cpi,
+            current_cpi=current_cpi,
+            calculation_date=calculation_date,
+            inflation_rate=inflation_rate
+        )
+
     async def _batch_load_cpi_data(self, dates: List[date], db_session: AsyncSession):
         """Batch load CPI data for multiple dates."""
-        query = select(CPIData.date, CPIData.value).where(CPIData.date.in_(dates))
-        result = await db_session.execute(query)
-        
-        for date_val, cpi_val in result.fetchall():
-            self._cpi_cache[date_val] = float(cpi_val)
+        raw_connection = await self._get_asyncpg_connection(db_session)
+        if raw_connection is not None:
+            statement = await self._get_batch_statement(raw_connection)
+            rows = await statement.fetch(dates, CPI_SERIES_ID)
+        else:
+            query = (
+                select(CPIData.reference_date, CPIData.cpi_value.cast(Float))
+                .where(
+                    CPIData.series_id == CPI_SERIES_ID,
+                    CPIData.reference_date.in_(dates)
+                )
+            )
+            result = await db_session.execute(query)
+            rows = result.all()
         
-        self._last_cache_update = datetime.now()
+        for date_val, cpi_val in rows:
+            # An exact row is also the nearest and the interpolated value
+            for method in self._EXACT_ROW_METHODS:
+                self._cache_cpi(date_val, method, cpi_val)
+
+    async def _get_batch_statement(self, raw_connection: Any) -> Any:
+        """Prepare the batch CPI query once per asyncpg connection."""
+        statement = self._batch_statements.get(raw_connection)
+        if statement is None:
+            statement = await raw_connection.prepare(BATCH_CPI_SQL)
+            self._batch_statements[raw_connection] = statement
+        return statement
 
     async def get_inflation_summary(
         self, 
@@ -504,12 +753,23 @@ class CPICalculatorService:
         """
         Get inflation summary statistics for a date range.
         Useful for dashboard displays and analysis.
+        Summaries are memoized until the CPI series is reloaded.
         """
+        cache_key = (start_date, end_date)
+        if self._series_is_fresh() and cache_key in self._summary_cache:
+            self._summary_cache.move_to_end(cache_key)
+            return dict(self._summary_cache[cache_key])
+
         if db_session is None:
             async with get_db_session() as session:
-                return await self._get_inflation_summary(start_date, end_date, session)
+                summary = await self._get_inflation_summary(start_date, end_date, session)
         else:
-            return await self._get_inflation_summary(start_date, end_date, db_session)
+            summary = await self._get_inflation_summary(start_date, end_date, db_session)
+
+        self._summary_cache[cache_key] = summary
+        while len(self._summary_cache) > self.SUMMARY_CACHE_MAX_SIZE:
+            self._summary_cache.popitem(last=False)
+        return dict(summary)
 
     async def _get_inflation_summary(
         self, 
@@ -6,38 +6,109 @@ with PostgreSQL storage. It provides data access, caching, and automated
 data management capabilities.
 """
 
-from datetime import datetime, date, timedelta
+from contextlib import nullcontext
+from datetime import datetime, date, timedelta, timezone
 from decimal import Decimal
 from typing import List, Optional, Dict, Any, Tuple
+import asyncio
+import csv
+import io
 import logging
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy import and_, or_, func, desc
+from sqlalchemy import and_, or_, case, func, delete, desc, literal, literal_column, select, text, union_all, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-from app.core.database import SessionLocal
-from app.models.cpi_data import CPIData
+from app.core.database import SessionLocal, engine
+from app.models.cpi_data import CPI_DATA_UNIQUE_KEY, CPIData
 from app.services.bls_service import bls_service, CPIDataPoint, BLSAPIError
 
 logger = logging.getLogger(__name__)
 
+# Staging table for COPY seeds; dropped at commit at the latest
+COPY_SEED_STAGING_SQL = (
+    "CREATE TEMP TABLE cpi_data_staging ON COMMIT DROP AS "
+    "SELECT year, month, cpi_value, reference_date FROM cpi_data WITH NO DATA"
+)
+COPY_SEED_COPY_SQL = (
+    "COPY cpi_data_staging (year, month, cpi_value, reference_date) FROM STDIN WITH CSV"
+)
+COPY_SEED_UPSERT_SQL = """
+    INSERT INTO cpi_data (
+        id, year, month, cpi_value, cpi_u_value, reference_date, data_source,
+        series_id, region, is_seasonal_adjusted, is_preliminary, is_revised
+    )
+    SELECT DISTINCT ON (year, month)
+        gen_random_uuid(), year, month, cpi_value, cpi_value, reference_date, 'BLS',
+        %(series_id)s, 'US', TRUE, FALSE, FALSE
+    FROM cpi_data_staging
+    ORDER BY year, month, reference_date DESC
+    ON CONFLICT (year, month, region, series_id) DO UPDATE SET
+        cpi_value = EXCLUDED.cpi_value,
+        reference_date = EXCLUDED.reference_date,
+        updated_at = now()
+    RETURNING xmax = 0
+"""
+
+
+def _chunks(seq: List[Any], size: int):
+    """Yield successive slices of at most size items."""
+    for i in range(0, len(seq), size):
+        yield seq[i:i + size]
+
 
 class CPIDataService:
     """Service for managing CPI data with database storage and BLS API integration."""
     
+    UPSERT_BATCH_SIZE = 1000  # Rows per executemany batch; stays well under the bind parameter limit
+    VACUUM_THRESHOLD = 1000  # Deletes at least this large are followed by VACUUM (ANALYZE)
+    INFLATION_RATE_BATCH_SIZE = 500  # Rows fetched per batch when recalculating rates in Python
+    READ_CACHE_TTL = timedelta(minutes=5)  # CPI data changes at most monthly
+    
     def __init__(self):
         """Initialize the CPI data service."""
         self.bls_service = bls_service
+        self._read_cache: Dict[str, Tuple[datetime, Any]] = {}
+    
+    def _get_cached(self, key: str) -> Tuple[bool, Any]:
+        """Return (hit, value) for a cached read result."""
+        entry = self._read_cache.get(key)
+        if entry is None:
+            return False, None
+        
+        cached_at, value = entry
+        if datetime.now() - cached_at >= self.READ_CACHE_TTL:
+            self._read_cache.pop(key, None)
+            return False, None
+        
+        return True, value
+    
+    def _set_cached(self, key: str, value: Any):
+        """Cache a read result."""
+        self._read_cache[key] = (datetime.now(), value)
+    
+    def clear_cache(self):
+        """Clear cached read results."""
+        self._read_cache.clear()
     
     def get_db_session(self) -> Session:
         """Get a database session."""
         return SessionLocal()
     
-    def fetch_and_store_latest_data(self, force_refresh: bool = False) -> Dict[str, Any]:
+    def _session_scope(self, db: Optional[Session] = None):
+        """Use the caller's session as-is, or open one that is closed on exit."""
+        return nullcontext(db) if db is not None else self.get_db_session()
+    
+    def fetch_and_store_latest_data(
+        self,
+        force_refresh: bool = False,
+        db: Optional[Session] = None
+    ) -> Dict[str, Any]:
         """
         Fetch the latest CPI data from BLS API and store in database.
         
         Args:
             force_refresh: If True, fetch data regardless of last update
+            db: Database session (optional); left open for the caller
             
         Returns:
             Dictionary with operation results
@@ -52,46 +123,177 @@ class CPIDataService:
             "errors": []
         }
         
-        db = self.get_db_session()
-        try:
-            # Check if we need to fetch new data
-            if not force_refresh:
-                latest_record = self.get_latest_cpi_record(db)
-                if latest_record:
-                    # Don't fetch if we have data from current month
-                    current_month_start = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-                    latest_record_date = datetime.combine(latest_record.reference_date, datetime.min.time())
-                    
-                    if latest_record_date >= current_month_start:
-                        results["message"] = "Current month data already exists"
-                        results["success"] = True
-                        results["total_records"] = self.get_total_records_count(db)
-                        return results
-            
-            # Fetch data from BLS API
-            current_year = datetime.now().year
-            start_year = current_year - 2  # Get last 2 years of data
-            
-            logger.info(f"Fetching CPI data from BLS API for {start_year}-{current_year}")
-            
+        with self._session_scope(db) as db:
             try:
-                cpi_data_points = self.bls_service.get_cpi_range(start_year, current_year)
-            except BLSAPIError as e:
-                results["errors"].append(f"BLS API Error: {str(e)}")
-                results["message"] = "Failed to fetch data from BLS API"
-                return results
-            
-            if not cpi_data_points:
-                results["message"] = "No data received from BLS API"
-                return results
+                # Check if we need to fetch new data
+                # Don't fetch if we have data from current month
+                if not force_refresh and self._has_current_month(db):
+                    results["message"] = "Current month data already exists"
+                    results["success"] = True
+                    results["total_records"] = self.get_total_records_count(db)
+                    return results
+                
+                # End the read transaction so no connection is held during the API call
+                db.rollback()
+                
+                # Fetch data from BLS API
+                current_year = datetime.now().year
+                start_year = current_year - 2  # Get last 2 years of data
+                
+                logger.info(f"Fetching CPI data from BLS API for {start_year}-{current_year}")
+                
+                try:
+                    cpi_data_points = asyncio.run(
+                        self.bls_service.get_cpi_range_async(start_year, current_year)
+                    )
+                except BLSAPIError as e:
+                    results["errors"].append(f"BLS API Error: {str(e)}")
+                    results["message"] = "Failed to fetch data from BLS API"
+                    return results
+                
+                if not cpi_data_points:
+                    results["message"] = "No data received from BLS API"
+                    return results
+                
+                # Store data and update rates in one transaction; the session does
+                # not autoflush, so nothing is written until the commit
+                with db.begin():
+                    new_count, updated_count = self._store_data_points(
+                        db, cpi_data_points, results["errors"]
+                    )
+                
+                self.clear_cache()
+                
+                results.update({
+                    "success": True,
+                    "message": f"Successfully processed {len(cpi_data_points)} data points",
+                    "new_records": new_count,
+                    "updated_records": updated_count,
+                    "total_records": self.get_total_records_count(db),
+                    "latest_date": max([dp.date for dp in cpi_data_points]).strftime('%Y-%m-%d') if cpi_data_points else None
+                })
+                
+                logger.info(f"CPI data update completed: {new_count} new, {updated_count} updated records")
+                
+            except Exception as e:
+                db.rollback()
+                error_msg = f"Database error during CPI data update: {str(e)}"
+                logger.error(error_msg)
+                results["errors"].append(error_msg)
+                results["message"] = "Database operation failed"
+        
+        return results
+    
+    def seed_historical_data(
+        self,
+        start_year: int,
+        end_year: Optional[int] = None,
+        db: Optional[Session] = None
+    ) -> Dict[str, Any]:
+        """
+        Backfill CPI history from BLS for a range of years.
+        
+        Used for initial seeding and other multi-year backfills. On
+        PostgreSQL the points are loaded with COPY through a staging table
+        rather than upsert batches.
+        
+        Args:
+            start_year: First year to load
+            end_year: Last year to load (defaults to the current year)
+            db: Database session (optional); left open for the caller
             
-            # Store data in database
-            new_count = 0
-            updated_count = 0
+        Returns:
+            Dictionary with operation results
+        """
+        end_year = end_year or datetime.now().year
+        results = {
+            "success": False,
+            "message": "",
+            "new_records": 0,
+            "updated_records": 0,
+            "total_records": 0,
+            "errors": []
+        }
+        
+        logger.info(f"Seeding CPI data from BLS API for {start_year}-{end_year}")
+        
+        try:
+            cpi_data_points = asyncio.run(
+                self.bls_service.get_cpi_range_async(start_year, end_year)
+            )
+        except BLSAPIError as e:
+            results["errors"].append(f"BLS API Error: {str(e)}")
+            results["message"] = "Failed to fetch data from BLS API"
+            return results
+        
+        if not cpi_data_points:
+            results["message"] = "No data received from BLS API"
+            return results
+        
+        with self._session_scope(db) as db:
+            try:
+                with db.begin():
+                    new_count, updated_count = self._store_data_points(
+                        db, cpi_data_points, results["errors"], bulk=True
+                    )
+                
+                self.clear_cache()
+                
+                results.update({
+                    "success": True,
+                    "message": f"Seeded {len(cpi_data_points)} data points",
+                    "new_records": new_count,
+                    "updated_records": updated_count,
+                    "total_records": self.get_total_records_count(db)
+                })
+                
+                logger.info(f"CPI data seed completed: {new_count} new, {updated_count} updated records")
+                
+            except Exception as e:
+                db.rollback()
+                error_msg = f"Database error during CPI data seed: {str(e)}"
+                logger.error(error_msg)
+                results["errors"].append(error_msg)
+                results["message"] = "Database operation failed"
+        
+        return results
+    
+    def _store_data_points(
+        self,
+        db: Session,
+        cpi_data_points: List[CPIDataPoint],
+        errors: List[str],
+        bulk: bool = False
+    ) -> Tuple[int, int]:
+        """
+        Store fetched CPI data points and recalculate inflation rates from the
+        earliest of them on, in the caller's transaction.
+        
+        Args:
+            db: Database session
+            cpi_data_points: CPI data points from BLS API
+            errors: List that per-point storage errors are appended to
+            bulk: Load with COPY through a staging table on PostgreSQL
             
+        Returns:
+            Tuple of (new_count, updated_count)
+        """
+        new_count = 0
+        updated_count = 0
+        
+        if db.get_bind().dialect.name == 'postgresql':
+            if bulk:
+                new_count, updated_count = self._bulk_copy_seed(db, cpi_data_points)
+            else:
+                new_count, updated_count = self.upsert_cpi_data_points(db, cpi_data_points)
+        else:
+            existing_records = self.get_existing_records_by_period(db)
+            updated_at = datetime.now()
             for data_point in cpi_data_points:
                 try:
-                    stored_record, is_new = self.store_cpi_data_point(db, data_point)
+                    stored_record, is_new = self.store_cpi_data_point(
+                        db, data_point, existing_records, updated_at
+                    )
                     if stored_record:
                         if is_new:
                             new_count += 1
@@ -100,63 +302,159 @@ class CPIDataService:
                 except Exception as e:
                     error_msg = f"Error storing data point {data_point.date}: {str(e)}"
                     logger.error(error_msg)
-                    results["errors"].append(error_msg)
-            
-            # Calculate inflation rates for new records
-            self.calculate_and_update_inflation_rates(db)
-            
-            db.commit()
-            
-            results.update({
-                "success": True,
-                "message": f"Successfully processed {len(cpi_data_points)} data points",
-                "new_records": new_count,
-                "updated_records": updated_count,
-                "total_records": self.get_total_records_count(db),
-                "latest_date": max([dp.date for dp in cpi_data_points]).strftime('%Y-%m-%d') if cpi_data_points else None
-            })
+                    errors.append(error_msg)
+        
+        # Recalculate inflation rates from the earliest fetched month on
+        self.calculate_and_update_inflation_rates(
+            db, since=min(dp.date for dp in cpi_data_points).date()
+        )
+        
+        return new_count, updated_count
+    
+    def upsert_cpi_data_points(self, db: Session, data_points: List[CPIDataPoint]) -> Tuple[int, int]:
+        """
+        Insert or update CPI data points with INSERT ... ON CONFLICT DO UPDATE,
+        one executemany batch per UPSERT_BATCH_SIZE rows in the caller's transaction.
+        
+        Args:
+            db: Database session (PostgreSQL)
+            data_points: CPI data points from BLS API
             
-            logger.info(f"CPI data update completed: {new_count} new, {updated_count} updated records")
+        Returns:
+            Tuple of (new_count, updated_count)
+        """
+        series_id = self.bls_service.CPI_SERIES_ID
+        rows = [
+            {
+                "year": data_point.year,
+                "month": data_point.date.month,
+                "cpi_value": cpi_value,
+                "cpi_u_value": cpi_value,  # CUSR0000SA0 is CPI-U
+                "reference_date": data_point.date.date(),
+                "data_source": "BLS",
+                "series_id": series_id,
+                "region": "US",
+                "is_seasonal_adjusted": True,
+                "is_preliminary": False,
+                "is_revised": False
+            }
+            for data_point, cpi_value in zip(
+                data_points,
+                [round(data_point.value, 3) for data_point in data_points]
+            )
+        ]
+        
+        stmt = pg_insert(CPIData.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=CPI_DATA_UNIQUE_KEY,
+            set_={
+                "cpi_value": stmt.excluded.cpi_value,
+                "reference_date": stmt.excluded.reference_date,
+                "updated_at": func.now()
+            }
+        ).returning(
+            # xmax is 0 only for rows this statement inserted
+            (literal_column("xmax") == 0).label("inserted")
+        )
+        
+        new_count = 0
+        updated_count = 0
+        for batch in _chunks(rows, self.UPSERT_BATCH_SIZE):
+            inserted_flags = db.execute(stmt, batch).scalars().all()
+            batch_new = sum(1 for inserted in inserted_flags if inserted)
+            new_count += batch_new
+            updated_count += len(inserted_flags) - batch_new
+        
+        return new_count, updated_count
+    
+    def _bulk_copy_seed(self, db: Session, data_points: List[CPIDataPoint]) -> Tuple[int, int]:
+        """
+        Load a large seed by COPYing into a temporary staging table and upserting
+        from it in one INSERT ... SELECT, in the caller's transaction.
+        
+        Args:
+            db: Database session (PostgreSQL with psycopg2)
+            data_points: CPI data points from BLS API
             
-        except Exception as e:
-            db.rollback()
-            error_msg = f"Database error during CPI data update: {str(e)}"
-            logger.error(error_msg)
-            results["errors"].append(error_msg)
-            results["message"] = "Database operation failed"
+        Returns:
+            Tuple of (new_count, updated_count)
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for data_point in data_points:
+            writer.writerow((
+                data_point.year,
+                data_point.date.month,
+                data_point.value,
+                data_point.date.date().isoformat()
+            ))
+        buffer.seek(0)
         
+        cursor = db.connection().connection.cursor()
+        try:
+            cursor.execute(COPY_SEED_STAGING_SQL)
+            cursor.copy_expert(COPY_SEED_COPY_SQL, buffer)
+            cursor.execute(COPY_SEED_UPSERT_SQL, {"series_id": self.bls_service.CPI_SERIES_ID})
+            inserted_flags = [row[0] for row in cursor.fetchall()]
+            cursor.execute("DROP TABLE cpi_data_staging")
         finally:
-            db.close()
+            cursor.close()
         
-        return results
+        new_count = sum(1 for inserted in inserted_flags if inserted)
+        return new_count, len(inserted_flags) - new_count
+    
+    def get_existing_records_by_period(self, db: Session) -> Dict[Tuple[int, int], CPIData]:
+        """
+        Load existing US records for the CPI series, keyed by (year, month).
+        
+        Args:
+            db: Database session
+            
+        Returns:
+            Dictionary of (year, month) to CPIData record
+        """
+        records = db.query(CPIData).filter(
+            and_(
+                CPIData.series_id == self.bls_service.CPI_SERIES_ID,
+                CPIData.region == "US"
+            )
+        ).all()
+        return {(record.year, record.month): record for record in records}
     
-    def store_cpi_data_point(self, db: Session, data_point: CPIDataPoint) -> Tuple[Optional[CPIData], bool]:
+    def store_cpi_data_point(
+        self,
+        db: Session,
+        data_point: CPIDataPoint,
+        existing_records: Optional[Dict[Tuple[int, int], CPIData]] = None,
+        updated_at: Optional[datetime] = None
+    ) -> Tuple[Optional[CPIData], bool]:
         """
         Store a single CPI data point in the database.
         
         Args:
             db: Database session
             data_point: CPI data point from BLS API
+            existing_records: Preloaded records by (year, month); loaded if not given.
+                New records are added to it.
+            updated_at: Timestamp for updated records; defaults to now.
             
         Returns:
             CPIData record (new or updated)
         """
+        if existing_records is None:
+            existing_records = self.get_existing_records_by_period(db)
+        
         try:
             # Check if record already exists
-            existing_record = db.query(CPIData).filter(
-                and_(
-                    CPIData.year == data_point.year,
-                    CPIData.month == data_point.date.month,
-                    CPIData.series_id == self.bls_service.CPI_SERIES_ID,
-                    CPIData.region == "US"
-                )
-            ).first()
+            period = (data_point.year, data_point.date.month)
+            existing_record = existing_records.get(period)
+            cpi_value = round(data_point.value, 3)
             
             if existing_record:
                 # Update existing record
-                existing_record.cpi_value = Decimal(str(data_point.value))
+                existing_record.cpi_value = cpi_value
                 existing_record.reference_date = data_point.date.date()
-                existing_record.updated_at = datetime.now()
+                existing_record.updated_at = updated_at or datetime.now()
                 
                 logger.debug(f"Updated existing CPI record for {data_point.date.strftime('%Y-%m')}")
                 return existing_record, False
@@ -165,8 +463,8 @@ class CPIDataService:
                 new_record = CPIData(
                     year=data_point.year,
                     month=data_point.date.month,
-                    cpi_value=Decimal(str(data_point.value)),
-                    cpi_u_value=Decimal(str(data_point.value)),  # CUSR0000SA0 is CPI-U
+                    cpi_value=cpi_value,
+                    cpi_u_value=cpi_value,  # CUSR0000SA0 is CPI-U
                     reference_date=data_point.date.date(),
                     data_source="BLS",
                     series_id=self.bls_service.CPI_SERIES_ID,
@@ -177,59 +475,150 @@ class CPIDataService:
                 )
                 
                 db.add(new_record)
+                existing_records[period] = new_record
                 
                 logger.debug(f"Created new CPI record for {data_point.date.strftime('%Y-%m')}")
                 return new_record, True
                
-        except IntegrityError as e:
-            db.rollback()
-            logger.warning(f"Integrity error storing CPI data for {data_point.date}: {str(e)}")
-            return None, False
         except Exception as e:
             logger.error(f"Error storing CPI data point: {str(e)}")
             raise
     
-    def calculate_and_update_inflation_rates(self, db: Session):
-        """Calculate and update inflation rates for CPI records."""
+    def calculate_and_update_inflation_rates(self, db: Session, since: Optional[date] = None):
+        """
+        Calculate and update inflation rates for CPI records.
+        
+        Args:
+            db: Database session
+            since: Only update records from this month on; the twelve months
+                before it are read as the comparison window. Updates all
+                records if not given.
+        """
+        window_start = None
+        if since is not None:
+            since = since.replace(day=1)
+            window_start = date(since.year - 1, since.month, 1)
+        
+        if db.get_bind().dialect.name == 'postgresql':
+            self._update_inflation_rates_sql(db, since, window_start)
+            return
+        
         try:
-            # Get all records ordered by date
-            records = db.query(CPIData).filter(
-                CPIData.series_id == self.bls_service.CPI_SERIES_ID
-            ).order_by(CPIData.year, CPIData.month).all()
-            
-            if len(records) < 2:
-                return
-            
-            # Calculate month-over-month rates
-            for i in range(1, len(records)):
-                current_record = records[i]
-                previous_record = records[i - 1]
+            # Pending records from this transaction must be visible to the query
+            db.flush()
+            
+            # Stream (id, period, value) rows in the comparison window ordered by date
+            rows_filter = CPIData.series_id == self.bls_service.CPI_SERIES_ID
+            if window_start is not None:
+                rows_filter = and_(rows_filter, CPIData.reference_date >= window_start)
+            rows = db.execute(
+                select(
+                    CPIData.id,
+                    CPIData.year,
+                    CPIData.month,
+                    CPIData.cpi_value,
+                    CPIData.reference_date
+                ).where(rows_filter).order_by(CPIData.year, CPIData.month).execution_options(
+                    yield_per=self.INFLATION_RATE_BATCH_SIZE
+                )
+            )
+            
+            # Rates are stored as fractions rounded to the columns' 4-digit scale.
+            # Rows arrive in period order, so the previous month and the same
+            # month of the previous year have always been seen already.
+            values_by_period: Dict[Tuple[int, int], Optional[float]] = {}
+            previous_value = None
+            mappings = []
+            for row in rows:
+                value = float(row.cpi_value) if row.cpi_value else None
+                values_by_period[(row.year, row.month)] = value
+                mapping = {"id": row.id}
                 
-                if current_record.cpi_value and previous_record.cpi_value:
-                    monthly_rate = CPIData.calculate_inflation_rate(
-                        current_record.cpi_value,
-                        previous_record.cpi_value
+                # Month-over-month against the previous record
+                if value and previous_value:
+                    mapping["monthly_inflation_rate"] = round(
+                        (value - previous_value) / previous_value, 4
                     )
-                    current_record.monthly_inflation_rate = monthly_rate
-            
-            # Calculate year-over-year rates
-            for i, record in enumerate(records):
-                # Find record from 12 months ago
-                target_year = record.year - 1
-                target_month = record.month
                 
-                previous_year_record = next(
-                    (r for r in records 
-                     if r.year == target_year and r.month == target_month),
-                    None
-                )
-                
-                if previous_year_record and previous_year_record.cpi_value:
-                    annual_rate = CPIData.calculate_inflation_rate(
-                        record.cpi_value,
-                        previous_year_record.cpi_value
+                # Year-over-year against the value from 12 months ago
+                previous_year_value = values_by_period.get((row.year - 1, row.month))
+                if value and previous_year_value:
+                    mapping["annual_inflation_rate"] = round(
+                        (value - previous_year_value) / previous_year_value, 4
                     )
-                    record.annual_inflation_rate = annual_rate
+                
+                previous_value = value
+                
+                # Window rows before the cutoff are only read for comparison
+                if len(mapping) > 1 and (since is None or row.reference_date >= since):
+                    mappings.append(mapping)
+            
+            # One executemany per column set instead of per-instance dirty flushes
+            db.bulk_update_mappings(CPIData, mappings)
+            
+            logger.info("Updated inflation rates for CPI records")
+            
+        except Exception as e:
+            logger.error(f"Error calculating inflation rates: {str(e)}")
+            raise
+    
+    def _update_inflation_rates_sql(
+        self,
+        db: Session,
+        since: Optional[date] = None,
+        window_start: Optional[date] = None
+    ):
+        """
+        Calculate and update inflation rates in one UPDATE using window functions.
+        
+        Month-over-month compares each record to the previous one in the series;
+        year-over-year compares it to the same month of the previous year.
+        When since is given, the window functions only read records from
+        window_start on and only records from since on are updated.
+        """
+        try:
+            rates_filter = CPIData.series_id == self.bls_service.CPI_SERIES_ID
+            if window_start is not None:
+                rates_filter = and_(rates_filter, CPIData.reference_date >= window_start)
+            
+            rates = select(
+                CPIData.id,
+                CPIData.year,
+                CPIData.reference_date,
+                CPIData.cpi_value,
+                func.lag(CPIData.cpi_value).over(
+                    order_by=(CPIData.year, CPIData.month)
+                ).label("prev_month_value"),
+                func.lag(CPIData.cpi_value).over(
+                    partition_by=CPIData.month, order_by=CPIData.year
+                ).label("prev_year_value"),
+                func.lag(CPIData.year).over(
+                    partition_by=CPIData.month, order_by=CPIData.year
+                ).label("prev_year")
+            ).where(rates_filter).subquery("rates")
+            
+            target = CPIData.id == rates.c.id
+            if since is not None:
+                target = and_(target, rates.c.reference_date >= since)
+            
+            stmt = update(CPIData).where(target).values(
+                monthly_inflation_rate=case(
+                    (
+                        rates.c.prev_month_value.isnot(None),
+                        (rates.c.cpi_value - rates.c.prev_month_value) / rates.c.prev_month_value
+                    ),
+                    else_=CPIData.monthly_inflation_rate
+                ),
+                annual_inflation_rate=case(
+                    (
+                        rates.c.prev_year == rates.c.year - 1,
+                        (rates.c.cpi_value - rates.c.prev_year_value) / rates.c.prev_year_value
+                    ),
+                    else_=CPIData.annual_inflation_rate
+                )
+            ).execution_options(synchronize_session=False)
+            
+            db.execute(stmt)
             
             logger.info("Updated inflation rates for CPI records")
             
@@ -243,6 +632,18 @@ class CPIDataService:
             CPIData.series_id == self.bls_service.CPI_SERIES_ID
         ).order_by(desc(CPIData.year), desc(CPIData.month)).first()
     
+    def _has_current_month(self, db: Session) -> bool:
+        """Check whether a record exists for the current month or later."""
+        current_month_start = date.today().replace(day=1)
+        return db.execute(
+            select(literal(1)).where(
+                and_(
+                    CPIData.series_id == self.bls_service.CPI_SERIES_ID,
+                    CPIData.reference_date >= current_month_start
+                )
+            ).limit(1)
+        ).first() is not None
+    
     def get_total_records_count(self, db: Session) -> int:
         """Get total count of CPI records in database."""
         return db.query(CPIData).filter(
@@ -301,36 +702,35 @@ class CPIDataService:
         Returns:
             Inflation rate as decimal or None if insufficient data
         """
-        db = self.get_db_session()
-        try:
-            # Get CPI data closest to the requested dates
-            start_record = db.query(CPIData).filter(
+        def closest_on_or_before(bound: str, target: date):
+            closest = select(
+                literal(bound).label("bound"),
+                CPIData.cpi_value
+            ).where(
                 and_(
                     CPIData.series_id == self.bls_service.CPI_SERIES_ID,
-                    CPIData.reference_date <= start_date
+                    CPIData.reference_date <= target
                 )
-            ).order_by(desc(CPIData.reference_date)).first()
-            
-            end_record = db.query(CPIData).filter(
-                and_(
-                    CPIData.series_id == self.bls_service.CPI_SERIES_ID,
-                    CPIData.reference_date <= end_date
-                )
-            ).order_by(desc(CPIData.reference_date)).first()
-            
-            if not start_record or not end_record:
-                return None
-            
-            if start_record.cpi_value and end_record.cpi_value:
-                return CPIData.calculate_inflation_rate(
-                    end_record.cpi_value,
-                    start_record.cpi_value
+            ).order_by(desc(CPIData.reference_date)).limit(1).subquery()
+            return select(closest.c.bound, closest.c.cpi_value)
+        
+        with self.get_db_session() as db:
+            # Get CPI data closest to both requested dates in one round trip
+            rows = db.execute(
+                union_all(
+                    closest_on_or_before("start", start_date),
+                    closest_on_or_before("end", end_date)
                 )
-            
-            return None
-            
-        finally:
-            db.close()
+            ).all()
+        
+        cpi_values = {bound: cpi_value for bound, cpi_value in rows}
+        start_cpi = cpi_values.get("start")
+        end_cpi = cpi_values.get("end")
+        
+        if start_cpi and end_cpi:
+            return CPIData.calculate_inflation_rate(end_cpi, start_cpi)
+        
+        return None
     
     def get_current_vs_previous_year_inflation(self) -> Optional[Decimal]:
         """
@@ -339,26 +739,43 @@ class CPIDataService:
         Returns:
             Annual inflation rate as decimal or None if unavailable
         """
-        db = self.get_db_session()
-        try:
+        hit, annual_rate = self._get_cached("annual_inflation")
+        if hit:
+            return annual_rate
+        
+        annual_rate = self._load_current_vs_previous_year_inflation()
+        self._set_cached("annual_inflation", annual_rate)
+        return annual_rate
+    
+    def _load_current_vs_previous_year_inflation(self) -> Optional[Decimal]:
+        """Read the latest year-over-year inflation rate from the database."""
+        with self.get_db_session() as db:
             latest_record = self.get_latest_cpi_record(db)
             if latest_record and latest_record.annual_inflation_rate:
                 return latest_record.annual_inflation_rate
             
             return None
-            
-        finally:
-            db.close()
     
-    def get_data_freshness_status(self) -> Dict[str, Any]:
+    def get_data_freshness_status(self, db: Optional[Session] = None) -> Dict[str, Any]:
         """
         Get information about data freshness and coverage.
         
+        Args:
+            db: Database session (optional); left open for the caller
+            
         Returns:
             Dictionary with data freshness information
         """
-        db = self.get_db_session()
-        try:
+        hit, status = self._get_cached("freshness")
+        if not hit:
+            status = self._load_data_freshness_status(db)
+            self._set_cached("freshness", status)
+        
+        return dict(status)
+    
+    def _load_data_freshness_status(self, db: Optional[Session] = None) -> Dict[str, Any]:
+        """Read data freshness and coverage from the database."""
+        with self._session_scope(db) as db:
             latest_record = self.get_latest_cpi_record(db)
             total_records = self.get_total_records_count(db)
             
@@ -392,46 +809,75 @@ class CPIDataService:
                 "latest_cpi_value": float(latest_record.cpi_value) if latest_record.cpi_value else None,
                 "annual_inflation_rate": float(latest_record.annual_inflation_rate) if latest_record.annual_inflation_rate else None
             }
+    
+    def oldest_year(self, db: Optional[Session] = None) -> Optional[int]:
+        """
+        Get the earliest year stored for the CPI series.
+        
+        Args:
+            db: Database session (optional); left open for the caller
             
-        finally:
-            db.close()
+        Returns:
+            Earliest year, or None if there is no data
+        """
+        with self._session_scope(db) as db:
+            return db.execute(
+                select(func.min(CPIData.year)).where(
+                    CPIData.series_id == self.bls_service.CPI_SERIES_ID
+                )
+            ).scalar()
     
-    def cleanup_old_data(self, keep_years: int = 10) -> Dict[str, int]:
+    def cleanup_old_data(self, keep_years: int = 10, db: Optional[Session] = None) -> Dict[str, int]:
         """
         Clean up old CPI data beyond specified years.
         
         Args:
             keep_years: Number of years to keep
+            db: Database session (optional); left open for the caller
             
         Returns:
             Dictionary with cleanup results
         """
-        cutoff_year = datetime.now().year - keep_years
+        cutoff_year = datetime.now(timezone.utc).year - keep_years
+        
+        with self._session_scope(db) as db:
+            try:
+                # Range scan on the (series_id, year, month) index
+                deleted_count = db.execute(
+                    delete(CPIData).where(
+                        and_(
+                            CPIData.series_id == self.bls_service.CPI_SERIES_ID,
+                            CPIData.year < cutoff_year
+                        )
+                    ).execution_options(synchronize_session=False)
+                ).rowcount
+                
+                db.commit()
+                self.clear_cache()
+                
+                logger.info(f"Cleaned up {deleted_count} old CPI records (before {cutoff_year})")
+                
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Error during cleanup: {str(e)}")
+                raise
+        
+        if deleted_count >= self.VACUUM_THRESHOLD and engine.dialect.name == 'postgresql':
+            self._vacuum_cpi_data()
         
-        db = self.get_db_session()
+        return {
+            "deleted_count": deleted_count,
+            "cutoff_year": cutoff_year
+        }
+    
+    def _vacuum_cpi_data(self):
+        """Reclaim space and refresh planner statistics after a mass delete."""
         try:
-            deleted_count = db.query(CPIData).filter(
-                and_(
-                    CPIData.series_id == self.bls_service.CPI_SERIES_ID,
-                    CPIData.year < cutoff_year
-                )
-            ).delete()
-            
-            db.commit()
-            
-            logger.info(f"Cleaned up {deleted_count} old CPI records (before {cutoff_year})")
-            
-            return {
-                "deleted_count": deleted_count,
-                "cutoff_year": cutoff_year
-            }
-            
+            # VACUUM cannot run inside a transaction block
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                conn.execute(text("VACUUM (ANALYZE) cpi_data"))
         except Exception as e:
-            db.rollback()
-            logger.error(f"Error during cleanup: {str(e)}")
-            raise
-        finally:
-            db.close()
+            logger.warning(f"VACUUM after cleanup failed: {str(e)}")
 
 
 # Singleton instance for application use
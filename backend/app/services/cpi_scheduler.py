@@ -7,20 +7,25 @@ It provides both APScheduler-based background scheduling and manual execution ca
 
 import logging
 import asyncio
-from datetime import datetime, timedelta
+import itertools
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, nullcontext
 
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
+from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from apscheduler.executors.asyncio import AsyncIOExecutor
 from apscheduler.executors.pool import ThreadPoolExecutor
+from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.services.bls_service import bls_service, BLSAPIError
-from app.core.database import SessionLocal
+from app.services.cpi_data_service import cpi_data_service
+from app.core.database import SessionLocal, engine
 
 logger = logging.getLogger(__name__)
 
@@ -28,58 +33,88 @@ logger = logging.getLogger(__name__)
 class CPIScheduler:
     """Scheduler for automated CPI data collection and management."""
     
+    __slots__ = ('scheduler', 'is_running', '_run_counter', '_job_meta', '_scheduler_options')
+    
+    CRON_JITTER_SECONDS = 300  # Spread default jobs so instances don't hit BLS at once
+    
     def __init__(self):
         """Initialize the CPI scheduler."""
-        self.scheduler: Optional[BackgroundScheduler] = None
         self.is_running = False
         
-        # Job store configuration (stores jobs in database)
+        # Monotonic run ids; log timestamps already record when a run started
+        self._run_counter = itertools.count(1)
+        
+        # Status snapshot per job id, kept current on add/remove/run events
+        self._job_meta: Dict[str, Dict[str, Any]] = {}
+        
+        # Job store configuration: the default jobs are recreated on every
+        # start, so they live in memory; only custom jobs that must survive a
+        # restart are stored in the database, sharing the application's
+        # pooled engine instead of building a second one
         jobstores = {
-            'default': SQLAlchemyJobStore(url=str(settings.SQLALCHEMY_DATABASE_URI))
+            'default': MemoryJobStore(),
+            'persistent': SQLAlchemyJobStore(engine=engine)
         }
         
-        # Executor configuration
+        # Executor configuration: I/O-bound coroutine jobs run directly on the
+        # event loop; long database work gets its own small thread pool so it
+        # cannot hold up the BLS fetches
         executors = {
-            'default': ThreadPoolExecutor(10),
+            'io': AsyncIOExecutor(),
+            'compute': ThreadPoolExecutor(4),
         }
         
         # Job defaults
         job_defaults = {
-            'coalesce': False,
+            'coalesce': True,  # One makeup run for any number of missed runs
             'max_instances': 1,
             'misfire_grace_time': 300  # 5 minutes
         }
         
-        self.scheduler = BackgroundScheduler(
-            jobstores=jobstores,
-            executors=executors,
-            job_defaults=job_defaults,
-            timezone='UTC'
-        )
+        self._scheduler_options = {
+            'jobstores': jobstores,
+            'executors': executors,
+            'job_defaults': job_defaults,
+            'timezone': 'UTC'
+        }
+        self.scheduler: AsyncIOScheduler = AsyncIOScheduler(**self._scheduler_options)
         
         # Add event listeners
         self.scheduler.add_listener(self._job_executed_listener, EVENT_JOB_EXECUTED)
         self.scheduler.add_listener(self._job_error_listener, EVENT_JOB_ERROR)
     
-    def start(self) -> bool:
+    def start(self, event_loop: Optional[asyncio.AbstractEventLoop] = None) -> bool:
         """
         Start the scheduler.
         
+        Jobs run on event_loop if given, so start can be called from a worker
+        thread (see scheduler_lifespan); otherwise it must be called from the
+        event loop the jobs should run on.
+        
+        Args:
+            event_loop: Event loop to run jobs on (optional)
+            
         Returns:
             True if scheduler started successfully, False otherwise
         """
         try:
-            if self.scheduler and not self.is_running:
+            if not self.is_running:
+                if event_loop is not None:
+                    self.scheduler.configure(event_loop=event_loop, **self._scheduler_options)
                 self.scheduler.start()
                 self.is_running = True
                 logger.info("CPI scheduler started successfully")
                 
+                # Include custom jobs persisted by earlier runs in the status snapshot
+                for job in self.scheduler.get_jobs(jobstore='persistent'):
+                    self._record_job_meta(job)
+                
                 # Schedule default jobs
                 self._schedule_default_jobs()
                 
                 return True
             else:
-                logger.warning("Scheduler already running or not initialized")
+                logger.warning("Scheduler already running")
                 return False
                 
         except Exception as e:
@@ -94,13 +129,18 @@ class CPIScheduler:
             True if scheduler stopped successfully, False otherwise
         """
         try:
-            if self.scheduler and self.is_running:
+            if self.is_running:
                 self.scheduler.shutdown(wait=True)
                 self.is_running = False
+                self._job_meta.clear()
+                
+                # Fetch jobs share the BLS client's keep-alive connections
+                # between runs; release them with the scheduler
+                bls_service.close()
                 logger.info("CPI scheduler stopped successfully")
                 return True
             else:
-                logger.warning("Scheduler not running or not initialized")
+                logger.warning("Scheduler not running")
                 return False
                 
         except Exception as e:
@@ -112,43 +152,47 @@ class CPIScheduler:
         try:
             # Monthly CPI data update - 15th of each month at 10:00 AM UTC
             # BLS typically releases CPI data mid-month
-            self.scheduler.add_job(
+            self._add_job(
                 func=self._fetch_cpi_data_job,
-                trigger=CronTrigger(day=15, hour=10, minute=0),
+                trigger=CronTrigger(day=15, hour=10, minute=0, jitter=self.CRON_JITTER_SECONDS),
                 id='monthly_cpi_update',
                 name='Monthly CPI Data Update',
+                executor='io',
                 replace_existing=True,
                 kwargs={'force_refresh': True}
             )
             
             # Weekly data check - every Sunday at 2:00 AM UTC
             # Check for any missed updates or late releases
-            self.scheduler.add_job(
+            self._add_job(
                 func=self._fetch_cpi_data_job,
-                trigger=CronTrigger(day_of_week=6, hour=2, minute=0),
+                trigger=CronTrigger(day_of_week=6, hour=2, minute=0, jitter=self.CRON_JITTER_SECONDS),
                 id='weekly_cpi_check',
                 name='Weekly CPI Data Check',
+                executor='io',
                 replace_existing=True,
                 kwargs={'force_refresh': False}
             )
             
             # Daily health check - every day at 1:00 AM UTC
             # Check data freshness and system health
-            self.scheduler.add_job(
+            self._add_job(
                 func=self._health_check_job,
-                trigger=CronTrigger(hour=1, minute=0),
+                trigger=CronTrigger(hour=1, minute=0, jitter=self.CRON_JITTER_SECONDS),
                 id='daily_health_check',
                 name='Daily CPI Data Health Check',
+                executor='io',
                 replace_existing=True
             )
             
             # Monthly cleanup - first day of month at 3:00 AM UTC
             # Clean up old data beyond retention period
-            self.scheduler.add_job(
+            self._add_job(
                 func=self._cleanup_job,
-                trigger=CronTrigger(day=1, hour=3, minute=0),
+                trigger=CronTrigger(day=1, hour=3, minute=0, jitter=self.CRON_JITTER_SECONDS),
                 id='monthly_cleanup',
                 name='Monthly Data Cleanup',
+                executor='compute',
                 replace_existing=True
             )
             
@@ -157,73 +201,69 @@ class CPIScheduler:
         except Exception as e:
             logger.error(f"Failed to schedule default jobs: {str(e)}")
     
-    def _fetch_cpi_data_job(self, force_refresh: bool = False) -> Dict[str, Any]:
+    async def _fetch_cpi_data_job(
+        self,
+        force_refresh: bool = False,
+        session: Optional[Session] = None
+    ) -> Dict[str, Any]:
         """
         Scheduled job to fetch CPI data.
         
         Args:
             force_refresh: Whether to force data refresh regardless of freshness
+            session: Database session to reuse (optional)
             
         Returns:
             Dictionary with job execution results
         """
-        job_id = f"cpi_fetch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        job_id = f"cpi_fetch_{next(self._run_counter)}"
         logger.info(f"Starting CPI data fetch job: {job_id}")
         
-        try:
-            # Import here to avoid circular imports
-            from app.services.cpi_data_service import cpi_data_service
-            
-            # Execute the data fetch and store operation
-            results = cpi_data_service.fetch_and_store_latest_data(force_refresh=force_refresh)
-            
-            # Log results
-            if results.get('success'):
-                logger.info(f"CPI data fetch completed successfully: {results['message']}")
-                logger.info(f"New records: {results['new_records']}, Updated: {results['updated_records']}")
-            else:
-                logger.warning(f"CPI data fetch completed with issues: {results['message']}")
-                if results.get('errors'):
-                    for error in results['errors']:
-                        logger.error(f"  Error: {error}")
-            
-            return {
-                'job_id': job_id,
-                'success': results.get('success', False),
-                'message': results.get('message', 'Unknown status'),
-                'new_records': results.get('new_records', 0),
-                'updated_records': results.get('updated_records', 0),
-                'total_records': results.get('total_records', 0),
-                'latest_date': results.get('latest_date'),
-                'errors': results.get('errors', [])
-            }
-            
-        except Exception as e:
-            error_msg = f"CPI data fetch job failed: {str(e)}"
-            logger.error(error_msg)
-            return {
-                'job_id': job_id,
-                'success': False,
-                'message': error_msg,
-                'errors': [str(e)]
-            }
+        # Execute the data fetch and store operation off the event loop
+        results = await asyncio.to_thread(
+            cpi_data_service.fetch_and_store_latest_data,
+            force_refresh=force_refresh,
+            db=session
+        )
+        
+        # Log results
+        if results.get('success'):
+            logger.info(f"CPI data fetch completed successfully: {results['message']}")
+            logger.info(f"New records: {results['new_records']}, Updated: {results['updated_records']}")
+        else:
+            logger.warning(f"CPI data fetch completed with issues: {results['message']}")
+            if results.get('errors'):
+                for error in results['errors']:
+                    logger.error(f"  Error: {error}")
+        
+        return {
+            'job_id': job_id,
+            'success': results.get('success', False),
+            'message': results.get('message', 'Unknown status'),
+            'new_records': results.get('new_records', 0),
+            'updated_records': results.get('updated_records', 0),
+            'total_records': results.get('total_records', 0),
+            'latest_date': results.get('latest_date'),
+            'errors': results.get('errors', [])
+        }
     
-    def _health_check_job(self) -> Dict[str, Any]:
+    async def _health_check_job(self) -> Dict[str, Any]:
         """
         Scheduled job to check CPI data health and freshness.
         
+        The freshness read and an inline refresh share one database session.
+        
         Returns:
             Dictionary with health check results
         """
-        job_id = f"health_check_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        job_id = f"health_check_{next(self._run_counter)}"
         logger.info(f"Starting CPI data health check: {job_id}")
         
-        try:
-            # Import here to avoid circular imports
-            from app.services.cpi_data_service import cpi_data_service
-            
+        with SessionLocal() as session:
             # Get data freshness status
-            freshness_status = cpi_data_service.get_data_freshness_status()
+            freshness_status = await asyncio.to_thread(
+                cpi_data_service.get_data_freshness_status, session
+            )
             
             # Check if data needs updating
             if freshness_status.get('needs_update', True):
@@ -232,15 +272,32 @@ class CPIScheduler:
                 # Attempt automatic update if data is very stale
                 if freshness_status.get('days_since_latest', 0) > 45:  # More than 45 days old
                     logger.info("Attempting automatic CPI data update due to stale data")
-                    update_results = self._fetch_cpi_data_job(force_refresh=True)
-                    
-                    return {
+                    result = {
                         'job_id': job_id,
                         'success': True,
                         'message': 'Health check triggered automatic update',
-                        'freshness_status': freshness_status,
-                        'update_results': update_results
+                        'freshness_status': freshness_status
                     }
+                    
+                    if self.is_running:
+                        # Run the refresh as its own one-shot job so the health
+                        # check returns without waiting for it
+                        update_job = self._add_job(
+                            func=self._fetch_cpi_data_job,
+                            trigger='date',
+                            id=f'auto_refresh_{job_id}',
+                            name='Automatic CPI Data Refresh',
+                            executor='io',
+                            replace_existing=True,
+                            kwargs={'force_refresh': True}
+                        )
+                        result['update_job_id'] = update_job.id
+                    else:
+                        result['update_results'] = await self._fetch_cpi_data_job(
+                            force_refresh=True, session=session
+                        )
+                    
+                    return result
             else:
                 logger.info(f"CPI data is current - last update: {freshness_status.get('latest_date', 'unknown')}")
             
@@ -250,67 +307,109 @@ class CPIScheduler:
                 'message': 'Health check completed successfully',
                 'freshness_status': freshness_status
             }
-            
-        except Exception as e:
-            error_msg = f"CPI health check job failed: {str(e)}"
-            logger.error(error_msg)
-            return {
-                'job_id': job_id,
-                'success': False,
-                'message': error_msg,
-                'errors': [str(e)]
-            }
     
-    def _cleanup_job(self) -> Dict[str, Any]:
+    def _cleanup_job(self, session: Optional[Session] = None) -> Dict[str, Any]:
         """
         Scheduled job to clean up old CPI data.
         
+        Runs on the 'compute' thread pool, so it stays synchronous.
+        
+        Args:
+            session: Database session to reuse (optional)
+            
         Returns:
             Dictionary with cleanup results
         """
-        job_id = f"cleanup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        job_id = f"cleanup_{next(self._run_counter)}"
         logger.info(f"Starting CPI data cleanup: {job_id}")
         
-        try:
-            # Import here to avoid circular imports
-            from app.services.cpi_data_service import cpi_data_service
-            
-            # Clean up data older than 10 years
-            cleanup_results = cpi_data_service.cleanup_old_data(keep_years=10)
-            
-            deleted_count = cleanup_results.get('deleted_count', 0)
-            if deleted_count > 0:
-                logger.info(f"Cleaned up {deleted_count} old CPI records")
+        keep_years = 10
+        cutoff_year = datetime.now(timezone.utc).year - keep_years
+        
+        with (nullcontext(session) if session is not None else SessionLocal()) as session:
+            # Skip the DELETE when nothing is older than the cutoff, the
+            # usual case once the retained history is stable
+            oldest_year = cpi_data_service.oldest_year(session)
+            if oldest_year is None or oldest_year >= cutoff_year:
+                cleanup_results = {'deleted_count': 0, 'cutoff_year': cutoff_year}
             else:
-                logger.info("No old CPI records found for cleanup")
-            
-            return {
-                'job_id': job_id,
-                'success': True,
-                'message': f'Cleanup completed - deleted {deleted_count} records',
-                'deleted_count': deleted_count,
-                'cutoff_year': cleanup_results.get('cutoff_year')
-            }
-            
-        except Exception as e:
-            error_msg = f"CPI cleanup job failed: {str(e)}"
-            logger.error(error_msg)
-            return {
-                'job_id': job_id,
-                'success': False,
-                'message': error_msg,
-                'errors': [str(e)]
-            }
+                # Clean up data older than 10 years
+                cleanup_results = cpi_data_service.cleanup_old_data(keep_years=keep_years, db=session)
+        
+        deleted_count = cleanup_results.get('deleted_count', 0)
+        if deleted_count > 0:
+            logger.info(f"Cleaned up {deleted_count} old CPI records")
+        else:
+            logger.info("No old CPI records found for cleanup")
+        
+        return {
+            'job_id': job_id,
+            'success': True,
+            'message': f'Cleanup completed - deleted {deleted_count} records',
+            'deleted_count': deleted_count,
+            'cutoff_year': cleanup_results.get('cutoff_year')
+        }
+    
+    def _add_job(self, **job_kwargs):
+        """Add a job to the scheduler and record its status snapshot."""
+        job = self.scheduler.add_job(**job_kwargs)
+        self._record_job_meta(job)
+        return job
+    
+    def _record_job_meta(self, job):
+        """Store the status fields reported by get_job_status for a job."""
+        self._job_meta[job.id] = {
+            'id': job.id,
+            'name': job.name,
+            'next_run_time': job.next_run_time.isoformat() if job.next_run_time else None,
+            'trigger': str(job.trigger),
+            'func_name': job.func.__name__ if hasattr(job.func, '__name__') else str(job.func)
+        }
+    
+    def _refresh_job_meta(self, job_id: str):
+        """Re-read one job after it ran; finished one-shot jobs are dropped."""
+        job = self.scheduler.get_job(job_id)
+        if job is None:
+            self._job_meta.pop(job_id, None)
+        else:
+            self._record_job_meta(job)
     
     def _job_executed_listener(self, event):
         """Event listener for successful job execution."""
-        logger.info(f"Job {event.job_id} executed successfully")
+        logger.info(
+            f"Job {event.job_id} executed successfully "
+            f"(scheduled {event.scheduled_run_time.isoformat() if event.scheduled_run_time else 'manually'})"
+        )
+        self._refresh_job_meta(event.job_id)
     
     def _job_error_listener(self, event):
-        """Event listener for job execution errors."""
-        logger.error(f"Job {event.job_id} failed: {event.exception}")
+        """
+        Event listener for job execution errors.
+        
+        Scheduled jobs let exceptions propagate, so this is the single place
+        their failures are logged.
+        """
+        logger.error(
+            f"Job {event.job_id} failed: {event.exception}",
+            extra={
+                'job_id': event.job_id,
+                'scheduled_run_time': event.scheduled_run_time.isoformat() if event.scheduled_run_time else None,
+                'traceback': event.traceback
+            }
+        )
+        self._refresh_job_meta(event.job_id)
+    
+    def _manual_failure(self, description: str, error: Exception) -> Dict[str, Any]:
+        """Build the result of a manually executed job that raised."""
+        error_msg = f"{description} failed: {str(error)}"
+        logger.error(error_msg)
+        return {
+            'success': False,
+            'message': error_msg,
+            'errors': [str(error)]
+        }
     
-    def execute_manual_fetch(self, force_refresh: bool = True) -> Dict[str, Any]:
+    async def execute_manual_fetch(self, force_refresh: bool = True) -> Dict[str, Any]:
         """
         Manually execute CPI data fetch (outside of scheduled jobs).
         
@@ -321,9 +420,12 @@ class CPIScheduler:
             Dictionary with execution results
         """
         logger.info("Executing manual CPI data fetch")
-        return self._fetch_cpi_data_job(force_refresh=force_refresh)
+        try:
+            return await self._fetch_cpi_data_job(force_refresh=force_refresh)
+        except Exception as e:
+            return self._manual_failure("CPI data fetch job", e)
     
-    def execute_manual_health_check(self) -> Dict[str, Any]:
+    async def execute_manual_health_check(self) -> Dict[str, Any]:
         """
         Manually execute health check (outside of scheduled jobs).
         
@@ -331,9 +433,12 @@ class CPIScheduler:
             Dictionary with health check results
         """
         logger.info("Executing manual CPI health check")
-        return self._health_check_job()
+        try:
+            return await self._health_check_job()
+        except Exception as e:
+            return self._manual_failure("CPI health check job", e)
     
-    def execute_manual_cleanup(self) -> Dict[str, Any]:
+    async def execute_manual_cleanup(self) -> Dict[str, Any]:
         """
         Manually execute cleanup (outside of scheduled jobs).
         
@@ -341,7 +446,10 @@ class CPIScheduler:
             Dictionary with cleanup results
         """
         logger.info("Executing manual CPI cleanup")
-        return self._cleanup_job()
+        try:
+            return await asyncio.to_thread(self._cleanup_job)
+        except Exception as e:
+            return self._manual_failure("CPI cleanup job", e)
     
     def get_job_status(self) -> Dict[str, Any]:
         """
@@ -350,22 +458,13 @@ class CPIScheduler:
         Returns:
             Dictionary with scheduler and job status information
         """
-        if not self.scheduler:
-            return {
-                'scheduler_running': False,
-                'jobs': [],
-                'message': 'Scheduler not initialized'
-            }
+        # Served from the in-memory snapshot; the job stores are only read
+        # when nothing has been recorded yet
+        if not self._job_meta:
+            for job in self.scheduler.get_jobs():
+                self._record_job_meta(job)
         
-        jobs_info = []
-        for job in self.scheduler.get_jobs():
-            jobs_info.append({
-                'id': job.id,
-                'name': job.name,
-                'next_run_time': job.next_run_time.isoformat() if job.next_run_time else None,
-                'trigger': str(job.trigger),
-                'func_name': job.func.__name__ if hasattr(job.func, '__name__') else str(job.func)
-            })
+        jobs_info = [dict(meta) for meta in self._job_meta.values()]
         
         return {
             'scheduler_running': self.is_running,
@@ -377,6 +476,8 @@ class CPIScheduler:
         self, 
         job_id: str, 
         schedule_type: str = 'cron',
+        executor: str = 'io',
+        persistent: bool = False,
         **schedule_kwargs
     ) -> bool:
         """
@@ -385,29 +486,58 @@ class CPIScheduler:
         Args:
             job_id: Unique identifier for the job
             schedule_type: Type of schedule ('cron' or 'interval')
-            **schedule_kwargs: Schedule configuration parameters
+            executor: Executor to run the job on; the fetch job is a coroutine,
+                so only the asyncio 'io' executor is accepted
+            persistent: Store the job in the database so it survives restarts
+            **schedule_kwargs: Schedule configuration parameters; intervals shorter
+                than CPI_MIN_JOB_INTERVAL_SECONDS and sub-minute cron schedules are rejected
             
         Returns:
             True if job added successfully, False otherwise
         """
         try:
-            if not self.scheduler or not self.is_running:
+            if not self.is_running:
                 logger.error("Scheduler not running")
                 return False
             
+            # The thread pool would call the coroutine function and drop the
+            # coroutine without awaiting it, so the fetch would never run
+            if executor != 'io':
+                logger.error(
+                    f"Rejected custom job '{job_id}': the CPI fetch job is a coroutine "
+                    f"and must run on the 'io' executor, not '{executor}'"
+                )
+                return False
+            
+            min_interval = settings.CPI_MIN_JOB_INTERVAL_SECONDS
+            
             if schedule_type == 'cron':
+                # A seconds field other than 0 fires several times a minute
+                if str(schedule_kwargs.get('second', 0)) != '0':
+                    logger.error(f"Rejected custom job '{job_id}': cron schedules must fire on the minute")
+                    return False
                 trigger = CronTrigger(**schedule_kwargs)
             elif schedule_type == 'interval':
                 trigger = IntervalTrigger(**schedule_kwargs)
+                if trigger.interval.total_seconds() < min_interval:
+                    logger.error(
+                        f"Rejected custom job '{job_id}': interval is below the "
+                        f"{min_interval}s minimum"
+                    )
+                    return False
             else:
                 logger.error(f"Unsupported schedule type: {schedule_type}")
                 return False
             
-            self.scheduler.add_job(
-                func=self._fetch_cpi_data_job,
+            # Persisted jobs need a module-level callable that can be
+            # serialized by reference; bound methods cannot
+            self._add_job(
+                func=run_scheduled_fetch if persistent else self._fetch_cpi_data_job,
                 trigger=trigger,
                 id=job_id,
                 name=f'Custom CPI Job: {job_id}',
+                executor=executor,
+                jobstore='persistent' if persistent else 'default',
                 replace_existing=True,
                 kwargs={'force_refresh': False}
             )
@@ -430,11 +560,12 @@ class CPIScheduler:
             True if job removed successfully, False otherwise
         """
         try:
-            if not self.scheduler or not self.is_running:
+            if not self.is_running:
                 logger.error("Scheduler not running")
                 return False
             
             self.scheduler.remove_job(job_id)
+            self._job_meta.pop(job_id, None)
             logger.info(f"Job '{job_id}' removed successfully")
             return True
             
@@ -447,15 +578,23 @@ class CPIScheduler:
 cpi_scheduler = CPIScheduler()
 
 
+async def run_scheduled_fetch(force_refresh: bool = False) -> Dict[str, Any]:
+    """Run the CPI fetch job on the global scheduler (entry point for persisted jobs)."""
+    return await cpi_scheduler._fetch_cpi_data_job(force_refresh=force_refresh)
+
+
 @asynccontextmanager
 async def scheduler_lifespan():
     """
     Context manager for scheduler lifecycle management.
     Use this in FastAPI lifespan events.
+    
+    Start and stop run in a worker thread so job store setup (table creation,
+    loading persisted jobs) does not block the event loop; jobs still run on it.
     """
     try:
         # Start scheduler
-        success = cpi_scheduler.start()
+        success = await asyncio.to_thread(cpi_scheduler.start, asyncio.get_running_loop())
         if success:
             logger.info("CPI scheduler started during application startup")
         else:
@@ -465,7 +604,7 @@ async def scheduler_lifespan():
         
     finally:
         # Stop scheduler
-        success = cpi_scheduler.stop()
+        success = await asyncio.to_thread(cpi_scheduler.stop)
         if success:
             logger.info("CPI scheduler stopped during application shutdown")
         else:
@@ -4,29 +4,89 @@ Handles sending raise request letters via email with PDF attachments
 """
 
 import asyncio
-import smtplib
+import base64
 import ssl
-from datetime import datetime
-from email.mime.application import MIMEApplication
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from concurrent.futures import Executor, Future
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timezone
+from email.message import EmailMessage, MIMEPart
+from email.policy import SMTP as SMTP_POLICY
+from email.utils import make_msgid
+from functools import lru_cache
+from html import escape
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Tuple, Union, Any, AsyncIterator
 from dataclasses import dataclass
 from enum import Enum
 
 import aiofiles
 import aiosmtplib
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import DictLoader, Environment, Template, TemplateError, select_autoescape
 from pydantic import BaseModel, EmailStr, Field
 
 from app.core.config import settings
 from app.core.logging import get_logger
-from app.services.pdf_service import PDFService
+from app.services.pdf_service import PDFService, render_letter_pdf_file
 from app.services.openai_service import RaiseLetterResponse
 
 logger = get_logger(__name__)
 
+# Characters replaced with "_" in attachment filenames built from user names
+_FILENAME_SAFE = str.maketrans({c: '_' for c in ' /\\:*?"<>|'})
+
+# Static fragments of the fallback emails used when a template fails to render
+_FALLBACK_HTML_PREFIX = """
+        <html>
+        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+            <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
+                <h2 style="color: #2563eb;">Salary Adjustment Request</h2>
+                """
+_FALLBACK_HTML_GREETING = """
+                <p>Dear {},</p>
+                """
+_FALLBACK_HTML_CUSTOM_MESSAGE = """
+                <p><em>{}</em></p>
+                """
+_FALLBACK_HTML_LETTER = """
+                <div style="background: #f9fafb; padding: 20px; border-radius: 8px; margin: 20px 0;">
+                    <pre style="white-space: pre-wrap; font-family: Georgia, serif;">{}</pre>
+                </div>
+                """
+_FALLBACK_HTML_PDF_NOTE = """
+                <p><strong>Note:</strong> This email includes a PDF attachment with the formal letter.</p>
+                """
+_FALLBACK_HTML_SUFFIX = """
+                <hr style="margin: 30px 0; border: none; border-top: 1px solid #e5e7eb;">
+                
+                <p style="font-size: 12px; color: #6b7280;">
+                    This letter was generated using WageLift, an AI-powered salary analysis platform.<br>
+                    Sent on {}
+                </p>
+            </div>
+        </body>
+        </html>
+        """
+_FALLBACK_TEXT_PDF_NOTE = (
+    "Note: This email includes a PDF attachment with the formal letter.",
+    ""
+)
+_FALLBACK_TEXT_FOOTER = (
+    "---",
+    "This letter was generated using WageLift, an AI-powered salary analysis platform."
+)
+
+
+@lru_cache(maxsize=1)
+def _format_sent_date(day: date) -> str:
+    """Format the "sent on" date shown in emails; cached for the current day"""
+    return day.strftime("%B %d, %Y")
+
+
+def _discard_pdf_file(job: Future) -> None:
+    """Remove a rendered PDF temp file that was never attached to a message"""
+    if not job.cancelled() and job.exception() is None:
+        Path(job.result()).unlink(missing_ok=True)
+
 
 class EmailProvider(str, Enum):
     """Available email providers"""
@@ -42,12 +102,48 @@ class EmailPriority(str, Enum):
     HIGH = "high"
 
 
+def _encode_base64(content: bytes) -> str:
+    """Base64-encode attachment content for the MIME transfer encoding"""
+    return base64.encodebytes(content).decode('ascii')
+
+
+# Read size when streaming attachments from disk; a multiple of 57 bytes
+# so every chunk encodes to whole 76-character base64 lines
+_ATTACHMENT_CHUNK_SIZE = 57 * 1024
+
+
+async def _encode_file_base64(path: Path) -> str:
+    """Base64-encode a file chunk by chunk instead of reading it whole"""
+    encoded = []
+    async with aiofiles.open(path, 'rb') as f:
+        while chunk := await f.read(_ATTACHMENT_CHUNK_SIZE):
+            encoded.append(base64.encodebytes(chunk).decode('ascii'))
+    return "".join(encoded)
+
+
 @dataclass
 class EmailAttachment:
-    """Email attachment data"""
+    """Email attachment data, held in memory or read from path at send time"""
     filename: str
-    content: bytes
+    content: bytes = b""
     content_type: str = "application/pdf"
+    encoded_b64: Optional[str] = None
+    path: Optional[Path] = None
+    
+    @classmethod
+    def from_bytes(
+        cls,
+        content: bytes,
+        filename: str,
+        content_type: str = "application/pdf"
+    ) -> "EmailAttachment":
+        """Create an attachment with its base64 transfer encoding precomputed"""
+        return cls(
+            filename=filename,
+            content=content,
+            content_type=content_type,
+            encoded_b64=_encode_base64(content)
+        )
 
 
 @dataclass
@@ -108,10 +204,18 @@ class EmailService:
     with PDF attachments and professional templates.
     """
     
+    # Delivery attempts for transient SMTP failures, and the first retry delay
+    SMTP_SEND_ATTEMPTS = 3
+    SMTP_RETRY_BACKOFF_SECONDS = 0.5
+    
     def __init__(self):
         """Initialize email service with configuration"""
         self.provider = self._determine_provider()
         self.pdf_service = PDFService()
+        
+        # Process pool for PDF rendering, attached at app startup; when unset
+        # PDFs are rendered inline on the event loop
+        self.pdf_executor: Optional[Executor] = None
         self.template_env = self._setup_templates()
         
         # Email configuration
@@ -125,6 +229,20 @@ class EmailService:
         
         self.sender_email = settings.EMAILS_FROM_EMAIL
         self.sender_name = settings.EMAILS_FROM_NAME or "WageLift Platform"
+        # Fixed Message-ID domain; make_msgid() would otherwise resolve the FQDN per email
+        self._msgid_domain = str(self.sender_email).rpartition('@')[2] if self.sender_email else "localhost"
+        
+        # TLS settings shared by every SMTP connection, so CA certificates are
+        # loaded once rather than on each (re)connect
+        self._ssl_context = ssl.create_default_context()
+        self._ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+        
+        # Idle SMTP connections, opened on demand and returned after each send
+        self._smtp_pool: List[aiosmtplib.SMTP] = []
+        self._send_sem = asyncio.Semaphore(settings.SMTP_CONCURRENCY)
+        
+        # Settings are fixed for the process lifetime, so validate them once
+        self.is_configured = self._check_configuration()
         
     def _determine_provider(self) -> EmailProvider:
         """Determine which email provider to use based on configuration"""
@@ -135,14 +253,35 @@ class EmailService:
             return EmailProvider.SMTP
     
     def _setup_templates(self) -> Environment:
-        """Setup Jinja2 template environment"""
+        """Setup Jinja2 template environment and compile the email templates once"""
         template_dir = Path(__file__).parent.parent / "templates" / "email"
-        template_dir.mkdir(parents=True, exist_ok=True)
         
-        return Environment(
-            loader=FileSystemLoader(template_dir),
-            autoescape=select_autoescape(['html', 'xml'])
+        # Read the template sources once so rendering never touches the filesystem
+        sources = {
+            path.name: path.read_text(encoding='utf-8')
+            for pattern in ("*.html", "*.txt")
+            for path in template_dir.glob(pattern)
+        }
+        
+        env = Environment(
+            loader=DictLoader(sources),
+            autoescape=select_autoescape(['html', 'xml']),
+            auto_reload=False,
+            cache_size=-1
         )
+        
+        self._html_template = self._load_template(env, 'raise_letter_email.html')
+        self._text_template = self._load_template(env, 'raise_letter_email.txt')
+        
+        return env
+    
+    def _load_template(self, env: Environment, name: str) -> Optional[Template]:
+        """Compile a template, or return None so rendering uses the fallback"""
+        try:
+            return env.get_template(name)
+        except TemplateError as e:
+            logger.warning("Failed to load email template, using fallback", template=name, error=str(e))
+            return None
     
     async def send_raise_letter_email(
         self, 
@@ -162,6 +301,9 @@ class EmailService:
         Raises:
             EmailServiceError: If email sending fails
         """
+        pdf_job = None
+        pdf_future = None
+        pdf_path = None
         try:
             # Prepare recipients
             recipients = [
@@ -182,27 +324,40 @@ class EmailService:
                     )
                 )
             
-            # Generate email content
-            html_body = await self._generate_email_html(request, letter_response)
-            text_body = await self._generate_email_text(request, letter_response)
-            
-            # Generate PDF attachment if requested
-            attachments = []
-            if request.include_pdf:
-                pdf_content = await self.pdf_service.generate_letter_pdf(
+            # Start the PDF before rendering the bodies so the two can overlap.
+            # Worker processes write it to a temp file that is streamed into
+            # the message, so the PDF bytes never pass through this process.
+            pdf_to_file = request.include_pdf and self.pdf_executor is not None
+            if pdf_to_file:
+                pdf_job = self.pdf_executor.submit(
+                    render_letter_pdf_file,
                     letter_response.letter_content,
                     request.subject_line,
                     request.user_name
                 )
-                
-                attachments.append(
-                    EmailAttachment(
-                        filename=f"raise_request_{request.user_name.replace(' ', '_')}.pdf",
-                        content=pdf_content,
-                        content_type="application/pdf"
+                pdf_future = asyncio.wrap_future(pdf_job)
+            elif request.include_pdf:
+                pdf_future = asyncio.ensure_future(
+                    self.pdf_service.generate_letter_pdf(
+                        letter_response.letter_content,
+                        request.subject_line,
+                        request.user_name
                     )
                 )
             
+            sent_date = _format_sent_date(datetime.now(timezone.utc).date())
+            html_body, text_body = self._generate_email_bodies(request, letter_response, sent_date)
+            
+            attachments = []
+            if pdf_future is not None:
+                pdf_result = await pdf_future
+                filename = f"raise_request_{request.user_name.translate(_FILENAME_SAFE)[:120]}.pdf"
+                if pdf_to_file:
+                    pdf_path = Path(pdf_result)
+                    attachments.append(EmailAttachment(filename=filename, path=pdf_path))
+                else:
+                    attachments.append(EmailAttachment.from_bytes(pdf_result, filename=filename))
+            
             # Create email request
             email_request = EmailRequest(
                 recipients=recipients,
@@ -220,20 +375,28 @@ class EmailService:
             
             # Log success
             logger.info(
-                f"Raise letter email sent successfully",
-                extra={
-                    "user_email": request.user_email,
-                    "manager_email": request.manager_email,
-                    "message_id": response.message_id,
-                    "provider": response.provider_used
-                }
+                "Raise letter email sent successfully",
+                user_email=request.user_email,
+                manager_email=request.manager_email,
+                message_id=response.message_id,
+                provider=response.provider_used
             )
             
             return response
             
         except Exception as e:
-            logger.error(f"Failed to send raise letter email: {e}")
+            logger.error("Failed to send raise letter email", error=str(e))
             raise EmailServiceError(f"Email sending failed: {str(e)}")
+        
+        finally:
+            if pdf_path is not None:
+                pdf_path.unlink(missing_ok=True)
+            elif pdf_job is not None:
+                # Failed or cancelled before the file was attached; remove it
+                # once the worker has finished writing it
+                pdf_job.add_done_callback(_discard_pdf_file)
+            elif pdf_future is not None:
+                pdf_future.cancel()
     
     async def _send_email(self, request: EmailRequest) -> EmailResponse:
         """Send email using configured provider"""
@@ -247,14 +410,22 @@ class EmailService:
         """Send email via SMTP"""
         try:
             # Create message
-            msg = MIMEMultipart('alternative')
+            msg = EmailMessage(policy=SMTP_POLICY)
             msg['Subject'] = request.subject
             msg['From'] = f"{request.sender_name or self.sender_name} <{self.sender_email}>"
+            msg['Message-ID'] = make_msgid(domain=self._msgid_domain)
             
             # Add recipients
-            to_recipients = [r.email for r in request.recipients if r.type == "to"]
-            cc_recipients = [r.email for r in request.recipients if r.type == "cc"]
-            bcc_recipients = [r.email for r in request.recipients if r.type == "bcc"]
+            to_recipients, cc_recipients, bcc_recipients = [], [], []
+            add_recipient = {
+                "to": to_recipients.append,
+                "cc": cc_recipients.append,
+                "bcc": bcc_recipients.append
+            }
+            for recipient in request.recipients:
+                add = add_recipient.get(recipient.type)
+                if add is not None:
+                    add(recipient.email)
             
             msg['To'] = ', '.join(to_recipients)
             if cc_recipients:
@@ -263,44 +434,36 @@ class EmailService:
             if request.reply_to:
                 msg['Reply-To'] = request.reply_to
             
-            # Add text body
-            text_part = MIMEText(request.body_text, 'plain', 'utf-8')
-            msg.attach(text_part)
-            
-            # Add HTML body if provided
+            # Add text body, with the HTML body as an alternative if provided
+            msg.set_content(request.body_text)
             if request.body_html:
-                html_part = MIMEText(request.body_html, 'html', 'utf-8')
-                msg.attach(html_part)
+                msg.add_alternative(request.body_html, subtype='html')
             
-            # Add attachments
+            # Add attachments, reusing their base64 encoding
+            if request.attachments:
+                msg.make_mixed()
             for attachment in request.attachments:
-                part = MIMEApplication(
-                    attachment.content,
-                    _subtype=attachment.content_type.split('/')[-1]
-                )
-                part.add_header(
-                    'Content-Disposition',
-                    f'attachment; filename="{attachment.filename}"'
-                )
+                part = MIMEPart(policy=SMTP_POLICY)
+                part['Content-Type'] = attachment.content_type
+                part['Content-Transfer-Encoding'] = 'base64'
+                part.add_header('Content-Disposition', 'attachment', filename=attachment.filename)
+                if attachment.encoded_b64 is not None:
+                    part.set_payload(attachment.encoded_b64)
+                elif attachment.path is not None:
+                    part.set_payload(await _encode_file_base64(attachment.path))
+                else:
+                    part.set_payload(_encode_base64(attachment.content))
                 msg.attach(part)
             
             # Send email
             all_recipients = to_recipients + cc_recipients + bcc_recipients
             
-            await aiosmtplib.send(
-                msg,
-                hostname=self.smtp_config['hostname'],
-                port=self.smtp_config['port'],
-                username=self.smtp_config['username'],
-                password=self.smtp_config['password'],
-                use_tls=self.smtp_config['use_tls'],
-                recipients=all_recipients
-            )
+            await self._send_with_retry(msg, all_recipients)
             
             return EmailResponse(
                 success=True,
                 message_id=msg.get('Message-ID'),
-                sent_at=datetime.utcnow(),
+                sent_at=datetime.now(timezone.utc),
                 provider_used=EmailProvider.SMTP,
                 recipients_count=len(all_recipients),
                 metadata={
@@ -310,143 +473,236 @@ class EmailService:
             )
             
         except Exception as e:
-            logger.error(f"SMTP email sending failed: {e}")
+            logger.error("SMTP email sending failed", error=str(e))
             return EmailResponse(
                 success=False,
                 error_message=str(e),
-                sent_at=datetime.utcnow(),
+                sent_at=datetime.now(timezone.utc),
                 provider_used=EmailProvider.SMTP,
                 recipients_count=0
             )
     
-    async def _generate_email_html(
-        self, 
-        request: RaiseLetterEmailRequest,
-        letter_response: RaiseLetterResponse
-    ) -> str:
-        """Generate HTML email body"""
-        try:
-            template = self.template_env.get_template('raise_letter_email.html')
-            return template.render(
-                user_name=request.user_name,
-                manager_name=request.manager_name or "Manager",
-                letter_content=letter_response.letter_content,
-                custom_message=request.custom_message,
-                include_pdf=request.include_pdf,
-                platform_name="WageLift",
-                sent_date=datetime.utcnow().strftime("%B %d, %Y")
+    async def _send_with_retry(self, msg: EmailMessage, recipients: List[str]) -> None:
+        """
+        Deliver a built message, retrying transient transport failures
+        
+        The message is serialized once; retries resend the same bytes on a
+        new connection with exponential backoff rather than rebuilding it.
+        
+        Raises:
+            EmailServiceError: If every attempt fails
+        """
+        message_bytes = msg.as_bytes()
+        backoff = self.SMTP_RETRY_BACKOFF_SECONDS
+        
+        for attempt in range(self.SMTP_SEND_ATTEMPTS):
+            try:
+                async with self._smtp_connection(fresh=attempt > 0) as client:
+                    await client.sendmail(str(self.sender_email), recipients, message_bytes)
+                return
+            except (
+                aiosmtplib.SMTPServerDisconnected,
+                aiosmtplib.SMTPConnectError,
+                asyncio.TimeoutError
+            ) as e:
+                if attempt == self.SMTP_SEND_ATTEMPTS - 1:
+                    raise EmailServiceError(
+                        f"SMTP delivery failed after {self.SMTP_SEND_ATTEMPTS} attempts: {e}"
+                    ) from e
+                logger.warning("SMTP delivery failed, retrying", attempt=attempt + 1, error=str(e))
+                await asyncio.sleep(backoff)
+                backoff *= 2
+    
+    @asynccontextmanager
+    async def _smtp_connection(self, fresh: bool = False) -> AsyncIterator[aiosmtplib.SMTP]:
+        """
+        Borrow an SMTP connection from the pool
+        
+        Reuses an idle connection unless fresh is set, otherwise connects
+        and logs in. The connection is returned to the pool afterwards, or
+        closed if the send failed or the pool already holds
+        SMTP_CONCURRENCY idle connections.
+        """
+        client = None
+        while not fresh and self._smtp_pool:
+            idle = self._smtp_pool.pop()
+            if idle.is_connected:
+                client = idle
+                break
+        
+        if client is None:
+            client = aiosmtplib.SMTP(
+                hostname=self.smtp_config['hostname'],
+                port=self.smtp_config['port'],
+                use_tls=self.smtp_config['use_tls'],
+                tls_context=self._ssl_context
             )
-        except Exception as e:
-            logger.warning(f"Failed to generate HTML template: {e}")
-            return self._generate_fallback_html(request, letter_response)
+            try:
+                await client.connect()
+                if self.smtp_config['username']:
+                    await client.login(
+                        self.smtp_config['username'],
+                        self.smtp_config['password']
+                    )
+            except BaseException:
+                client.close()
+                raise
+        
+        try:
+            yield client
+        except BaseException:
+            client.close()
+            raise
+        
+        if len(self._smtp_pool) < settings.SMTP_CONCURRENCY:
+            self._smtp_pool.append(client)
+        else:
+            await self._quit_client(client)
     
-    async def _generate_email_text(
-        self, 
-        request: RaiseLetterEmailRequest,
-        letter_response: RaiseLetterResponse
-    ) -> str:
-        """Generate plain text email body"""
+    async def aclose(self) -> None:
+        """Close all pooled SMTP connections"""
+        clients, self._smtp_pool = self._smtp_pool, []
+        for client in clients:
+            await self._quit_client(client)
+    
+    @staticmethod
+    async def _quit_client(client: aiosmtplib.SMTP) -> None:
+        """Send QUIT on a connection, closing it outright if that fails"""
+        if not client.is_connected:
+            return
         try:
-            template = self.template_env.get_template('raise_letter_email.txt')
-            return template.render(
-                user_name=request.user_name,
-                manager_name=request.manager_name or "Manager",
-                letter_content=letter_response.letter_content,
-                custom_message=request.custom_message,
-                include_pdf=request.include_pdf,
-                platform_name="WageLift",
-                sent_date=datetime.utcnow().strftime("%B %d, %Y")
-            )
-        except Exception as e:
-            logger.warning(f"Failed to generate text template: {e}")
-            return self._generate_fallback_text(request, letter_response)
+            await client.quit()
+        except aiosmtplib.SMTPException as e:
+            logger.warning("SMTP QUIT failed, closing connection", error=str(e))
+            client.close()
+    
+    async def send_bulk(self, requests: List[EmailRequest]) -> List[EmailResponse]:
+        """
+        Send many emails concurrently
+        
+        At most SMTP_CONCURRENCY sends are in flight at once, each on its
+        own pooled connection. Failures are returned as unsuccessful
+        responses in the same order as the requests.
+        """
+        async def send_one(request: EmailRequest) -> EmailResponse:
+            async with self._send_sem:
+                return await self._send_email(request)
+        
+        results = await asyncio.gather(
+            *(send_one(request) for request in requests),
+            return_exceptions=True
+        )
+        
+        responses = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error("Bulk email sending failed", error=str(result))
+                result = EmailResponse(
+                    success=False,
+                    error_message=str(result),
+                    sent_at=datetime.now(timezone.utc),
+                    provider_used=self.provider,
+                    recipients_count=0
+                )
+            responses.append(result)
+        return responses
+    
+    def _generate_email_bodies(
+        self,
+        request: RaiseLetterEmailRequest,
+        letter_response: RaiseLetterResponse,
+        sent_date: str
+    ) -> Tuple[str, str]:
+        """Generate the HTML and plain text email bodies from one template context"""
+        context = {
+            "user_name": request.user_name,
+            "manager_name": request.manager_name or "Manager",
+            "letter_content": letter_response.letter_content,
+            "custom_message": request.custom_message,
+            "include_pdf": request.include_pdf,
+            "platform_name": "WageLift",
+            "sent_date": sent_date
+        }
+        
+        html_body = None
+        if self._html_template is not None:
+            try:
+                html_body = self._html_template.render(context)
+            except Exception as e:
+                logger.warning("Failed to generate HTML template", error=str(e))
+        if html_body is None:
+            html_body = self._generate_fallback_html(request, letter_response, sent_date)
+        
+        text_body = None
+        if self._text_template is not None:
+            try:
+                text_body = self._text_template.render(context)
+            except Exception as e:
+                logger.warning("Failed to generate text template", error=str(e))
+        if text_body is None:
+            text_body = self._generate_fallback_text(request, letter_response, sent_date)
+        
+        return html_body, text_body
     
     def _generate_fallback_html(
         self, 
         request: RaiseLetterEmailRequest,
-        letter_response: RaiseLetterResponse
+        letter_response: RaiseLetterResponse,
+        sent_date: str
     ) -> str:
         """Generate fallback HTML email"""
-        return f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-            <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-                <h2 style="color: #2563eb;">Salary Adjustment Request</h2>
-                
-                <p>Dear {request.manager_name or 'Manager'},</p>
-                
-                {f'<p><em>{request.custom_message}</em></p>' if request.custom_message else ''}
-                
-                <div style="background: #f9fafb; padding: 20px; border-radius: 8px; margin: 20px 0;">
-                    <pre style="white-space: pre-wrap; font-family: Georgia, serif;">{letter_response.letter_content}</pre>
-                </div>
-                
-                {f'<p><strong>Note:</strong> This email includes a PDF attachment with the formal letter.</p>' if request.include_pdf else ''}
-                
-                <hr style="margin: 30px 0; border: none; border-top: 1px solid #e5e7eb;">
-                
-                <p style="font-size: 12px; color: #6b7280;">
-                    This letter was generated using WageLift, an AI-powered salary analysis platform.<br>
-                    Sent on {datetime.utcnow().strftime("%B %d, %Y")}
-                </p>
-            </div>
-        </body>
-        </html>
-        """
+        parts = [
+            _FALLBACK_HTML_PREFIX,
+            _FALLBACK_HTML_GREETING.format(escape(request.manager_name or 'Manager'))
+        ]
+        if request.custom_message:
+            parts.append(_FALLBACK_HTML_CUSTOM_MESSAGE.format(escape(request.custom_message)))
+        parts.append(_FALLBACK_HTML_LETTER.format(escape(letter_response.letter_content)))
+        if request.include_pdf:
+            parts.append(_FALLBACK_HTML_PDF_NOTE)
+        parts.append(_FALLBACK_HTML_SUFFIX.format(sent_date))
+        
+        return "".join(parts)
     
     def _generate_fallback_text(
         self, 
         request: RaiseLetterEmailRequest,
-        letter_response: RaiseLetterResponse
+        letter_response: RaiseLetterResponse,
+        sent_date: str
     ) -> str:
         """Generate fallback plain text email"""
-        text_parts = [
-            f"Dear {request.manager_name or 'Manager'},",
-            ""
-        ]
-        
+        text_parts = [f"Dear {request.manager_name or 'Manager'},", ""]
         if request.custom_message:
-            text_parts.extend([request.custom_message, ""])
-        
-        text_parts.extend([
-            letter_response.letter_content,
-            ""
-        ])
-        
+            text_parts.extend((request.custom_message, ""))
+        text_parts.extend((letter_response.letter_content, ""))
         if request.include_pdf:
-            text_parts.append("Note: This email includes a PDF attachment with the formal letter.")
-            text_parts.append("")
-        
-        text_parts.extend([
-            "---",
-            f"This letter was generated using WageLift, an AI-powered salary analysis platform.",
-            f"Sent on {datetime.utcnow().strftime('%B %d, %Y')}"
-        ])
+            text_parts.extend(_FALLBACK_TEXT_PDF_NOTE)
+        text_parts.extend(_FALLBACK_TEXT_FOOTER)
+        text_parts.append(f"Sent on {sent_date}")
         
         return "\n".join(text_parts)
     
-    async def validate_email_configuration(self) -> bool:
-        """Validate email service configuration"""
-        try:
-            if not self.sender_email:
-                logger.error("Sender email not configured")
-                return False
-            
-            if self.provider == EmailProvider.SMTP:
-                if not all([
-                    self.smtp_config['hostname'],
-                    self.smtp_config['username'],
-                    self.smtp_config['password']
-                ]):
-                    logger.error("SMTP configuration incomplete")
-                    return False
-            
-            logger.info(f"Email service configuration valid for provider: {self.provider}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Email configuration validation failed: {e}")
+    def _check_configuration(self) -> bool:
+        """Check the email configuration once at init, logging what is missing"""
+        if not self.sender_email:
+            logger.error("Sender email not configured")
             return False
+        
+        if self.provider == EmailProvider.SMTP:
+            if not all([
+                self.smtp_config['hostname'],
+                self.smtp_config['username'],
+                self.smtp_config['password']
+            ]):
+                logger.error("SMTP configuration incomplete")
+                return False
+        
+        logger.info("Email service configuration valid", provider=self.provider)
+        return True
+    
+    def validate_email_configuration(self) -> bool:
+        """Validate email service configuration (checked once at init)"""
+        return self.is_configured
     
     async def send_test_email(self, recipient_email: str) -> EmailResponse:
         """Send a test email to verify configuration"""
@@ -458,4 +714,8 @@ class EmailService:
             priority=EmailPriority.LOW
         )
         
-        return await self._send_email(test_request) 
\ No newline at end of file
+        return await self._send_email(test_request)
+
+
+# Global service instance
+email_service = EmailService()
@@ -4,6 +4,7 @@ Converts raise request letters to professional PDF documents
 """
 
 import io
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -107,6 +108,33 @@ class PDFService:
         """
         Generate a professional PDF from letter content
         
+        Runs render_letter_pdf inline; callers that must keep the event
+        loop free should run render_letter_pdf_file in an executor.
+        
+        Args:
+            letter_content: The main letter text
+            subject_line: Email subject line for the document
+            user_name: Name of the person sending the letter
+            custom_header: Optional custom header text
+            
+        Returns:
+            PDF content as bytes
+            
+        Raises:
+            PDFServiceError: If PDF generation fails
+        """
+        return self.render_letter_pdf(letter_content, subject_line, user_name, custom_header)
+    
+    def render_letter_pdf(
+        self,
+        letter_content: str,
+        subject_line: str,
+        user_name: str,
+        custom_header: Optional[str] = None
+    ) -> bytes:
+        """
+        Render a professional PDF from letter content (CPU-bound)
+        
         Args:
             letter_content: The main letter text
             subject_line: Email subject line for the document
@@ -269,4 +297,34 @@ class PDFService:
                 
         except Exception as e:
             logger.error(f"PDF service validation failed: {e}")
-            return False 
\ No newline at end of file
+            return False
+
+
+# Per-process instance used by render_letter_pdf_file in executor workers
+_worker_pdf_service: Optional[PDFService] = None
+
+
+def render_letter_pdf_file(
+    letter_content: str,
+    subject_line: str,
+    user_name: str,
+    custom_header: Optional[str] = None
+) -> str:
+    """
+    Render a letter PDF to a temporary file; a picklable entry point for
+    process pool workers
+    
+    Each worker builds its PDFService (and paragraph styles) once and
+    reuses it for later letters. Returns the file path; the caller is
+    responsible for deleting the file.
+    """
+    global _worker_pdf_service
+    if _worker_pdf_service is None:
+        _worker_pdf_service = PDFService()
+    pdf_bytes = _worker_pdf_service.render_letter_pdf(
+        letter_content, subject_line, user_name, custom_header
+    )
+    
+    with tempfile.NamedTemporaryFile(prefix="raise_letter_", suffix=".pdf", delete=False) as pdf_file:
+        pdf_file.write(pdf_bytes)
+    return pdf_file.name
@@ -0,0 +1,17 @@
+-- Migration: 004_add_benchmark_trigram_indexes.sql
+-- Description: Add pg_trgm GIN indexes so substring benchmark searches (ILIKE '%...%') can use an index
+-- Date: 2026-10-16
+
+-- Enable trigram matching
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Create trigram indexes for benchmark title/location search
+CREATE INDEX IF NOT EXISTS idx_benchmarks_job_title_trgm ON benchmarks USING gin (job_title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_benchmarks_location_trgm ON benchmarks USING gin (location gin_trgm_ops);
+
+-- Add index comments
+COMMENT ON INDEX idx_benchmarks_job_title_trgm IS 'Trigram index for ILIKE job title search';
+COMMENT ON INDEX idx_benchmarks_location_trgm IS 'Trigram index for ILIKE location search';
+
+-- Migration completed successfully
+SELECT 'Benchmark trigram indexes created successfully' AS status;
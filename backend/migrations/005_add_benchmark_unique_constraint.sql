@@ -0,0 +1,23 @@
+-- Migration: 005_add_benchmark_unique_constraint.sql
+-- Description: Make (job_title, location, source, effective_date) unique so benchmark inserts can use ON CONFLICT DO NOTHING
+-- Date: 2026-10-16
+
+-- Remove duplicate benchmark snapshots, keeping the earliest created row
+DELETE FROM benchmarks a
+USING benchmarks b
+WHERE a.job_title = b.job_title
+  AND a.location = b.location
+  AND a.source = b.source
+  AND a.effective_date = b.effective_date
+  AND (a.created_at, a.id) > (b.created_at, b.id);
+
+-- Add unique constraint
+ALTER TABLE benchmarks
+    ADD CONSTRAINT uq_benchmark_title_location_source_date
+    UNIQUE (job_title, location, source, effective_date);
+
+-- Add constraint comment
+COMMENT ON CONSTRAINT uq_benchmark_title_location_source_date ON benchmarks IS 'One benchmark snapshot per title, location and source per day';
+
+-- Migration completed successfully
+SELECT 'Benchmark unique constraint created successfully' AS status;
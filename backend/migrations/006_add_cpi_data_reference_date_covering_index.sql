@@ -0,0 +1,12 @@
+-- Migration: 006_add_cpi_data_reference_date_covering_index.sql
+-- Description: Add a covering (series_id, reference_date) INCLUDE (cpi_value) index so the CPI calculator's per-series date-ordered load, exact-date and batch lookups are index-only scans
+-- Date: 2026-10-16
+
+-- Create covering index for per-series, date-ordered CPI reads
+CREATE INDEX IF NOT EXISTS idx_cpi_series_refdate_value ON cpi_data (series_id, reference_date) INCLUDE (cpi_value);
+
+-- Add index comment
+COMMENT ON INDEX idx_cpi_series_refdate_value IS 'Covering index for per-series CPI value lookups by reference date';
+
+-- Migration completed successfully
+SELECT 'CPI data covering index created successfully' AS status;
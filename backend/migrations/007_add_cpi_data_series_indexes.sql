@@ -0,0 +1,16 @@
+-- Migration: 007_add_cpi_data_series_indexes.sql
+-- Description: Add series-scoped CPI index for latest-record, count and freshness lookups; date-range lookups use idx_cpi_series_refdate_value from 006
+-- Date: 2026-10-16
+
+-- Create covering index for latest-record lookups (ORDER BY year DESC, month DESC)
+CREATE INDEX IF NOT EXISTS idx_cpi_series_ym ON cpi_data (series_id, year DESC, month DESC) INCLUDE (cpi_value, annual_inflation_rate);
+
+-- Drop the plain (series_id, reference_date) index if an earlier run created it;
+-- idx_cpi_series_refdate_value has the same key and also covers cpi_value
+DROP INDEX IF EXISTS idx_cpi_series_refdate;
+
+-- Add index comment
+COMMENT ON INDEX idx_cpi_series_ym IS 'Covering index for latest CPI record, count and freshness lookups per series';
+
+-- Migration completed successfully
+SELECT 'CPI data series index created successfully' AS status;
@@ -0,0 +1,50 @@
+"""
+Tests for BLS Service
+
+Unit tests for concurrent CPI range fetching.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from app.services.bls_service import BLSService, CPIDataPoint
+
+
+def _point(year: int, month: int) -> CPIDataPoint:
+    return CPIDataPoint(
+        date=datetime(year, month, 1),
+        value=300.0,
+        period_name='',
+        year=year,
+        period=f"M{month:02d}"
+    )
+
+
+class TestGetCPIRangeAsync:
+    """Test splitting long ranges into per-request spans."""
+
+    @pytest.mark.asyncio
+    async def test_long_range_split_into_spans(self):
+        """Unregistered ranges are fetched in 10-year spans and merged in date order."""
+        service = BLSService()
+        service.get_cpi_range = MagicMock(
+            side_effect=lambda start, end: [_point(end, 1), _point(start, 1)]
+        )
+
+        data_points = await service.get_cpi_range_async(2000, 2024)
+
+        requested = sorted(call.args for call in service.get_cpi_range.call_args_list)
+        assert requested == [(2000, 2009), (2010, 2019), (2020, 2024)]
+        assert [point.year for point in data_points] == [2000, 2009, 2010, 2019, 2020, 2024]
+
+    @pytest.mark.asyncio
+    async def test_short_range_single_request(self):
+        """A range within the per-request limit is a single fetch."""
+        service = BLSService(registration_key="test-key")
+        service.get_cpi_range = MagicMock(return_value=[_point(2023, 1)])
+
+        data_points = await service.get_cpi_range_async(2005, 2024)
+
+        service.get_cpi_range.assert_called_once_with(2005, 2024)
+        assert len(data_points) == 1
@@ -0,0 +1,396 @@
+"""
+Tests for CareerOneStop Service
+
+Unit tests for response caching and benchmark helpers.
+"""
+
+import time
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+from decimal import Decimal
+from tenacity import wait_none
+
+from app.services.careeronestop_service import (
+    AdaptiveRateLimiter,
+    CareerOneStopService,
+    PERCENTILE_CACHE_VERSION_KEY,
+    _compute_percentiles,
+    _get_market_position,
+    _percentile_cache_key,
+    compare_salary_to_market,
+    invalidate_percentile_cache
+)
+
+
+@pytest.fixture
+def service():
+    """Service with a stub session and an empty response cache."""
+    CareerOneStopService.clear_cache()
+    service = CareerOneStopService(api_key="test-key", user_id="test-user")
+    service.session = MagicMock()
+    yield service
+    CareerOneStopService.clear_cache()
+
+
+class TestResponseCache:
+    """Test the shared API response cache."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_network(self, service):
+        """Cached responses are returned without calling the API."""
+        cache_key = ("occupation/test-user/engineer/5", ())
+        service._cache_response(cache_key, {"OccupationList": [{"OnetCode": "15-1252.00"}]})
+
+        data = await service._make_request("occupation/test-user/engineer/5", {})
+
+        assert data["OccupationList"][0]["OnetCode"] == "15-1252.00"
+        service.session.get.assert_not_called()
+
+    def test_cache_is_shared_across_instances(self, service):
+        """A response cached by one instance is visible to another."""
+        cache_key = ("wages/test-user/15-1252.00/CA", (("radius", 25),))
+        service._cache_response(cache_key, {"Wages": {}})
+
+        other = CareerOneStopService(api_key="test-key", user_id="test-user")
+        assert other._get_cached_response(cache_key) == {"Wages": {}}
+
+    def test_expired_entry_is_dropped(self, service):
+        """Entries older than the TTL are treated as misses."""
+        cache_key = ("occupation/test-user/nurse/5", ())
+        service._response_cache[cache_key] = (
+            datetime.now() - service.CACHE_TTL,
+            {"OccupationList": []}
+        )
+
+        assert service._get_cached_response(cache_key) is None
+        assert cache_key not in service._response_cache
+
+
+class TestMakeRequestRetry:
+    """Test retries of transient network failures."""
+
+    @pytest.mark.asyncio
+    async def test_retries_connection_errors(self, service):
+        """Connection errors are retried and the eventual response returned."""
+        response = MagicMock(status=200, headers={})
+        response.read = AsyncMock(return_value=b'{"OccupationList": []}')
+        request = MagicMock()
+        request.__aenter__ = AsyncMock(return_value=response)
+        request.__aexit__ = AsyncMock(return_value=False)
+        service.session.get.side_effect = [
+            aiohttp.ClientConnectionError("reset"),
+            aiohttp.ClientConnectionError("reset"),
+            request
+        ]
+
+        with patch.object(CareerOneStopService._make_request.retry, "wait", wait_none()), \
+                patch.object(service, "_get_http_validators", AsyncMock(return_value=None)):
+            data = await service._make_request("occupation/test-user/welder/5", {})
+
+        assert data == {"OccupationList": []}
+        assert service.session.get.call_count == 3
+
+
+class TestAdaptiveRateLimiter:
+    """Test AIMD concurrency control."""
+
+    def test_additive_increase_on_success(self):
+        """Successful responses grow concurrency up to the maximum."""
+        limiter = AdaptiveRateLimiter(max_concurrency=5, initial_concurrency=4)
+
+        for _ in range(4):
+            limiter.record_response(200, {})
+
+        assert limiter.concurrency == 5
+
+    def test_multiplicative_decrease_on_throttle(self):
+        """429 and 5xx responses halve concurrency down to the minimum."""
+        limiter = AdaptiveRateLimiter(min_concurrency=1, initial_concurrency=8)
+
+        limiter.record_response(429, {})
+        assert limiter.concurrency == 4
+        limiter.record_response(503, {})
+        assert limiter.concurrency == 2
+        limiter.record_response(429, {})
+        limiter.record_response(429, {})
+        assert limiter.concurrency == 1
+
+    def test_retry_after_pauses_requests(self):
+        """Retry-After headers schedule a pause, capped at max_pause_seconds."""
+        limiter = AdaptiveRateLimiter(max_pause_seconds=5)
+
+        limiter.record_response(429, {"Retry-After": "120"})
+
+        assert 0 < limiter._paused_until - time.monotonic() <= 5
+
+    def test_low_remaining_quota_pauses_requests(self):
+        """Requests pause until reset when the remaining quota is nearly spent."""
+        limiter = AdaptiveRateLimiter()
+
+        limiter.record_response(200, {
+            "X-RateLimit-Limit": "100",
+            "X-RateLimit-Remaining": "5",
+            "X-RateLimit-Reset": "3"
+        })
+
+        assert limiter._paused_until > time.monotonic()
+
+
+class TestPercentiles:
+    """Test percentile aggregation."""
+
+    def test_linear_interpolation(self):
+        """Percentiles interpolate between ranks like numpy.percentile."""
+        salaries = [50000.0, 60000.0, 72000.0, 80000.0, 91000.0, 120000.0, 55000.0]
+
+        percentiles = _compute_percentiles(salaries)
+
+        assert percentiles == {
+            'p10': Decimal('53000.0'),
+            'p25': Decimal('57500.0'),
+            'p50': Decimal('72000.0'),
+            'p75': Decimal('85500.0'),
+            'p90': Decimal('102600.0'),
+        }
+
+    def test_single_value(self):
+        """A single salary is every percentile."""
+        percentiles = _compute_percentiles([65000.0])
+
+        assert set(percentiles.values()) == {Decimal('65000.0')}
+
+
+class TestPercentileCache:
+    """Test the versioned percentile cache keys."""
+
+    @pytest.mark.asyncio
+    async def test_invalidation_bumps_version(self):
+        """Invalidation is a single INCR that moves readers to new keys."""
+        redis_client = MagicMock()
+        redis_client.get = AsyncMock(side_effect=[None, "1"])
+        redis_client.incr = AsyncMock()
+
+        with patch('app.services.careeronestop_service.get_async_redis_client', return_value=redis_client):
+            before = await _percentile_cache_key("Nurse", "TX")
+            await invalidate_percentile_cache()
+            after = await _percentile_cache_key("Nurse", "TX")
+
+        redis_client.incr.assert_awaited_once_with(PERCENTILE_CACHE_VERSION_KEY)
+        assert before != after
+
+
+class TestParseWageData:
+    """Test parsing of CareerOneStop wage payloads."""
+
+    def test_wage_types_convert_exactly(self, service):
+        """Int, string and float wages all become exact Decimals."""
+        wage_data = {
+            'OccupationTitle': 'Software Developers',
+            'StateData': {'StateName': 'California'},
+            'AnnualWages': [
+                {'Percentile': 10, 'Wage': 85000},
+                {'Percentile': 50, 'Wage': '132500.50'},
+                {'Percentile': 90, 'Wage': 198000.1},
+                {'Percentile': 75, 'Wage': 'n/a'},
+            ]
+        }
+
+        parsed = service._parse_wage_data(wage_data, '15-1252.00')
+
+        assert parsed['percentiles'] == {
+            'p10': Decimal('85000'),
+            'p50': Decimal('132500.50'),
+            'p90': Decimal('198000.1'),
+        }
+        assert parsed['location'] == 'California'
+        assert parsed['location_type'] == 'state'
+
+
+class TestCompareSalaryToMarket:
+    """Test market comparison ranking."""
+
+    PERCENTILES = {
+        'p10': Decimal('50000'),
+        'p25': Decimal('60000'),
+        'p50': Decimal('75000'),
+        'p75': Decimal('90000'),
+        'p90': Decimal('110000'),
+    }
+
+    @pytest.mark.asyncio
+    async def test_rank_and_comparison(self):
+        """Salaries are ranked against the ordered percentile values."""
+        with patch(
+            'app.services.careeronestop_service.get_salary_percentiles',
+            AsyncMock(return_value=self.PERCENTILES)
+        ):
+            result = await compare_salary_to_market(Decimal('80000'), 'Engineer', 'CA', MagicMock())
+
+        assert result['percentile_rank'] == 50.0
+        assert result['market_position'] == 'Above Median - Good'
+        assert result['comparison'] == {
+            'p10': 'above', 'p25': 'above', 'p50': 'above', 'p75': 'below', 'p90': 'below'
+        }
+
+    @pytest.mark.asyncio
+    async def test_salary_equal_to_percentile(self):
+        """A salary equal to a percentile counts as above it but does not outrank it."""
+        with patch(
+            'app.services.careeronestop_service.get_salary_percentiles',
+            AsyncMock(return_value=self.PERCENTILES)
+        ):
+            result = await compare_salary_to_market(Decimal('60000'), 'Engineer', 'CA', MagicMock())
+
+        assert result['percentile_rank'] == 16.7
+        assert result['comparison']['p25'] == 'above'
+        assert result['comparison']['p50'] == 'below'
+
+
+class TestMarketPosition:
+    """Test market position labels."""
+
+    @pytest.mark.parametrize("rank,expected", [
+        (0.0, 'Bottom 25% - Significant Gap'),
+        (24.9, 'Bottom 25% - Significant Gap'),
+        (25.0, 'Below Median - Consider Raise'),
+        (50.0, 'Above Median - Good'),
+        (75.0, 'Top 25% - Above Market'),
+        (90.0, 'Top 10% - Excellent'),
+        (100.0, 'Top 10% - Excellent'),
+    ])
+    def test_threshold_boundaries(self, rank, expected):
+        """Each threshold is inclusive of the higher label."""
+        assert _get_market_position(rank) == expected
+
+
+class TestFetchSalaryBenchmarksMany:
+    """Test concurrent benchmark fetching."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order_with_single_commit(self, service):
+        """Each pair gets its own result list and the session commits once."""
+        async def fetch_records(job_title, location, radius):
+            if job_title == 'Broken':
+                raise TimeoutError("API timed out")
+            return [{'occupation_title': job_title, 'location': location}]
+
+        async def store(parsed_records, job_title, db_session):
+            return [f"{job_title}:{record['location']}" for record in parsed_records]
+
+        db_session = AsyncMock()
+        db_session.begin_nested = MagicMock()
+        service._fetch_wage_records = AsyncMock(side_effect=fetch_records)
+        service._store_benchmarks = AsyncMock(side_effect=store)
+
+        results = await service.fetch_salary_benchmarks_many(
+            [('Nurse', 'TX'), ('Broken', 'CA'), ('Teacher', 'NY')],
+            db_session
+        )
+
+        assert results == [['Nurse:TX'], [], ['Teacher:NY']]
+        db_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_percentile_cache_invalidated_after_commit(self, service):
+        """The percentile cache is bumped only once the new rows are committed."""
+        calls = []
+        db_session = AsyncMock()
+        db_session.begin_nested = MagicMock()
+        db_session.commit.side_effect = lambda: calls.append("commit")
+        service._fetch_wage_records = AsyncMock(return_value=[{'location': 'TX'}])
+        service._store_benchmarks = AsyncMock(return_value=["benchmark"])
+
+        with patch('app.services.careeronestop_service.invalidate_percentile_cache',
+                   AsyncMock(side_effect=lambda: calls.append("invalidate"))):
+            await service.fetch_salary_benchmarks_many([('Nurse', 'TX')], db_session)
+
+        assert calls == ["commit", "invalidate"]
+
+    @pytest.mark.asyncio
+    async def test_store_failure_skips_only_that_pair(self, service):
+        """A pair that fails to store is rolled back to its savepoint; the rest are kept."""
+        async def store(parsed_records, job_title, db_session):
+            if job_title == 'Broken':
+                raise ValueError("bad row")
+            return [job_title]
+
+        db_session = AsyncMock()
+        db_session.begin_nested = MagicMock()
+        service._fetch_wage_records = AsyncMock(return_value=[{'location': 'TX'}])
+        service._store_benchmarks = AsyncMock(side_effect=store)
+
+        results = await service.fetch_salary_benchmarks_many(
+            [('Nurse', 'TX'), ('Broken', 'CA'), ('Teacher', 'NY')],
+            db_session,
+            commit=False
+        )
+
+        assert results == [['Nurse'], [], ['Teacher']]
+        assert db_session.begin_nested.call_count == 3
+        db_session.rollback.assert_not_awaited()
+
+
+class TestRefreshBenchmarkData:
+    """Test refreshing stale benchmarks."""
+
+    @pytest.mark.asyncio
+    async def test_failure_rolls_back_deactivation(self, service):
+        """An error after the deactivation UPDATEs rolls the whole refresh back."""
+        async def stale_rows():
+            yield 1, 'Nurse', 'TX'
+
+        db_session = AsyncMock()
+        db_session.stream.return_value = stale_rows()
+        service.fetch_salary_benchmarks_many = AsyncMock(side_effect=RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError):
+            await service.refresh_benchmark_data(db_session)
+
+        db_session.execute.assert_awaited_once()
+        db_session.rollback.assert_awaited_once()
+        db_session.commit.assert_not_awaited()
+
+
+class TestFetchWageRecords:
+    """Test occupation and wage lookups."""
+
+    WAGES = {
+        'OccupationTitle': 'Registered Nurses',
+        'StateData': {'StateName': 'Texas'},
+        'AnnualWages': [
+            {'Percentile': 10, 'Wage': 60000},
+            {'Percentile': 50, 'Wage': 80000},
+            {'Percentile': 90, 'Wage': 110000},
+        ]
+    }
+
+    @pytest.mark.asyncio
+    async def test_inline_wages_skip_per_occupation_requests(self, service):
+        """Only occupations without inline wages trigger a wage request."""
+        service.search_occupations_with_wages = AsyncMock(return_value=[
+            {'OnetCode': '29-1141.00', 'Wages': self.WAGES},
+            {'OnetCode': '29-1171.00'},
+        ])
+        service.search_occupations = AsyncMock()
+        service.get_occupation_wages = AsyncMock(return_value={})
+
+        records = await service._fetch_wage_records('Nurse', 'TX', 25)
+
+        assert [record['onet_code'] for record in records] == ['29-1141.00']
+        service.search_occupations.assert_not_called()
+        service.get_occupation_wages.assert_awaited_once_with('29-1171.00', 'TX', 25)
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_occupation_search(self, service):
+        """The plain occupation search is used when the combined call returns nothing."""
+        service.search_occupations_with_wages = AsyncMock(return_value=[])
+        service.search_occupations = AsyncMock(return_value=[{'OnetCode': '29-1141.00'}])
+        service.get_occupation_wages = AsyncMock(return_value=self.WAGES)
+
+        records = await service._fetch_wage_records('Nurse', 'TX', 25)
+
+        assert len(records) == 1
+        service.get_occupation_wages.assert_awaited_once_with('29-1141.00', 'TX', 25)
@@ -0,0 +1,298 @@
+"""
+Tests for CPI Calculator Service
+
+Unit tests for inflation adjustment math and CPI lookups.
+"""
+
+import time
+import pytest
+from datetime import date
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.cpi_calculator import (
+    BATCH_CPI_SQL,
+    CPI_SERIES_ID,
+    EXACT_CPI_SQL,
+    CalculationMethod,
+    CPICalculationParams,
+    CPICalculationRequest,
+    CPICalculatorService,
+    _round_cents,
+    _round_tenths
+)
+
+
+@pytest.fixture
+def calculator():
+    """Calculator with an empty CPI cache."""
+    return CPICalculatorService()
+
+
+class TestCalculateAdjustment:
+    """Test the core inflation adjustment calculation."""
+
+    def test_adjustment_values(self, calculator):
+        """Adjusted salary, gaps and inflation rate are rounded for display."""
+        result = calculator._calculate_adjustment(
+            original_salary=50000.0,
+            current_salary=55000.0,
+            historical_cpi=250.0,
+            current_cpi=300.0,
+            historical_date=date(2018, 1, 1),
+            current_date=date(2024, 1, 1)
+        )
+
+        assert result.adjusted_salary == 60000.0
+        assert result.dollar_gap == 5000.0
+        assert result.percentage_gap == 9.1
+        assert result.inflation_rate == 20.0
+        assert result.original_salary == 50000.0
+        assert result.historical_cpi == 250.0
+
+    def test_negative_gap(self, calculator):
+        """A raise above inflation produces a negative gap."""
+        result = calculator._calculate_adjustment(
+            original_salary=60000.0,
+            current_salary=80000.0,
+            historical_cpi=251.107,
+            current_cpi=310.326,
+            historical_date=date(2018, 1, 1),
+            current_date=date(2024, 1, 1)
+        )
+
+        assert result.adjusted_salary == 74149.9
+        assert result.dollar_gap == -5850.1
+        assert result.percentage_gap == -7.3
+        assert result.inflation_rate == 23.6
+
+
+class TestRounding:
+    """Test display rounding helpers."""
+
+    def test_rounds_half_up(self):
+        """Halves round away from zero, unlike the builtin round()."""
+        assert _round_tenths(0.25) == 0.3
+        assert _round_tenths(-7.25) == -7.3
+        assert _round_cents(1234.565) == 1234.57
+        assert _round_cents(0.0) == 0.0
+
+
+class TestCalculationParams:
+    """Test the unvalidated parameter dataclass."""
+
+    def test_to_params_round_trip(self):
+        """Requests convert to params carrying the same fields."""
+        request = CPICalculationRequest(
+            original_salary=50000.0,
+            current_salary=55000.0,
+            historical_date=date(2018, 1, 1),
+            current_date=date(2024, 1, 1),
+            calculation_method=CalculationMethod.EXACT_DATE,
+            user_id="user-1"
+        )
+
+        params = request.to_params()
+
+        assert isinstance(params, CPICalculationParams)
+        assert params.dict() == request.dict()
+
+
+class TestCPICache:
+    """Test the (date, method) CPI cache."""
+
+    def test_methods_are_cached_separately(self, calculator):
+        """A nearest-date value is not returned for an exact-date lookup."""
+        calculator._cache_cpi(date(2020, 3, 15), CalculationMethod.NEAREST_DATE, 258.1)
+
+        assert calculator._get_cached_cpi(date(2020, 3, 15), CalculationMethod.NEAREST_DATE) == 258.1
+        assert calculator._get_cached_cpi(date(2020, 3, 15), CalculationMethod.EXACT_DATE) is None
+
+    def test_expired_entry_is_dropped(self, calculator):
+        """Entries older than the TTL are treated as misses."""
+        key = (date(2020, 3, 1), CalculationMethod.EXACT_DATE)
+        calculator._cpi_cache[key] = (258.1, time.monotonic() - calculator._cache_ttl_seconds)
+
+        assert calculator._get_cached_cpi(*key) is None
+        assert key not in calculator._cpi_cache
+
+    def test_least_recently_used_entry_is_evicted(self, calculator):
+        """The oldest untouched entry is evicted once the cache is full."""
+        calculator.CPI_CACHE_MAX_SIZE = 2
+        calculator._cache_cpi(date(2020, 1, 1), CalculationMethod.EXACT_DATE, 257.9)
+        calculator._cache_cpi(date(2020, 2, 1), CalculationMethod.EXACT_DATE, 258.6)
+        calculator._get_cached_cpi(date(2020, 1, 1), CalculationMethod.EXACT_DATE)
+        calculator._cache_cpi(date(2020, 3, 1), CalculationMethod.EXACT_DATE, 258.1)
+
+        assert calculator._get_cached_cpi(date(2020, 1, 1), CalculationMethod.EXACT_DATE) == 257.9
+        assert calculator._get_cached_cpi(date(2020, 2, 1), CalculationMethod.EXACT_DATE) is None
+
+
+class TestBulkCalculation:
+    """Test bulk salary gap calculations."""
+
+    @pytest.mark.asyncio
+    async def test_cached_dates_skip_per_request_lookup(self, calculator):
+        """Requests with both CPIs preloaded are computed without further queries."""
+        async def batch_load(dates, db_session):
+            calculator._cache_cpi(date(2018, 1, 1), CalculationMethod.NEAREST_DATE, 250.0)
+            calculator._cache_cpi(date(2024, 1, 1), CalculationMethod.NEAREST_DATE, 300.0)
+
+        calculator._batch_load_cpi_data = AsyncMock(side_effect=batch_load)
+        calculator._perform_calculation = AsyncMock()
+        requests = [
+            CPICalculationRequest(
+                original_salary=50000.0,
+                current_salary=salary,
+                historical_date=date(2018, 1, 1),
+                current_date=date(2024, 1, 1)
+            )
+            for salary in (55000.0, 60000.0)
+        ]
+
+        results = await calculator._perform_bulk_calculation(requests, MagicMock())
+
+        assert [result.dollar_gap for result in results] == [5000.0, 0.0]
+        calculator._perform_calculation.assert_not_called()
+
+
+class TestAsyncpgQueries:
+    """Test the raw asyncpg fast path."""
+
+    @pytest.mark.asyncio
+    async def test_exact_lookup_filters_series(self, calculator):
+        """Exact-date lookups read cpi_value by reference_date for the BLS series."""
+        raw_connection = AsyncMock()
+        raw_connection.fetchval.return_value = 251.107
+        calculator._get_asyncpg_connection = AsyncMock(return_value=raw_connection)
+
+        cpi = await calculator._get_exact_date_cpi(date(2018, 1, 1), MagicMock())
+
+        assert cpi == 251.107
+        raw_connection.fetchval.assert_awaited_once_with(EXACT_CPI_SQL, date(2018, 1, 1), CPI_SERIES_ID)
+        assert "cpi_value" in EXACT_CPI_SQL and "reference_date" in EXACT_CPI_SQL
+
+    @pytest.mark.asyncio
+    async def test_batch_load_filters_series(self, calculator):
+        """Batch loads fetch reference_date/cpi_value rows for the BLS series and cache them."""
+        statement = AsyncMock()
+        statement.fetch.return_value = [(date(2018, 1, 1), 251.107)]
+        raw_connection = MagicMock()
+        raw_connection.prepare = AsyncMock(return_value=statement)
+        calculator._get_asyncpg_connection = AsyncMock(return_value=raw_connection)
+        dates = [date(2018, 1, 1), date(2024, 1, 1)]
+
+        await calculator._batch_load_cpi_data(dates, MagicMock())
+
+        raw_connection.prepare.assert_awaited_once_with(BATCH_CPI_SQL)
+        statement.fetch.assert_awaited_once_with(dates, CPI_SERIES_ID)
+        assert "reference_date" in BATCH_CPI_SQL and "series_id" in BATCH_CPI_SQL
+        assert calculator._get_cached_cpi(date(2018, 1, 1), CalculationMethod.EXACT_DATE) == 251.107
+
+
+class TestSeriesLookup:
+    """Test nearest and interpolated lookups against the in-memory CPI series."""
+
+    SERIES = [
+        (date(2018, 1, 1), Decimal('251.107')),
+        (date(2020, 1, 1), Decimal('257.971')),
+        (date(2020, 1, 31), Decimal('258.678')),
+        (date(2024, 1, 1), Decimal('310.326')),
+    ]
+
+    @pytest.fixture
+    def db_session(self):
+        """Session whose only query returns the CPI series."""
+        result = MagicMock()
+        result.all.return_value = self.SERIES
+        db_session = AsyncMock()
+        db_session.execute.return_value = result
+        return db_session
+
+    @pytest.mark.asyncio
+    async def test_nearest_dates_share_one_query(self, calculator, db_session):
+        """Both nearest-date CPIs are served from a single series load."""
+        cpis = await calculator._get_cpis_for_dates(
+            date(2018, 1, 15), date(2024, 1, 15), CalculationMethod.NEAREST_DATE, db_session
+        )
+
+        assert cpis == (251.107, 310.326)
+        db_session.execute.assert_awaited_once()
+        assert calculator._get_cached_cpi(date(2024, 1, 15), CalculationMethod.NEAREST_DATE) == 310.326
+
+    @pytest.mark.asyncio
+    async def test_nearest_before_first_date(self, calculator, db_session):
+        """Dates before the series start use the earliest value."""
+        assert await calculator._get_nearest_date_cpi(date(2000, 1, 1), db_session) == 251.107
+
+    @pytest.mark.asyncio
+    async def test_interpolation(self, calculator, db_session):
+        """Values between two known dates are interpolated linearly."""
+        cpi = await calculator._get_interpolated_cpi(date(2020, 1, 16), db_session)
+
+        assert cpi == pytest.approx(258.3245)
+        assert await calculator._get_interpolated_cpi(date(2020, 1, 1), db_session) == 257.971
+        db_session.execute.assert_awaited_once()
+
+
+class TestMetricsBuffer:
+    """Test buffered calculation metrics."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_flushed_per_interval(self, calculator):
+        """Per-request metrics are accumulated and emitted once per interval."""
+        calculator.METRICS_FLUSH_INTERVAL = 2
+        calculator._perform_calculation = AsyncMock()
+        request = CPICalculationRequest(
+            original_salary=50000.0,
+            current_salary=55000.0,
+            historical_date=date(2018, 1, 1),
+            current_date=date(2024, 1, 1)
+        )
+
+        with patch('app.services.cpi_calculator.record_business_metric') as record_metric:
+            await calculator.calculate_salary_gap(request, MagicMock())
+            record_metric.assert_not_called()
+
+            await calculator.calculate_salary_gap(request, MagicMock())
+
+        record_metric.assert_any_call("cpi_calculations", 2)
+        assert calculator._metrics_buffer["calls"] == 0
+
+    @pytest.mark.asyncio
+    async def test_metrics_flushed_after_interval_elapses(self, calculator):
+        """At low traffic metrics are still emitted once the time bound passes."""
+        calculator._perform_calculation = AsyncMock()
+        calculator._metrics_flushed_at = time.monotonic() - calculator.METRICS_FLUSH_SECONDS
+        request = CPICalculationRequest(
+            original_salary=50000.0,
+            current_salary=55000.0,
+            historical_date=date(2018, 1, 1),
+            current_date=date(2024, 1, 1)
+        )
+
+        with patch('app.services.cpi_calculator.record_business_metric') as record_metric:
+            await calculator.calculate_salary_gap(request, MagicMock())
+
+        record_metric.assert_any_call("cpi_calculations", 1)
+        assert calculator._metrics_buffer["calls"] == 0
+
+
+class TestInflationSummary:
+    """Test inflation summary memoization."""
+
+    @pytest.mark.asyncio
+    async def test_summary_is_memoized(self, calculator):
+        """Repeated ranges are served without recomputing."""
+        result = MagicMock()
+        result.all.return_value = TestSeriesLookup.SERIES
+        db_session = AsyncMock()
+        db_session.execute.return_value = result
+
+        first = await calculator.get_inflation_summary(date(2018, 1, 1), date(2024, 1, 1), db_session)
+        calculator._get_inflation_summary = AsyncMock()
+        second = await calculator.get_inflation_summary(date(2018, 1, 1), date(2024, 1, 1), db_session)
+
+        assert first == second
+        assert first["total_inflation_percent"] == 23.58
+        calculator._get_inflation_summary.assert_not_called()
@@ -0,0 +1,374 @@
+"""
+Tests for Email Service
+
+Unit tests for SMTP delivery and raise letter email assembly.
+"""
+
+import email.policy
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiosmtplib
+from jinja2 import TemplateError
+
+from app.services.email_service import (
+    EmailAttachment,
+    EmailRecipient,
+    EmailRequest,
+    EmailService,
+    EmailServiceError,
+    RaiseLetterEmailRequest
+)
+
+
+@pytest.fixture
+def email_request():
+    """Minimal plain text email to a single recipient."""
+    return EmailRequest(
+        recipients=[EmailRecipient(email="manager@example.com", name="Manager")],
+        subject="Subject",
+        body_text="Body"
+    )
+
+
+def _smtp_client():
+    client = MagicMock()
+    client.is_connected = True
+    client.connect = AsyncMock()
+    client.login = AsyncMock()
+    client.sendmail = AsyncMock()
+    client.quit = AsyncMock()
+    return client
+
+
+def _sent_message(client):
+    """Parse the message bytes passed to the client's sendmail."""
+    return email.message_from_bytes(client.sendmail.await_args.args[2], policy=email.policy.default)
+
+
+class TestSMTPConnection:
+    """Test reuse of the shared SMTP connection."""
+
+    @pytest.mark.asyncio
+    async def test_connection_reused_across_sends(self, email_request):
+        """Back-to-back sends connect once."""
+        service = EmailService()
+        client = _smtp_client()
+
+        with patch('app.services.email_service.aiosmtplib.SMTP', return_value=client) as smtp:
+            await service._send_smtp_email(email_request)
+            response = await service._send_smtp_email(email_request)
+
+        assert response.success
+        assert response.message_id
+        smtp.assert_called_once()
+        assert smtp.call_args.kwargs["tls_context"] is service._ssl_context
+        client.connect.assert_awaited_once()
+        assert client.sendmail.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_disconnect(self, email_request):
+        """A dropped connection is replaced and the same bytes resent."""
+        service = EmailService()
+        service.SMTP_RETRY_BACKOFF_SECONDS = 0
+        stale, fresh = _smtp_client(), _smtp_client()
+        stale.sendmail.side_effect = aiosmtplib.SMTPServerDisconnected("gone")
+
+        with patch('app.services.email_service.aiosmtplib.SMTP', side_effect=[stale, fresh]):
+            response = await service._send_smtp_email(email_request)
+
+        assert response.success
+        stale.close.assert_called_once()
+        fresh.sendmail.assert_awaited_once()
+        assert fresh.sendmail.await_args.args[2] is stale.sendmail.await_args.args[2]
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_attempts(self, email_request):
+        """Persistent transport failures end in an unsuccessful response."""
+        service = EmailService()
+        service.SMTP_RETRY_BACKOFF_SECONDS = 0
+        clients = [_smtp_client() for _ in range(service.SMTP_SEND_ATTEMPTS)]
+        for client in clients:
+            client.connect.side_effect = aiosmtplib.SMTPConnectError("refused")
+
+        with patch('app.services.email_service.aiosmtplib.SMTP', side_effect=clients):
+            response = await service._send_smtp_email(email_request)
+
+        assert not response.success
+        assert "3 attempts" in response.error_message
+
+    @pytest.mark.asyncio
+    async def test_login_failure_closes_client(self, email_request):
+        """A connection whose login fails is closed rather than leaked."""
+        service = EmailService()
+        service.smtp_config['username'] = "user"
+        client = _smtp_client()
+        client.login.side_effect = aiosmtplib.SMTPAuthenticationError(535, "denied")
+
+        with patch('app.services.email_service.aiosmtplib.SMTP', return_value=client):
+            response = await service._send_smtp_email(email_request)
+
+        assert not response.success
+        client.close.assert_called_once()
+        assert service._smtp_pool == []
+
+    @pytest.mark.asyncio
+    async def test_pool_capped_at_concurrency(self, email_request):
+        """Connections beyond SMTP_CONCURRENCY are quit instead of pooled."""
+        service = EmailService()
+        idle = [_smtp_client(), _smtp_client()]
+        extra = _smtp_client()
+        service._smtp_pool = list(idle)
+
+        with patch('app.services.email_service.settings.SMTP_CONCURRENCY', 2), \
+                patch('app.services.email_service.aiosmtplib.SMTP', return_value=extra):
+            await service._send_smtp_email(email_request)
+            async with service._smtp_connection(fresh=True):
+                pass
+
+        assert len(service._smtp_pool) == 2
+        extra.quit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_aclose_quits_connection(self, email_request):
+        """Closing the service sends QUIT on the open connection."""
+        service = EmailService()
+        client = _smtp_client()
+
+        with patch('app.services.email_service.aiosmtplib.SMTP', return_value=client):
+            await service._send_smtp_email(email_request)
+        await service.aclose()
+
+        client.quit.assert_awaited_once()
+        assert service._smtp_pool == []
+
+
+class TestSendBulk:
+    """Test concurrent bulk delivery."""
+
+    @pytest.mark.asyncio
+    async def test_failures_become_responses(self, email_request):
+        """A raising send yields an unsuccessful response in its slot."""
+        service = EmailService()
+        ok = MagicMock(success=True)
+        service._send_email = AsyncMock(side_effect=[ok, RuntimeError("boom")])
+
+        responses = await service.send_bulk([email_request, email_request])
+
+        assert responses[0] is ok
+        assert not responses[1].success
+        assert responses[1].error_message == "boom"
+
+
+class TestTemplates:
+    """Test compiled email templates."""
+
+    def test_templates_compiled_once(self):
+        """Rendering uses the templates compiled at init, not a fresh lookup."""
+        service = EmailService()
+        service.template_env.get_template = MagicMock()
+        request = RaiseLetterEmailRequest(
+            user_email="user@example.com",
+            user_name="Jane Doe",
+            manager_email="manager@example.com",
+            letter_content="Letter",
+            subject_line="Subject"
+        )
+        letter_response = MagicMock(letter_content="Letter body")
+
+        html_body, text_body = service._generate_email_bodies(
+            request, letter_response, "January 02, 2025"
+        )
+
+        assert "Letter body" in html_body
+        assert "Letter body" in text_body
+        assert "January 02, 2025" in service._generate_fallback_text(
+            request, letter_response, "January 02, 2025"
+        )
+        service.template_env.get_template.assert_not_called()
+
+    def test_missing_template_uses_fallback(self):
+        """A template that failed to load falls back without affecting the other body."""
+        service = EmailService()
+        service._text_template = None
+        request = RaiseLetterEmailRequest(
+            user_email="user@example.com",
+            user_name="Jane Doe",
+            manager_email="manager@example.com",
+            manager_name="Sam",
+            letter_content="Letter",
+            subject_line="Subject"
+        )
+
+        html_body, text_body = service._generate_email_bodies(
+            request, MagicMock(letter_content="Letter body"), "January 02, 2025"
+        )
+
+        assert html_body.lstrip().startswith("<!DOCTYPE html>")
+        assert text_body.startswith("Dear Sam,")
+
+    def test_fallback_html_escapes_content(self):
+        """User-provided text is escaped in the fallback HTML like in the template."""
+        service = EmailService()
+        request = RaiseLetterEmailRequest(
+            user_email="user@example.com",
+            user_name="Jane Doe",
+            manager_email="manager@example.com",
+            letter_content="Letter",
+            subject_line="Subject",
+            custom_message="<script>",
+            include_pdf=False
+        )
+
+        html_body = service._generate_fallback_html(
+            request, MagicMock(letter_content="Pay & benefits"), "January 02, 2025"
+        )
+
+        assert "&lt;script&gt;" in html_body
+        assert "Pay &amp; benefits" in html_body
+        assert "PDF attachment" not in html_body
+        assert "Sent on January 02, 2025" in html_body
+
+
+class TestRaiseLetterPDF:
+    """Test PDF attachment generation for raise letters."""
+
+    @pytest.mark.asyncio
+    async def test_pdf_rendered_on_executor(self, tmp_path):
+        """With an executor attached the PDF is rendered to a temp file there and removed after sending."""
+        pdf_file = tmp_path / "letter.pdf"
+        pdf_file.write_bytes(b"%PDF")
+        service = EmailService()
+        service.pdf_service.generate_letter_pdf = AsyncMock()
+        service._send_email = AsyncMock(return_value=MagicMock(message_id="id", provider_used="smtp"))
+        request = RaiseLetterEmailRequest(
+            user_email="user@example.com",
+            user_name="Jane Doe",
+            manager_email="manager@example.com",
+            letter_content="Letter",
+            subject_line="Subject"
+        )
+
+        with ThreadPoolExecutor(max_workers=1) as executor, \
+                patch('app.services.email_service.render_letter_pdf_file', return_value=str(pdf_file)) as render:
+            service.pdf_executor = executor
+            await service.send_raise_letter_email(request, MagicMock(letter_content="Letter body"))
+
+        render.assert_called_once_with("Letter body", "Subject", "Jane Doe")
+        service.pdf_service.generate_letter_pdf.assert_not_called()
+        email_request = service._send_email.await_args.args[0]
+        assert email_request.attachments[0].path == pdf_file
+        assert email_request.attachments[0].filename == "raise_request_Jane_Doe.pdf"
+        assert not pdf_file.exists()
+
+    @pytest.mark.asyncio
+    async def test_pdf_removed_when_send_fails_early(self, tmp_path):
+        """A PDF rendered for a request that fails before attaching it is still removed."""
+        pdf_file = tmp_path / "letter.pdf"
+        pdf_file.write_bytes(b"%PDF")
+        service = EmailService()
+        service._generate_email_bodies = MagicMock(side_effect=TemplateError("broken"))
+        service._send_email = AsyncMock()
+        request = RaiseLetterEmailRequest(
+            user_email="user@example.com",
+            user_name="Jane Doe",
+            manager_email="manager@example.com",
+            letter_content="Letter",
+            subject_line="Subject"
+        )
+
+        with ThreadPoolExecutor(max_workers=1) as executor, \
+                patch('app.services.email_service.render_letter_pdf_file', return_value=str(pdf_file)):
+            service.pdf_executor = executor
+            with pytest.raises(EmailServiceError):
+                await service.send_raise_letter_email(request, MagicMock(letter_content="Letter body"))
+
+        service._send_email.assert_not_called()
+        assert not pdf_file.exists()
+
+    @pytest.mark.asyncio
+    async def test_pdf_filename_sanitized(self):
+        """Path separators and reserved characters in the name become underscores."""
+        service = EmailService()
+        service.pdf_service.generate_letter_pdf = AsyncMock(return_value=b"%PDF")
+        service._send_email = AsyncMock(return_value=MagicMock(message_id="id", provider_used="smtp"))
+        request = RaiseLetterEmailRequest(
+            user_email="user@example.com",
+            user_name="J. Doe/HR: <Ops>",
+            manager_email="manager@example.com",
+            letter_content="Letter",
+            subject_line="Subject"
+        )
+
+        await service.send_raise_letter_email(request, MagicMock(letter_content="Letter body"))
+
+        email_request = service._send_email.await_args.args[0]
+        assert email_request.attachments[0].filename == "raise_request_J._Doe_HR___Ops_.pdf"
+
+
+class TestMessageAssembly:
+    """Test MIME structure of outgoing messages."""
+
+    @pytest.mark.asyncio
+    async def test_attachment_outside_alternative(self, email_request):
+        """Bodies are alternatives of each other; the PDF sits beside them."""
+        service = EmailService()
+        client = _smtp_client()
+        email_request.body_html = "<p>Body</p>"
+        email_request.attachments = [EmailAttachment(filename="letter.pdf", content=b"%PDF")]
+
+        with patch('app.services.email_service.aiosmtplib.SMTP', return_value=client):
+            await service._send_smtp_email(email_request)
+
+        msg = _sent_message(client)
+        assert msg.get_content_type() == "multipart/mixed"
+        assert [part.get_content_type() for part in msg.iter_parts()] == [
+            "multipart/alternative", "application/pdf"
+        ]
+        assert msg.get_body(("html",)).get_content().rstrip() == "<p>Body</p>"
+        attachment = next(msg.iter_attachments())
+        assert attachment.get_filename() == "letter.pdf"
+        assert attachment.get_content() == b"%PDF"
+
+    @pytest.mark.asyncio
+    async def test_attachment_encoded_once(self, email_request):
+        """A precomputed encoding is reused at send time instead of re-encoding."""
+        service = EmailService()
+        client = _smtp_client()
+        email_request.attachments = [EmailAttachment.from_bytes(b"%PDF-1.4 letter", filename="a.pdf")]
+
+        with patch('app.services.email_service.aiosmtplib.SMTP', return_value=client), \
+                patch('app.services.email_service._encode_base64') as encode:
+            await service._send_smtp_email(email_request)
+            await service._send_smtp_email(email_request)
+
+        encode.assert_not_called()
+        assert next(_sent_message(client).iter_attachments()).get_content() == b"%PDF-1.4 letter"
+
+    @pytest.mark.asyncio
+    async def test_attachment_streamed_from_path(self, email_request, tmp_path):
+        """File-backed attachments are read and encoded at send time."""
+        pdf_file = tmp_path / "letter.pdf"
+        pdf_file.write_bytes(b"%PDF" * 50000)
+        service = EmailService()
+        client = _smtp_client()
+        email_request.attachments = [EmailAttachment(filename="letter.pdf", path=pdf_file)]
+
+        with patch('app.services.email_service.aiosmtplib.SMTP', return_value=client):
+            await service._send_smtp_email(email_request)
+
+        msg = _sent_message(client)
+        assert next(msg.iter_attachments()).get_content() == b"%PDF" * 50000
+
+
+class TestConfiguration:
+    """Test configuration validation."""
+
+    def test_validated_once_at_init(self):
+        """Later validation calls reuse the result computed at init."""
+        service = EmailService()
+        service._check_configuration = MagicMock()
+
+        assert service.validate_email_configuration() is service.is_configured
+        service._check_configuration.assert_not_called()